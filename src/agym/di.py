@@ -1,17 +1,14 @@
 from typing import Mapping, Protocol, Type
 
-from agym.dtos import (
-    BreakoutCollisionEngine,
-    BreakoutLevelType,
-    Color,
-    EnvironmentType,
-    IOFrameworkType,
-)
+from agym.dtos import Color, EnvironmentType, IOFrameworkType
 from agym.env_components.breakout import (
     BreakoutAudioHandler,
     BreakoutRenderer,
     KDTreeRenderer,
     ManualBreakoutModel,
+    create_collision_detector,
+    create_level_builder,
+    get_env_class,
 )
 from agym.env_components.many_breakouts import (
     ManyBreakoutsEnv,
@@ -40,17 +37,6 @@ from agym.updaters import (
     LimitedUpdater,
     ProfileUpdater,
 )
-from envs.breakout import (
-    CollisionDetector,
-    DefaultLevelBuilder,
-    KDTreeCollisionDetectionEngine,
-    NaiveCollisionDetectionEngine,
-    PerformanceLevelBuilder,
-)
-from envs.breakout.protocols import (
-    IBreakoutLevelBuilder,
-    ICollisionDetectorEngine,
-)
 from envs.protocols import IGameEnvironment
 from timeprofiler import TimeProfiler
 
@@ -151,47 +137,17 @@ class IEnvContainer(Protocol):
 
 class BreakoutContainer(IEnvContainer):
     def __init__(self, io_framework: IOFramework, config: Settings):
-        level_type2level_builder: Mapping[
-            BreakoutLevelType, IBreakoutLevelBuilder
-        ] = {
-            BreakoutLevelType.PERFORMANCE: PerformanceLevelBuilder(
-                env_size=config.breakout.env_size,
-                num_balls=config.breakout.num_balls,
-                ball_speed=config.breakout.ball_speed,
-                ball_radius=config.breakout.ball_radius,
-            ),
-            BreakoutLevelType.DEFAULT: DefaultLevelBuilder(
-                env_size=config.breakout.env_size,
-                ball_speed=config.breakout.ball_speed,
-                ball_radius=config.breakout.ball_radius,
-                platform_speed=config.breakout.platform_speed,
-                platform_size=config.breakout.platform_size,
-                block_wall_num_rows=config.breakout.block_wall_num_rows,
-                block_size=config.breakout.block_size,
-                block_wall_top_shift=config.breakout.block_wall_top_shift,
-                block_wall_between_shift=config.breakout.block_wall_between_shift,
-            ),
-        }
-        level_builder = level_type2level_builder[config.breakout.level_type]
-
-        engine_type2engine: Mapping[
-            BreakoutCollisionEngine, ICollisionDetectorEngine
-        ] = {
-            BreakoutCollisionEngine.NAIVE: NaiveCollisionDetectionEngine(),
-            BreakoutCollisionEngine.KDTREE: KDTreeCollisionDetectionEngine(),
-        }
-        collision_detector_engine = engine_type2engine[
-            config.breakout.collision_engine
-        ]
-        collision_detector = CollisionDetector(
-            engine=collision_detector_engine,
-        )
+        level_builder = create_level_builder(config.breakout)
+        collision_detector = create_collision_detector(config.breakout)
+        env_class = get_env_class(config.breakout)
 
         self.env = ManyBreakoutsEnv(
             n=config.breakout.num_envs,
             env_size=config.breakout.env_size,
             collision_detector=collision_detector,
             level_builder=level_builder,
+            env_class=env_class,
+            array_state=config.breakout.array_state,
         )
 
         self.model = ManualBreakoutModel()
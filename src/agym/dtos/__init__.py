@@ -1,4 +1,9 @@
-from .breakout import BreakoutCollisionEngine, BreakoutLevelType
+from .breakout import (
+    BreakoutCollisionEngine,
+    BreakoutKDTreeSplitStrategy,
+    BreakoutLevelType,
+    BreakoutSimulationType,
+)
 from .color import Color
 from .env import EnvironmentType
 from .event import (
@@ -9,3 +9,18 @@ class BreakoutLevelType(Enum):
 class BreakoutCollisionEngine(Enum):
     NAIVE = auto()
     KDTREE = auto()
+    INCREMENTAL_KDTREE = auto()
+    SPATIAL_HASH = auto()
+    SWEEP_AND_PRUNE = auto()
+    BVH = auto()
+
+
+class BreakoutKDTreeSplitStrategy(Enum):
+    LOAD_GINI = auto()
+    MEDIAN = auto()
+    SAH = auto()
+
+
+class BreakoutSimulationType(Enum):
+    STEPPING = auto()
+    EVENT_DRIVEN = auto()
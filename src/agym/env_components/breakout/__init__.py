@@ -1,4 +1,12 @@
 from .audio_handler import BreakoutAudioHandler
 from .env_renderer import BreakoutRenderer
+from .factory import (
+    create_breakout_env,
+    create_collision_detector,
+    create_level_builder,
+    get_env_class,
+)
 from .kdtree_renderer import KDTreeRenderer
 from .model_manual import ManualBreakoutModel
+from .model_random import RandomBreakoutModel
+from .model_scripted import ScriptedBreakoutModel
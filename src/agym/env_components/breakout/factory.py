@@ -0,0 +1,157 @@
+from functools import partial
+from typing import Callable, Mapping, Optional, Type
+
+from agym.dtos import (
+    BreakoutCollisionEngine,
+    BreakoutKDTreeSplitStrategy,
+    BreakoutLevelType,
+    BreakoutSimulationType,
+)
+from agym.settings import BreakoutSettings
+from envs.breakout import (
+    BreakoutEnv,
+    BVHCollisionDetectionEngine,
+    CollisionDetector,
+    DefaultLevelBuilder,
+    EventDrivenBreakoutEnv,
+    IncrementalKDTreeCollisionDetectionEngine,
+    KDTreeCollisionDetectionEngine,
+    KDTreeParams,
+    NaiveCollisionDetectionEngine,
+    PerformanceLevelBuilder,
+    SpatialHashCollisionDetectionEngine,
+    SweepAndPruneCollisionDetectionEngine,
+)
+from envs.breakout.protocols import (
+    IBreakoutLevelBuilder,
+    ICollisionDetectorEngine,
+)
+from geometry import (
+    ISplitStrategy,
+    LoadGiniSplitStrategy,
+    MedianSplitStrategy,
+    SAHSplitStrategy,
+)
+
+
+def create_level_builder(config: BreakoutSettings) -> IBreakoutLevelBuilder:
+    level_type2level_builder: Mapping[
+        BreakoutLevelType, IBreakoutLevelBuilder
+    ] = {
+        BreakoutLevelType.PERFORMANCE: PerformanceLevelBuilder(
+            env_size=config.env_size,
+            num_balls=config.num_balls,
+            ball_speed=config.ball_speed,
+            ball_radius=config.ball_radius,
+        ),
+        BreakoutLevelType.DEFAULT: DefaultLevelBuilder(
+            env_size=config.env_size,
+            ball_speed=config.ball_speed,
+            ball_radius=config.ball_radius,
+            platform_speed=config.platform_speed,
+            platform_size=config.platform_size,
+            block_wall_num_rows=config.block_wall_num_rows,
+            block_size=config.block_size,
+            block_wall_top_shift=config.block_wall_top_shift,
+            block_wall_between_shift=config.block_wall_between_shift,
+        ),
+    }
+
+    return level_type2level_builder[config.level_type]
+
+
+def create_kdtree_params(config: BreakoutSettings) -> KDTreeParams:
+    strategy_type2split_strategy: Mapping[
+        BreakoutKDTreeSplitStrategy, ISplitStrategy
+    ] = {
+        BreakoutKDTreeSplitStrategy.LOAD_GINI: LoadGiniSplitStrategy(
+            alpha=config.kdtree_alpha,
+        ),
+        BreakoutKDTreeSplitStrategy.MEDIAN: MedianSplitStrategy(),
+        BreakoutKDTreeSplitStrategy.SAH: SAHSplitStrategy(
+            traversal_cost=config.kdtree_traversal_cost,
+            intersection_cost=config.kdtree_intersection_cost,
+        ),
+    }
+    strategy_type2max_depth: Mapping[BreakoutKDTreeSplitStrategy, int] = {
+        BreakoutKDTreeSplitStrategy.LOAD_GINI: 4,
+        BreakoutKDTreeSplitStrategy.MEDIAN: 4,
+        BreakoutKDTreeSplitStrategy.SAH: -1,
+    }
+
+    max_depth = config.kdtree_max_depth
+    if max_depth is None:
+        max_depth = strategy_type2max_depth[config.kdtree_split_strategy]
+
+    return KDTreeParams(
+        split_strategy=strategy_type2split_strategy[
+            config.kdtree_split_strategy
+        ],
+        max_depth=max_depth,
+        num_records_stop=config.kdtree_num_records_stop,
+        num_workers=config.kdtree_num_workers,
+        parallel_split_depth=config.kdtree_parallel_split_depth,
+        parallel_min_records=config.kdtree_parallel_min_records,
+    )
+
+
+def create_collision_detector(config: BreakoutSettings) -> CollisionDetector:
+    kdtree_params = create_kdtree_params(config)
+
+    engine_type2engine_factory: Mapping[
+        BreakoutCollisionEngine, Callable[[], ICollisionDetectorEngine]
+    ] = {
+        BreakoutCollisionEngine.NAIVE: NaiveCollisionDetectionEngine,
+        BreakoutCollisionEngine.KDTREE: partial(
+            KDTreeCollisionDetectionEngine,
+            params=kdtree_params,
+        ),
+        BreakoutCollisionEngine.INCREMENTAL_KDTREE: partial(
+            IncrementalKDTreeCollisionDetectionEngine,
+            params=kdtree_params,
+        ),
+        BreakoutCollisionEngine.SPATIAL_HASH: partial(
+            SpatialHashCollisionDetectionEngine,
+            cell_size=config.spatial_hash_cell_size,
+        ),
+        BreakoutCollisionEngine.SWEEP_AND_PRUNE: (
+            SweepAndPruneCollisionDetectionEngine
+        ),
+        BreakoutCollisionEngine.BVH: partial(
+            BVHCollisionDetectionEngine,
+            margin=config.bvh_margin,
+        ),
+    }
+    engine_factory = engine_type2engine_factory[config.collision_engine]
+
+    return CollisionDetector(engine=engine_factory())
+
+
+def get_env_class(config: BreakoutSettings) -> Type[BreakoutEnv]:
+    simulation_type2env_class: Mapping[
+        BreakoutSimulationType, Type[BreakoutEnv]
+    ] = {
+        BreakoutSimulationType.STEPPING: BreakoutEnv,
+        BreakoutSimulationType.EVENT_DRIVEN: EventDrivenBreakoutEnv,
+    }
+
+    return simulation_type2env_class[config.simulation_type]
+
+
+def create_breakout_env(
+    config: BreakoutSettings,
+    checking_gameover: bool = False,
+    collision_detector: Optional[CollisionDetector] = None,
+) -> BreakoutEnv:
+    env_class = get_env_class(config)
+
+    if collision_detector is None:
+        collision_detector = create_collision_detector(config)
+
+    return env_class(
+        env_size=config.env_size,
+        collision_detector=collision_detector,
+        level_builder=create_level_builder(config),
+        checking_gameover=checking_gameover,
+        array_state=config.array_state,
+    )
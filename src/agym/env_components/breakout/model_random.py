@@ -0,0 +1,21 @@
+import random
+from typing import Optional
+
+from agym.dtos import Event
+from agym.protocols import IEnvironmentModel
+from envs.breakout import BreakoutAction, BreakoutActionType
+from envs.protocols import IGameState
+
+
+class RandomBreakoutModel(IEnvironmentModel):
+    def __init__(self, seed: Optional[int] = None):
+        self._random = random.Random(seed)
+        self._action_types = list(BreakoutActionType)
+
+    def try_handle_event(self, event: Event) -> bool:
+        return False
+
+    def get_action(self, state: IGameState) -> BreakoutAction:
+        action_type = self._random.choice(self._action_types)
+
+        return BreakoutAction(type=action_type)
@@ -0,0 +1,24 @@
+from typing import Sequence
+
+from agym.dtos import Event
+from agym.protocols import IEnvironmentModel
+from envs.breakout import BreakoutAction, BreakoutActionType
+from envs.protocols import IGameState
+
+
+class ScriptedBreakoutModel(IEnvironmentModel):
+    def __init__(self, action_types: Sequence[BreakoutActionType]):
+        if not action_types:
+            raise ValueError("Script should contain at least one action")
+
+        self._action_types = list(action_types)
+        self._position = 0
+
+    def try_handle_event(self, event: Event) -> bool:
+        return False
+
+    def get_action(self, state: IGameState) -> BreakoutAction:
+        action_type = self._action_types[self._position]
+        self._position = (self._position + 1) % len(self._action_types)
+
+        return BreakoutAction(type=action_type)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Type
 
 from envs.breakout import BreakoutEnv, BreakoutEvent, BreakoutState
 from envs.breakout.protocols import IBreakoutLevelBuilder, ICollisionDetector
@@ -13,6 +13,8 @@ class ManyBreakoutsEnv(IGameEnvironment):
         env_size: Vec2,
         collision_detector: ICollisionDetector,
         level_builder: IBreakoutLevelBuilder,
+        env_class: Type[BreakoutEnv] = BreakoutEnv,
+        array_state: bool = False,
     ) -> None:
         self._env_rect = Rectangle(
             left=0,
@@ -22,11 +24,12 @@ class ManyBreakoutsEnv(IGameEnvironment):
         )
 
         self.envs = [
-            BreakoutEnv(
+            env_class(
                 env_size=env_size,
                 collision_detector=collision_detector,
                 level_builder=level_builder,
                 checking_gameover=False,
+                array_state=array_state,
             )
             for _ in range(n)
         ]
@@ -0,0 +1,163 @@
+import argparse
+import time
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Sequence
+
+from agym.dtos import (
+    BreakoutCollisionEngine,
+    BreakoutLevelType,
+    BreakoutSimulationType,
+)
+from agym.env_components.breakout import (
+    RandomBreakoutModel,
+    ScriptedBreakoutModel,
+    create_breakout_env,
+    create_collision_detector,
+)
+from agym.protocols import IEnvironmentModel
+from agym.settings import Settings
+from envs.breakout import BreakoutActionType, BreakoutEnv
+
+
+@dataclass
+class HeadlessReport:
+    num_steps: int
+    num_events: int
+    num_resets: int
+    elapsed: float
+
+    @property
+    def steps_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return float("inf")
+
+        return self.num_steps / self.elapsed
+
+
+def run_headless(
+    env: BreakoutEnv,
+    model: IEnvironmentModel,
+    num_steps: int,
+    dt: float,
+) -> HeadlessReport:
+    env.reset()
+
+    num_events = 0
+    num_resets = 0
+    start = time.perf_counter()
+    for _ in range(num_steps):
+        action = model.get_action(env.state)
+        env.step(action, dt)
+        num_events += len(env.pop_events())
+
+        if not env.state.balls:
+            env.reset()
+            num_resets += 1
+
+    elapsed = time.perf_counter() - start
+
+    return HeadlessReport(
+        num_steps=num_steps,
+        num_events=num_events,
+        num_resets=num_resets,
+        elapsed=elapsed,
+    )
+
+
+def create_model(model_type: str, seed: Optional[int]) -> IEnvironmentModel:
+    model_type2model: Mapping[str, IEnvironmentModel] = {
+        "random": RandomBreakoutModel(seed=seed),
+        "scripted": ScriptedBreakoutModel(
+            action_types=[
+                BreakoutActionType.THROW,
+                BreakoutActionType.LEFT,
+                BreakoutActionType.LEFT,
+                BreakoutActionType.RIGHT,
+                BreakoutActionType.RIGHT,
+            ],
+        ),
+    }
+
+    return model_type2model[model_type]
+
+
+def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Step a breakout environment without rendering",
+    )
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--dt", type=float, default=1.0)
+    parser.add_argument(
+        "--model",
+        choices=["random", "scripted"],
+        default="random",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--level-type",
+        choices=[level_type.name for level_type in BreakoutLevelType],
+        default=None,
+    )
+    parser.add_argument(
+        "--collision-engine",
+        choices=[engine.name for engine in BreakoutCollisionEngine],
+        default=None,
+    )
+    parser.add_argument(
+        "--simulation-type",
+        choices=[
+            simulation_type.name for simulation_type in BreakoutSimulationType
+        ],
+        default=None,
+    )
+
+    return parser.parse_args(args)
+
+
+def format_report(report: HeadlessReport) -> List[str]:
+    return [
+        f"steps: {report.num_steps}",
+        f"events: {report.num_events}",
+        f"resets: {report.num_resets}",
+        f"elapsed: {report.elapsed:.3f}s",
+        f"steps per second: {report.steps_per_second:.1f}",
+    ]
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    parsed_args = parse_args(args)
+    config = Settings()
+
+    if parsed_args.level_type is not None:
+        config.breakout.level_type = BreakoutLevelType[parsed_args.level_type]
+
+    if parsed_args.collision_engine is not None:
+        config.breakout.collision_engine = BreakoutCollisionEngine[
+            parsed_args.collision_engine
+        ]
+
+    if parsed_args.simulation_type is not None:
+        config.breakout.simulation_type = BreakoutSimulationType[
+            parsed_args.simulation_type
+        ]
+
+    model = create_model(parsed_args.model, seed=parsed_args.seed)
+
+    with create_collision_detector(config.breakout) as collision_detector:
+        env = create_breakout_env(
+            config.breakout,
+            collision_detector=collision_detector,
+        )
+        report = run_headless(
+            env=env,
+            model=model,
+            num_steps=parsed_args.steps,
+            dt=parsed_args.dt,
+        )
+
+    for line in format_report(report):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
-from typing import Tuple
+from typing import Any, Callable, Iterator, Mapping, Optional, Tuple
 
 from pydantic import BaseSettings
 
 from agym.dtos import (
     BreakoutCollisionEngine,
+    BreakoutKDTreeSplitStrategy,
     BreakoutLevelType,
+    BreakoutSimulationType,
     EnvironmentType,
     IOFrameworkType,
     Size,
@@ -14,8 +16,26 @@ from geometry import Vec2
 Color = Tuple[int, int, int]
 
 
+class SettingsVec2(Vec2):
+    __slots__ = ()
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], Vec2]]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> Vec2:
+        if isinstance(value, Vec2):
+            return Vec2(x=float(value.x), y=float(value.y))
+
+        if isinstance(value, Mapping):
+            return Vec2(x=float(value["x"]), y=float(value["y"]))
+
+        return Vec2.from_list([float(v) for v in value])
+
+
 class BreakoutSettings(BaseSettings):
-    env_size: Vec2 = Vec2(x=400, y=400)
+    env_size: SettingsVec2 = SettingsVec2(x=400, y=400)
     num_envs: int = 3
 
     image_dir: str = "../static/envs/breakout/images"
@@ -26,20 +46,43 @@ class BreakoutSettings(BaseSettings):
     # collision_engine: BreakoutCollisionEngine = BreakoutCollisionEngine.NAIVE
     collision_engine: BreakoutCollisionEngine = BreakoutCollisionEngine.KDTREE
 
+    # kdtree_split_strategy: BreakoutKDTreeSplitStrategy = BreakoutKDTreeSplitStrategy.SAH
+    kdtree_split_strategy: BreakoutKDTreeSplitStrategy = (
+        BreakoutKDTreeSplitStrategy.LOAD_GINI
+    )
+    kdtree_alpha: float = 0.5
+    kdtree_max_depth: Optional[int] = None
+    kdtree_num_records_stop: int = 8
+    kdtree_traversal_cost: float = 8.0
+    kdtree_intersection_cost: float = 1.0
+    kdtree_num_workers: int = 0
+    kdtree_parallel_split_depth: int = 2
+    kdtree_parallel_min_records: int = 256
+
+    spatial_hash_cell_size: Optional[float] = None
+    bvh_margin: float = 8.0
+
+    # simulation_type: BreakoutSimulationType = BreakoutSimulationType.EVENT_DRIVEN
+    simulation_type: BreakoutSimulationType = BreakoutSimulationType.STEPPING
+    array_state: bool = False
+
     game_speed: float = 1
 
     block_wall_num_rows: int = 3
-    block_size: Vec2 = Vec2(x=90, y=30)
+    block_size: SettingsVec2 = SettingsVec2(x=90, y=30)
     block_wall_top_shift: float = 60
     block_wall_between_shift: float = 30
 
     platform_speed: float = 10
-    platform_size: Vec2 = Vec2(x=200, y=25)
+    platform_size: SettingsVec2 = SettingsVec2(x=200, y=25)
 
     num_balls: int = 5
     ball_speed: float = 15.0
     ball_radius: float = 15.0
 
+    class Config:
+        validate_all = True
+
 
 class Settings(BaseSettings):
     window_screen_size: Size = Size(width=700, height=800)
@@ -0,0 +1,90 @@
+import argparse
+from typing import Optional, Sequence
+
+from .report import (
+    compare_reports,
+    create_report,
+    format_comparisons,
+    format_results,
+    load_report,
+    save_report,
+)
+from .scenarios import create_ball_scenarios, create_block_scenarios
+from .suite import SuiteConfig, engine_name2engine_factory, run_suite
+
+
+def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Collision engines and KD-tree benchmarks",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run")
+    run_parser.add_argument("--output", default=None)
+    run_parser.add_argument(
+        "--balls", type=int, nargs="*", default=[5, 10, 20, 50, 100]
+    )
+    run_parser.add_argument(
+        "--block-rows", type=int, nargs="*", default=[2, 4, 8]
+    )
+    run_parser.add_argument(
+        "--engines",
+        nargs="*",
+        choices=list(engine_name2engine_factory),
+        default=list(engine_name2engine_factory),
+    )
+    run_parser.add_argument("--dt", type=float, default=1.0)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--steps", type=int, default=20)
+    run_parser.add_argument("--seed", type=int, default=0)
+
+    compare_parser = subparsers.add_parser("compare")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    return parser.parse_args(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    scenarios = create_ball_scenarios(args.balls) + create_block_scenarios(
+        args.block_rows
+    )
+    config = SuiteConfig(
+        engines=args.engines,
+        dt=args.dt,
+        repeat=args.repeat,
+        num_steps=args.steps,
+        seed=args.seed,
+    )
+
+    results = run_suite(scenarios, config)
+
+    for line in format_results(results):
+        print(line)
+
+    if args.output is not None:
+        save_report(create_report(results), args.output)
+
+
+def compare(args: argparse.Namespace) -> None:
+    comparisons = compare_reports(
+        base=load_report(args.base),
+        head=load_report(args.head),
+    )
+
+    for line in format_comparisons(comparisons, threshold=args.threshold):
+        print(line)
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    parsed_args = parse_args(args)
+
+    if parsed_args.command == "run":
+        run(parsed_args)
+    elif parsed_args.command == "compare":
+        compare(parsed_args)
+
+
+if __name__ == "__main__":
+    main()
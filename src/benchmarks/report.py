@@ -0,0 +1,108 @@
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from .suite import BenchmarkResult
+
+
+@dataclass
+class Comparison:
+    key: str
+    base: float
+    head: float
+
+    @property
+    def ratio(self) -> float:
+        if self.base <= 0:
+            return float("inf")
+
+        return self.head / self.base
+
+
+def create_report(results: Sequence[BenchmarkResult]) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _get_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": {result.key: result.to_dict() for result in results},
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(
+    base: Dict[str, Any], head: Dict[str, Any]
+) -> List[Comparison]:
+    comparisons = []
+    for key, head_result in head["results"].items():
+        base_result = base["results"].get(key)
+        if base_result is None:
+            continue
+
+        comparisons.append(
+            Comparison(
+                key=key,
+                base=base_result["timing"]["best"],
+                head=head_result["timing"]["best"],
+            )
+        )
+
+    return comparisons
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> List[str]:
+    return [
+        f"{result.key:<70} {result.timing.best * 1000:>10.3f} ms"
+        for result in results
+    ]
+
+
+def format_comparisons(
+    comparisons: Sequence[Comparison], threshold: float
+) -> List[str]:
+    lines = []
+    for comparison in comparisons:
+        if comparison.ratio > 1 + threshold:
+            mark = "slower"
+        elif comparison.ratio < 1 - threshold:
+            mark = "faster"
+        else:
+            mark = ""
+
+        lines.append(
+            f"{comparison.key:<70} "
+            f"{comparison.base * 1000:>10.3f} ms "
+            f"{comparison.head * 1000:>10.3f} ms "
+            f"{comparison.ratio:>6.2f}x {mark}"
+        )
+
+    return lines
+
+
+def _get_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.strip()
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+from envs.breakout import (
+    BreakoutAction,
+    BreakoutActionType,
+    DefaultLevelBuilder,
+    PerformanceLevelBuilder,
+)
+from envs.breakout.protocols import IBreakoutLevelBuilder
+from geometry import Vec2
+
+
+@dataclass
+class Scenario:
+    name: str
+    env_size: Vec2
+    level_builder: IBreakoutLevelBuilder
+    first_action: BreakoutAction
+    params: Dict[str, int] = field(default_factory=dict)
+
+
+def create_ball_scenarios(ball_counts: Sequence[int]) -> List[Scenario]:
+    env_size = Vec2(x=600, y=600)
+
+    return [
+        Scenario(
+            name=f"balls_{num_balls}",
+            env_size=env_size,
+            level_builder=PerformanceLevelBuilder(
+                env_size=env_size,
+                num_balls=num_balls,
+                ball_radius=10.0,
+                ball_speed=15.0,
+            ),
+            first_action=BreakoutAction(type=BreakoutActionType.NOTHING),
+            params={"num_balls": num_balls},
+        )
+        for num_balls in ball_counts
+    ]
+
+
+def create_block_scenarios(block_rows: Sequence[int]) -> List[Scenario]:
+    env_size = Vec2(x=800, y=800)
+
+    return [
+        Scenario(
+            name=f"block_rows_{num_rows}",
+            env_size=env_size,
+            level_builder=DefaultLevelBuilder(
+                env_size=env_size,
+                ball_speed=15.0,
+                ball_radius=10.0,
+                platform_speed=10.0,
+                platform_size=Vec2(x=200, y=25),
+                block_wall_num_rows=num_rows,
+                block_size=Vec2(x=40, y=15),
+                block_wall_top_shift=60,
+                block_wall_between_shift=10,
+            ),
+            first_action=BreakoutAction(type=BreakoutActionType.THROW),
+            params={"block_rows": num_rows},
+        )
+        for num_rows in block_rows
+    ]
@@ -0,0 +1,196 @@
+import random
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from envs.breakout import (
+    BreakoutAction,
+    BreakoutActionType,
+    BreakoutEnv,
+    BreakoutState,
+    BVHCollisionDetectionEngine,
+    CollisionDetector,
+    IncrementalKDTreeCollisionDetectionEngine,
+    KDTreeCollisionDetectionEngine,
+    KDTreeParams,
+    NaiveCollisionDetectionEngine,
+    SpatialHashCollisionDetectionEngine,
+    SweepAndPruneCollisionDetectionEngine,
+)
+from envs.breakout.collisions.kdtree import KDTreeBuilder
+from envs.breakout.collisions.records import ItemClass
+from envs.breakout.protocols import ICollisionDetectorEngine
+from geometry import MedianSplitStrategy, SAHSplitStrategy
+
+from .scenarios import Scenario
+from .timing import Timing, measure
+
+engine_name2engine_factory: Mapping[
+    str, Callable[[], ICollisionDetectorEngine]
+] = {
+    "naive": NaiveCollisionDetectionEngine,
+    "kdtree": KDTreeCollisionDetectionEngine,
+    "incremental_kdtree": IncrementalKDTreeCollisionDetectionEngine,
+    "spatial_hash": SpatialHashCollisionDetectionEngine,
+    "sweep_and_prune": SweepAndPruneCollisionDetectionEngine,
+    "bvh": BVHCollisionDetectionEngine,
+    "kdtree_median": partial(
+        KDTreeCollisionDetectionEngine,
+        params=KDTreeParams(split_strategy=MedianSplitStrategy()),
+    ),
+    "kdtree_sah": partial(
+        KDTreeCollisionDetectionEngine,
+        params=KDTreeParams(
+            split_strategy=SAHSplitStrategy(traversal_cost=8.0),
+            max_depth=-1,
+        ),
+    ),
+}
+
+COLLIDABLE_PAIRS = {
+    (ItemClass.BALL.value, ItemClass.BALL.value),
+    (ItemClass.BALL.value, ItemClass.BLOCK.value),
+    (ItemClass.BALL.value, ItemClass.PLATFORM.value),
+    (ItemClass.BALL.value, ItemClass.WALL.value),
+    (ItemClass.PLATFORM.value, ItemClass.WALL.value),
+}
+
+
+@dataclass
+class BenchmarkResult:
+    benchmark: str
+    scenario: str
+    engine: Optional[str]
+    params: Dict[str, int]
+    timing: Timing
+
+    @property
+    def key(self) -> str:
+        return f"{self.benchmark}/{self.scenario}/{self.engine or '-'}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class SuiteConfig:
+    engines: List[str]
+    dt: float = 1.0
+    repeat: int = 5
+    num_steps: int = 20
+    seed: int = 0
+
+
+def run_suite(
+    scenarios: Iterable[Scenario], config: SuiteConfig
+) -> List[BenchmarkResult]:
+    results = []
+    for scenario in scenarios:
+        results += run_kdtree_benchmarks(scenario, config)
+
+        for engine_name in config.engines:
+            results += run_engine_benchmarks(scenario, engine_name, config)
+
+    return results
+
+
+def run_kdtree_benchmarks(
+    scenario: Scenario, config: SuiteConfig
+) -> List[BenchmarkResult]:
+    state = _prepare_state(scenario, config)
+    items = list(state.get_items())
+
+    builder = KDTreeBuilder(items)
+    build_timing = measure(
+        lambda: builder.build(config.dt),
+        repeat=config.repeat,
+    )
+
+    tree = builder.build(config.dt)
+    query_timing = measure(
+        lambda: list(tree.generate_colliding_items(COLLIDABLE_PAIRS)),
+        repeat=config.repeat,
+    )
+
+    return [
+        BenchmarkResult(
+            benchmark="kdtree_build",
+            scenario=scenario.name,
+            engine=None,
+            params=scenario.params,
+            timing=build_timing,
+        ),
+        BenchmarkResult(
+            benchmark="kdtree_generate_colliding_items",
+            scenario=scenario.name,
+            engine=None,
+            params=scenario.params,
+            timing=query_timing,
+        ),
+    ]
+
+
+def run_engine_benchmarks(
+    scenario: Scenario, engine_name: str, config: SuiteConfig
+) -> List[BenchmarkResult]:
+    engine_factory = engine_name2engine_factory[engine_name]
+
+    state = _prepare_state(scenario, config)
+    detector = CollisionDetector(engine=engine_factory())
+    toi_timing = measure(
+        lambda: detector.get_time_before_collision(state, config.dt),
+        repeat=config.repeat,
+    )
+
+    env = _create_env(scenario, engine_factory())
+    action = BreakoutAction(type=BreakoutActionType.NOTHING)
+    step_timing = measure(
+        lambda: env.step(action, config.dt),
+        repeat=config.repeat,
+        number=config.num_steps,
+        setup=lambda: _reset_env(env, scenario, config),
+    )
+
+    return [
+        BenchmarkResult(
+            benchmark="get_time_before_collision",
+            scenario=scenario.name,
+            engine=engine_name,
+            params=scenario.params,
+            timing=toi_timing,
+        ),
+        BenchmarkResult(
+            benchmark="env_step",
+            scenario=scenario.name,
+            engine=engine_name,
+            params=scenario.params,
+            timing=step_timing,
+        ),
+    ]
+
+
+def _create_env(
+    scenario: Scenario, engine: ICollisionDetectorEngine
+) -> BreakoutEnv:
+    return BreakoutEnv(
+        env_size=scenario.env_size,
+        collision_detector=CollisionDetector(engine=engine),
+        level_builder=scenario.level_builder,
+    )
+
+
+def _reset_env(
+    env: BreakoutEnv, scenario: Scenario, config: SuiteConfig
+) -> None:
+    random.seed(config.seed)
+
+    env.reset()
+    env.step(scenario.first_action, config.dt)
+    env.pop_events()
+
+
+def _prepare_state(scenario: Scenario, config: SuiteConfig) -> BreakoutState:
+    env = _create_env(scenario, NaiveCollisionDetectionEngine())
+    _reset_env(env, scenario, config)
+
+    return env.state
@@ -0,0 +1,38 @@
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class Timing:
+    best: float
+    mean: float
+    stdev: float
+    repeat: int
+    number: int
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat: int = 5,
+    number: int = 1,
+    setup: Callable[[], Any] = lambda: None,
+) -> Timing:
+    times = []
+    for _ in range(repeat):
+        setup()
+
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+
+        times.append((time.perf_counter() - start) / number)
+
+    return Timing(
+        best=min(times),
+        mean=statistics.mean(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        repeat=repeat,
+        number=number,
+    )
@@ -1,8 +1,14 @@
+from .array_state import ArrayBreakoutState
 from .collisions import (
+    BVHCollisionDetectionEngine,
     CollisionDetector,
+    IncrementalKDTreeCollisionDetectionEngine,
     KDTreeBuilder,
     KDTreeCollisionDetectionEngine,
+    KDTreeParams,
     NaiveCollisionDetectionEngine,
+    SpatialHashCollisionDetectionEngine,
+    SweepAndPruneCollisionDetectionEngine,
 )
 from .dtos import (
     Ball,
@@ -23,6 +29,7 @@ from .dtos import (
     Wall,
 )
 from .env import BreakoutEnv
+from .event_driven import EventDrivenBreakoutEnv
 from .levels import (
     DefaultLevelBuilder,
     EmptyLevelBuilder,
@@ -30,3 +37,13 @@ from .levels import (
     PerformanceLevelBuilder,
 )
 from .state import BreakoutState
+from .vector import (
+    BreakoutObservation,
+    BreakoutObserver,
+    SharedVectorBuffer,
+    SubprocessVectorBackend,
+    SyncVectorBackend,
+    VectorBackendType,
+    VectorBreakoutEnv,
+    VectorBuffer,
+)
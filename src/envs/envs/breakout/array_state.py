@@ -0,0 +1,459 @@
+from copy import deepcopy
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+from envs.breakout.dtos import Ball, Block, ItemId, Platform, Wall
+from geometry import Capsule, Circle, Point, Rectangle, Shape, Vec2
+
+from .state import BreakoutState
+
+TRows = TypeVar("TRows", bound="ItemRows")
+TItem = TypeVar("TItem")
+
+
+class ItemRows:
+    array_names: Tuple[str, ...] = ("rects",)
+
+    def __init__(self, num_rows: int) -> None:
+        self.rects = np.zeros((num_rows, 4))
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def select(self, mask: np.ndarray) -> None:
+        for name in self.array_names:
+            setattr(self, name, getattr(self, name)[mask])
+
+    def take(self: TRows, index: int) -> TRows:
+        rows = deepcopy(self)
+        rows.select(np.arange(len(self)) == index)
+
+        return rows
+
+
+class BallRows(ItemRows):
+    array_names = ("rects", "velocities", "radii", "thrown")
+
+    def __init__(self, balls: Sequence[Ball]) -> None:
+        super().__init__(len(balls))
+
+        self.velocities = np.zeros((len(balls), 2))
+        self.radii = np.zeros(len(balls))
+        self.thrown = np.zeros(len(balls), dtype=bool)
+
+        for idx, ball in enumerate(balls):
+            self.rects[idx] = _get_rect_row(ball.rect)
+            velocity = ball.velocity * ball.speed
+            self.velocities[idx] = [velocity.x, velocity.y]
+            self.radii[idx] = ball.radius
+            self.thrown[idx] = ball.thrown
+
+
+class PlatformRows(ItemRows):
+    array_names = (
+        "rects",
+        "velocities",
+        "speeds",
+        "rest_freeze_times",
+        "default_freeze_times",
+    )
+
+    def __init__(self, platforms: Sequence[Platform]) -> None:
+        super().__init__(len(platforms))
+
+        self.velocities = np.zeros((len(platforms), 2))
+        self.speeds = np.zeros(len(platforms))
+        self.rest_freeze_times = np.zeros(len(platforms))
+        self.default_freeze_times = np.zeros(len(platforms))
+
+        for idx, platform in enumerate(platforms):
+            self.rects[idx] = _get_rect_row(platform.rect)
+            self.velocities[idx] = [platform.velocity.x, platform.velocity.y]
+            self.speeds[idx] = platform.speed
+            self.rest_freeze_times[idx] = platform.rest_freeze_time
+            self.default_freeze_times[idx] = platform.default_freeze_time
+
+
+class RectangleView(Rectangle):
+    def __init__(self, item: Any) -> None:
+        self._item = item
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.__dict__
+
+    def _get(self, column: int) -> float:
+        return float(self._item._rows.rects[self._item._index, column])
+
+    def _set(self, column: int, value: float) -> None:
+        self._item._rows.rects[self._item._index, column] = value
+
+    @property
+    def left(self) -> float:
+        return self._get(0)
+
+    @left.setter
+    def left(self, value: float) -> None:
+        self._set(0, value)
+
+    @property
+    def top(self) -> float:
+        return self._get(1)
+
+    @top.setter
+    def top(self, value: float) -> None:
+        self._set(1, value)
+
+    @property
+    def width(self) -> float:
+        return self._get(2)
+
+    @width.setter
+    def width(self, value: float) -> None:
+        self._set(2, value)
+
+    @property
+    def height(self) -> float:
+        return self._get(3)
+
+    @height.setter
+    def height(self, value: float) -> None:
+        self._set(3, value)
+
+
+class Vec2View(Vec2):
+    def __init__(self, item: Any, array_name: str) -> None:
+        self._item = item
+        self._array_name = array_name
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.__dict__
+
+    def _get(self, column: int) -> float:
+        array = getattr(self._item._rows, self._array_name)
+
+        return float(array[self._item._index, column])
+
+    def _set(self, column: int, value: float) -> None:
+        array = getattr(self._item._rows, self._array_name)
+        array[self._item._index, column] = value
+
+    @property
+    def x(self) -> float:
+        return self._get(0)
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._set(0, value)
+
+    @property
+    def y(self) -> float:
+        return self._get(1)
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._set(1, value)
+
+
+class BallView(Ball):
+    def __init__(self, id: ItemId, rows: BallRows, index: int) -> None:
+        self.id = id
+
+        self._rows = rows
+        self._index = index
+        self._rect = RectangleView(self)
+
+    @property
+    def rect(self) -> Rectangle:
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: Rectangle) -> None:
+        self._rows.rects[self._index] = _get_rect_row(value)
+
+    @property
+    def radius(self) -> float:
+        return float(self._rows.radii[self._index])
+
+    @radius.setter
+    def radius(self, value: float) -> None:
+        self._rows.radii[self._index] = value
+
+    @property
+    def thrown(self) -> bool:
+        return bool(self._rows.thrown[self._index])
+
+    @thrown.setter
+    def thrown(self, value: bool) -> None:
+        self._rows.thrown[self._index] = value
+
+    @property
+    def _velocity(self) -> Vec2:
+        x, y = self._rows.velocities[self._index].tolist()
+
+        return Vec2(x=x, y=y)
+
+    @_velocity.setter
+    def _velocity(self, value: Vec2) -> None:
+        self._rows.velocities[self._index] = [value.x, value.y]
+
+    @property
+    def speed(self) -> float:
+        x, y = self._rows.velocities[self._index].tolist()
+
+        return float((x * x + y * y) ** 0.5)
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._velocity = self.direction * value
+
+    def fake_update(self, dt: float) -> Tuple[Point, Point]:
+        center = self._get_center()
+        x, y = self._rows.velocities[self._index].tolist()
+
+        return center, Point(x=center.x + x * dt, y=center.y + y * dt)
+
+    def get_ghost_trace(self, dt: float) -> Iterable[Shape]:
+        if dt == 0:
+            return [Circle(center=self._get_center(), radius=self.radius)]
+
+        start_center, finish_center = self.fake_update(dt)
+
+        return [
+            Capsule(
+                begin=start_center,
+                end=finish_center,
+                radius=self.radius,
+            ),
+        ]
+
+    def _get_center(self) -> Point:
+        left, top, width, height = self._rows.rects[self._index].tolist()
+
+        return Point(x=left + width / 2, y=top + height / 2)
+
+
+class PlatformView(Platform):
+    def __init__(self, id: ItemId, rows: PlatformRows, index: int) -> None:
+        self.id = id
+
+        self._rows = rows
+        self._index = index
+        self._rect = RectangleView(self)
+        self._velocity = Vec2View(self, "velocities")
+
+    @property
+    def rect(self) -> Rectangle:
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: Rectangle) -> None:
+        self._rows.rects[self._index] = _get_rect_row(value)
+
+    @property
+    def velocity(self) -> Vec2:
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value: Vec2) -> None:
+        self._rows.velocities[self._index] = [value.x, value.y]
+
+    @property
+    def speed(self) -> float:
+        return float(self._rows.speeds[self._index])
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._rows.speeds[self._index] = value
+
+    @property
+    def rest_freeze_time(self) -> float:
+        return float(self._rows.rest_freeze_times[self._index])
+
+    @rest_freeze_time.setter
+    def rest_freeze_time(self, value: float) -> None:
+        self._rows.rest_freeze_times[self._index] = value
+
+    @property
+    def default_freeze_time(self) -> float:
+        return float(self._rows.default_freeze_times[self._index])
+
+    @default_freeze_time.setter
+    def default_freeze_time(self, value: float) -> None:
+        self._rows.default_freeze_times[self._index] = value
+
+
+def _writes_back(method: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(method)
+    def wrapper(self: "ItemViews[Any]", *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self._on_change(list(self))
+
+        return result
+
+    return wrapper
+
+
+class ItemViews(List[TItem]):
+    def __init__(
+        self,
+        items: Iterable[TItem],
+        on_change: Callable[[List[TItem]], None],
+    ) -> None:
+        super().__init__(items)
+        self._on_change = on_change
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return ItemViews, (list(self), self._on_change)
+
+    append = _writes_back(list.append)
+    extend = _writes_back(list.extend)
+    insert = _writes_back(list.insert)
+    remove = _writes_back(list.remove)
+    pop = _writes_back(list.pop)
+    clear = _writes_back(list.clear)
+    sort = _writes_back(list.sort)
+    reverse = _writes_back(list.reverse)
+    __setitem__ = _writes_back(list.__setitem__)
+    __delitem__ = _writes_back(list.__delitem__)
+    __iadd__ = _writes_back(list.__iadd__)
+    __imul__ = _writes_back(list.__imul__)
+
+
+class ArrayBreakoutState(BreakoutState):
+    def __init__(
+        self,
+        balls: Sequence[Ball] = (),
+        blocks: Sequence[Block] = (),
+        platforms: Sequence[Platform] = (),
+        walls: Sequence[Wall] = (),
+        static_version: int = 0,
+    ) -> None:
+        self.balls = list(balls)
+        self.blocks = list(blocks)
+        self.platforms = list(platforms)
+        self.walls = list(walls)
+        self.static_version = static_version
+
+    @classmethod
+    def from_state(cls, state: BreakoutState) -> "ArrayBreakoutState":
+        return cls(
+            balls=state.balls,
+            blocks=state.blocks,
+            platforms=state.platforms,
+            walls=state.walls,
+            static_version=state.static_version,
+        )
+
+    @property
+    def balls(self) -> List[Ball]:
+        return self._ball_views
+
+    @balls.setter
+    def balls(self, balls: List[Ball]) -> None:
+        rows = BallRows(balls)
+        views = [
+            self._bind_view(
+                ball, idx, getattr(self, "_ball_rows", None), rows, BallView
+            )
+            for idx, ball in enumerate(balls)
+        ]
+
+        self._ball_rows = rows
+        self._ball_views = ItemViews(views, on_change=self._set_balls)
+
+    def _set_balls(self, balls: List[Ball]) -> None:
+        self.balls = balls
+
+    @property
+    def platforms(self) -> List[Platform]:
+        return self._platform_views
+
+    @platforms.setter
+    def platforms(self, platforms: List[Platform]) -> None:
+        rows = PlatformRows(platforms)
+        views = [
+            self._bind_view(
+                platform,
+                idx,
+                getattr(self, "_platform_rows", None),
+                rows,
+                PlatformView,
+            )
+            for idx, platform in enumerate(platforms)
+        ]
+
+        self._platform_rows = rows
+        self._platform_views = ItemViews(views, on_change=self._set_platforms)
+
+    def _set_platforms(self, platforms: List[Platform]) -> None:
+        self.platforms = platforms
+
+    @staticmethod
+    def _bind_view(
+        item: Any, index: int, old_rows: Any, rows: Any, view_cls: Any
+    ) -> Any:
+        if not isinstance(item, view_cls) or item._rows is not old_rows:
+            return view_cls(id=item.id, rows=rows, index=index)
+
+        item._rows = rows
+        item._index = index
+
+        return item
+
+    def copy(self) -> "ArrayBreakoutState":
+        return deepcopy(self)
+
+    def update_platforms(self, dt: float) -> None:
+        rows = self._platform_rows
+
+        fdt = np.maximum(0, dt - rows.rest_freeze_times)
+        shifts = rows.velocities * (rows.speeds * fdt)[:, np.newaxis]
+        rows.rects[:, :2] += shifts
+        rows.rest_freeze_times = np.maximum(0, rows.rest_freeze_times - dt)
+
+    def update_balls(self, dt: float, bottom: float) -> List[Ball]:
+        rows = self._ball_rows
+
+        thrown = rows.thrown
+        rows.rects[thrown, :2] += rows.velocities[thrown] * dt
+
+        removed = np.zeros(len(rows), dtype=bool)
+        if not thrown.all():
+            if len(self._platform_rows) > 0:
+                left, top, width, _ = self._platform_rows.rects[0]
+                rows.rects[~thrown, 0] = (
+                    left + (width - rows.rects[~thrown, 2]) / 2
+                )
+                rows.rects[~thrown, 1] = top - rows.rects[~thrown, 3]
+            else:
+                removed |= ~thrown
+
+        removed |= rows.rects[:, 1] > bottom
+
+        if not removed.any():
+            return []
+
+        return self._remove_balls(removed)
+
+    def _remove_balls(self, removed: np.ndarray) -> List[Ball]:
+        removed_views: List[Ball] = []
+        ball_views: List[BallView] = []
+        for ball_view, is_removed in zip(self._ball_views, removed):
+            if is_removed:
+                ball_view._rows = self._ball_rows.take(ball_view._index)
+                ball_view._index = 0
+                removed_views.append(ball_view)
+            else:
+                ball_view._index = len(ball_views)
+                ball_views.append(ball_view)
+
+        self._ball_rows.select(~removed)
+        self._ball_views = ItemViews(ball_views, on_change=self._set_balls)
+
+        return removed_views
+
+
+def _get_rect_row(rect: Rectangle) -> List[float]:
+    return [rect.left, rect.top, rect.width, rect.height]
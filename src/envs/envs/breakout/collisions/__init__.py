@@ -1,3 +1,11 @@
+from .bvh import BVHCollisionDetectionEngine
 from .detector import CollisionDetector
-from .kdtree import KDTreeBuilder, KDTreeCollisionDetectionEngine
+from .kdtree import (
+    IncrementalKDTreeCollisionDetectionEngine,
+    KDTreeBuilder,
+    KDTreeCollisionDetectionEngine,
+    KDTreeParams,
+)
 from .naive import NaiveCollisionDetectionEngine
+from .spatial_hash import SpatialHashCollisionDetectionEngine
+from .sweep_and_prune import SweepAndPruneCollisionDetectionEngine
@@ -0,0 +1,112 @@
+from itertools import chain
+from typing import Dict, List, Set
+
+from envs.breakout.dtos import Ball, Item, ItemId, Platform
+from envs.breakout.state import BreakoutState
+from geometry import ClassId, DynamicAABBTree, Record
+
+from .records import (
+    RecordCollisionDetectionEngine,
+    StepIntersactions,
+    get_item_class_id,
+)
+from .state_cache import StateCache
+
+
+class BVHCollisionDetectionEngine(RecordCollisionDetectionEngine):
+    def __init__(self, margin: float = 8.0) -> None:
+        super().__init__()
+
+        self._margin = margin
+        self._builders: StateCache[BVHBuilder] = StateCache()
+
+    def get_step_intersactions(
+        self, state: BreakoutState, dt: float
+    ) -> StepIntersactions:
+        bvh_builder = self._builders.get(state)
+        if bvh_builder is None:
+            bvh_builder = BVHBuilder(margin=self._margin)
+            self._builders.set(state, bvh_builder)
+
+        tree = bvh_builder.build(state, dt)
+        intersactions = list(
+            tree.generate_colliding_items(self.collidable_pairs)
+        )
+
+        return StepIntersactions(
+            intersactions=intersactions,
+            item_id2item_class=bvh_builder.item_id2item_class,
+            item_id2item=bvh_builder.item_id2item,
+        )
+
+
+class BVHBuilder:
+    def __init__(self, margin: float = 8.0) -> None:
+        self.item_id2item: Dict[ItemId, Item] = {}
+        self.item_id2item_class: Dict[ItemId, ClassId] = {}
+
+        self._tree = DynamicAABBTree(margin=margin)
+
+        self._static_ids: Set[ItemId] = set()
+        self._static_version = -1
+        self._dynamic_ids: Set[ItemId] = set()
+
+    def build(self, state: BreakoutState, dt: float) -> DynamicAABBTree:
+        self._update_static_items(state, dt)
+        self._update_dynamic_items(state, dt)
+
+        return self._tree
+
+    def _update_static_items(self, state: BreakoutState, dt: float) -> None:
+        num_items = len(state.blocks) + len(state.walls)
+        is_same_version = self._static_version == state.static_version
+        if is_same_version and num_items == len(self._static_ids):
+            return
+
+        self._static_version = state.static_version
+
+        items: List[Item] = list(chain(state.blocks, state.walls))
+        self._static_ids = self._sync_items(items, self._static_ids, dt)
+
+    def _update_dynamic_items(self, state: BreakoutState, dt: float) -> None:
+        items: List[Item] = list(chain(state.balls, state.platforms))
+        self._dynamic_ids = self._sync_items(items, self._dynamic_ids, dt)
+
+    def _sync_items(
+        self, items: List[Item], item_ids: Set[ItemId], dt: float
+    ) -> Set[ItemId]:
+        actual_ids = {item.id for item in items}
+
+        for item_id in item_ids - actual_ids:
+            self._tree.remove(item_id)
+            del self.item_id2item[item_id]
+            del self.item_id2item_class[item_id]
+
+        for item in items:
+            if item.id not in item_ids:
+                self.item_id2item[item.id] = item
+                self.item_id2item_class[item.id] = get_item_class_id(item)
+                self._tree.insert(
+                    item_id=item.id,
+                    class_id=self.item_id2item_class[item.id],
+                    records=self._convert_item_to_records(item, dt),
+                )
+
+            elif isinstance(item, (Ball, Platform)):
+                self._tree.move(
+                    item_id=item.id,
+                    records=self._convert_item_to_records(item, dt),
+                )
+
+        return actual_ids
+
+    def _convert_item_to_records(self, item: Item, dt: float) -> List[Record]:
+        return [
+            Record(
+                item_id=item.id,
+                class_id=self.item_id2item_class[item.id],
+                shape=shape,
+                bounding_box=shape.bounding_box,
+            )
+            for shape in item.get_ghost_trace(dt)
+        ]
@@ -1,108 +1,102 @@
-from typing import Dict, Iterable, List, Mapping
+from typing import Any, Iterable, List, Optional
 
 from envs.breakout.constants import EPS
-from envs.breakout.dtos import (
-    Ball,
-    Block,
-    Collision,
-    Item,
-    ItemId,
-    Platform,
-    Wall,
+from envs.breakout.dtos import Collision
+from envs.breakout.protocols import (
+    ICollisionDetectorEngine,
+    ICollisionQuerySession,
 )
-from envs.breakout.protocols import ICollisionDetectorEngine
 from envs.breakout.state import BreakoutState
 from timeprofiler import profile
 
+from .time_of_impact import calculate_collision_toi
+
 
 class CollisionDetector:
     def __init__(self, engine: ICollisionDetectorEngine) -> None:
         self._engine = engine
 
+    def close(self) -> None:
+        self._engine.close()
+
+    def __enter__(self) -> "CollisionDetector":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @profile("calc_session", "env_step")
+    def create_query_session(
+        self, state: BreakoutState, max_dt: float
+    ) -> ICollisionQuerySession:
+        return self._engine.create_query_session(state, max_dt)
+
     @profile("calc_colls", "env_step")
     def get_step_collisions(
-        self, state: BreakoutState, dt: float
+        self,
+        state: BreakoutState,
+        dt: float,
+        session: Optional[ICollisionQuerySession] = None,
     ) -> List[Collision]:
-        return list(self._generate_step_collisions(state, dt))
+        return list(self._generate_step_collisions(state, dt, session))
 
     def _generate_step_collisions(
-        self, state: BreakoutState, dt: float
+        self,
+        state: BreakoutState,
+        dt: float,
+        session: Optional[ICollisionQuerySession] = None,
     ) -> Iterable[Collision]:
-        return self._engine.generate_step_collisions(state, dt)
+        if session is None:
+            return self._engine.generate_step_collisions(state, dt)
+
+        return session.generate_step_collisions(dt)
 
     @profile("calc_time", "env_step")
     def get_time_before_collision(
-        self, state: BreakoutState, max_dt: float
+        self,
+        state: BreakoutState,
+        max_dt: float,
+        session: Optional[ICollisionQuerySession] = None,
     ) -> float:
-        return self._get_time_before_collision(state, max_dt)
+        if session is None:
+            session = self._engine.create_query_session(state, max_dt)
+
+        return self._get_time_before_collision(session, max_dt)
 
     def _get_time_before_collision(
-        self, state: BreakoutState, max_dt: float
+        self, session: ICollisionQuerySession, max_dt: float
     ) -> float:
-        colls = self._engine.generate_step_collisions(state, max_dt)
+        colls = session.generate_step_collisions(max_dt)
         if not any(colls):
             return max_dt
 
-        if any(self._generate_step_collisions(state, EPS)):
+        if any(session.generate_step_collisions(EPS)):
             return 0.0
 
-        state = self._build_collided_state(state, colls)
+        tois = [calculate_collision_toi(coll, max_dt) for coll in colls]
+        known_tois = [toi for toi in tois if toi is not None]
+
+        if known_tois:
+            max_dt = min(max_dt, max(EPS, min(known_tois) - EPS))
+
+            if len(known_tois) == len(tois):
+                return max_dt
 
+            if not any(session.generate_step_collisions(max_dt)):
+                return max_dt
+
+        return self._bisect_time_before_collision(session, max_dt)
+
+    def _bisect_time_before_collision(
+        self, session: ICollisionQuerySession, max_dt: float
+    ) -> float:
         min_dt = 0.0
         while max_dt - min_dt > EPS:
             mid_dt = (max_dt + min_dt) / 2
 
-            colls = self._engine.generate_step_collisions(state, mid_dt)
-
-            if any(colls):
+            if any(session.generate_step_collisions(mid_dt)):
                 max_dt = mid_dt
-                state = self._build_collided_state(state, colls)
             else:
                 min_dt = mid_dt
 
         return min_dt
-
-    def _build_collided_state(
-        self, state: BreakoutState, colls: Iterable[Collision]
-    ) -> BreakoutState:
-        index = self._build_index(state)
-        substate = BreakoutState()
-
-        collided_ids = set()
-        for coll in colls:
-            for item_idx in coll.item_ids:
-                collided_ids.add(item_idx)
-
-        for item_idx in collided_ids:
-            item = index[item_idx]
-
-            if isinstance(item, Ball):
-                substate.balls.append(item)
-
-            elif isinstance(item, Platform):
-                substate.platforms.append(item)
-
-            elif isinstance(item, Block):
-                substate.blocks.append(item)
-
-            elif isinstance(item, Wall):
-                substate.walls.append(item)
-
-        return substate
-
-    def _build_index(self, state: BreakoutState) -> Mapping[ItemId, Item]:
-        index: Dict[ItemId, Item] = dict()
-
-        for wall in state.walls:
-            index[wall.id] = wall
-
-        for ball in state.balls:
-            index[ball.id] = ball
-
-        for platform in state.platforms:
-            index[platform.id] = platform
-
-        for block in state.blocks:
-            index[block.id] = block
-
-        return index
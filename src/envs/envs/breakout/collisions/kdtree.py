@@ -1,165 +1,146 @@
-from enum import Enum, auto
-from typing import Iterable, List, Mapping, cast
-
-from envs.breakout.dtos import (
-    Ball,
-    Block,
-    Collision,
-    CollisionBallBall,
-    CollisionBallBlock,
-    CollisionBallPlatform,
-    CollisionBallWall,
-    CollisionPlatformWall,
-    Item,
-    Platform,
-    Wall,
-)
+from collections import ChainMap
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from envs.breakout.dtos import Ball, Item, Platform
 from envs.breakout.state import BreakoutState
-from geometry import ClassId, IntersactionInfo, ItemId, KDTree, Record
+from geometry import (
+    ClassId,
+    DynamicKDTree,
+    IntersactionInfo,
+    ISplitStrategy,
+    ItemId,
+    KDTree,
+    KDTreeQueryPool,
+    LoadGiniSplitStrategy,
+    Record,
+)
 
-from .cached_collection import CachedCollection
-from .precise import calculate_ball_ball_colls
+from .records import (
+    RecordCollisionDetectionEngine,
+    StepIntersactions,
+    get_item_class_id,
+)
+from .state_cache import StateCache
 
 
-class ItemClass(Enum):
-    BALL = auto()
-    BLOCK = auto()
-    PLATFORM = auto()
-    WALL = auto()
+@dataclass
+class KDTreeParams:
+    split_strategy: ISplitStrategy = field(
+        default_factory=LoadGiniSplitStrategy
+    )
+    max_depth: int = 4
+    num_records_stop: int = 8
+    num_workers: int = 0
+    parallel_split_depth: int = 2
+    parallel_min_records: int = 256
 
 
-class KDTreeCollisionDetectionEngine:
-    def __init__(self) -> None:
-        self._collidable_pairs = {
-            (ItemClass.BALL.value, ItemClass.BALL.value),
-            (ItemClass.BALL.value, ItemClass.BLOCK.value),
-            (ItemClass.BALL.value, ItemClass.PLATFORM.value),
-            (ItemClass.BALL.value, ItemClass.WALL.value),
-            (ItemClass.PLATFORM.value, ItemClass.WALL.value),
-        }
+class KDTreeCollisionDetectionEngine(RecordCollisionDetectionEngine):
+    def __init__(self, params: Optional[KDTreeParams] = None) -> None:
+        super().__init__()
 
-    def generate_step_collisions(
-        self, state: BreakoutState, dt: float
-    ) -> Iterable[Collision]:
-        return CachedCollection(self._generate_step_collisions(state, dt))
+        if params is None:
+            params = KDTreeParams()
 
-    def _generate_step_collisions(
-        self, state: BreakoutState, dt: float
-    ) -> Iterable[Collision]:
-        kdtree_builder = KDTreeBuilder(state.get_items())
+        self._params = params
+        self._static_indices: StateCache[KDTreeStaticIndex] = StateCache()
 
-        tree = kdtree_builder.build(dt)
-        intersactions = tree.generate_colliding_items(self._collidable_pairs)
-
-        for intersaction in intersactions:
-            yield from self._convert_intersaction_to_collision(
-                intersaction=intersaction,
-                dt=dt,
-                item_id2item_class=kdtree_builder.item_id2item_class,
-                item_id2item=kdtree_builder.item_id2item,
+        self._query_pool: Optional[KDTreeQueryPool] = None
+        if params.num_workers > 0:
+            self._query_pool = KDTreeQueryPool(
+                num_workers=params.num_workers,
+                split_depth=params.parallel_split_depth,
+                min_parallel_records=params.parallel_min_records,
             )
 
-    def _convert_intersaction_to_collision(
-        self,
-        intersaction: IntersactionInfo,
-        dt: float,
-        item_id2item_class: Mapping[ItemId, ClassId],
-        item_id2item: Mapping[ItemId, Item],
-    ) -> Iterable[Collision]:
-        (item_id1, item_id2), point = intersaction
+    def close(self) -> None:
+        if self._query_pool is not None:
+            self._query_pool.close()
 
-        class_id1 = item_id2item_class[item_id1]
-        class_id2 = item_id2item_class[item_id2]
+    def get_step_intersactions(
+        self, state: BreakoutState, dt: float
+    ) -> StepIntersactions:
+        static_index = self._get_static_index(state)
 
-        if (
-            class_id1 == ItemClass.BALL.value
-            and class_id2 == ItemClass.BALL.value
-        ):
+        kdtree_builder = KDTreeBuilder(
+            items=chain(state.balls, state.platforms),
+            params=self._params,
+        )
+        tree = kdtree_builder.build(dt)
 
-            ball1 = cast(Ball, item_id2item[item_id1])
-            ball2 = cast(Ball, item_id2item[item_id2])
+        item_id2item_class = ChainMap(
+            kdtree_builder.item_id2item_class,
+            static_index.item_id2item_class,
+        )
+        item_id2item = ChainMap(
+            kdtree_builder.item_id2item,
+            static_index.item_id2item,
+        )
 
-            coll = calculate_ball_ball_colls(ball1, ball2, dt)
+        intersactions = chain(
+            self._generate_colliding_items(tree),
+            static_index.generate_record_intersections(
+                records=kdtree_builder.records,
+                collidable_pairs=self.collidable_pairs,
+            ),
+        )
 
-            if coll is not None:
-                yield CollisionBallBall(
-                    point=point,
-                    ball1=ball1,
-                    ball2=ball2,
-                )
+        return StepIntersactions(
+            intersactions=intersactions,
+            item_id2item_class=item_id2item_class,
+            item_id2item=item_id2item,
+        )
 
-        elif (
-            class_id1 == ItemClass.BALL.value
-            and class_id2 == ItemClass.BLOCK.value
-        ):
-            yield CollisionBallBlock(
-                point=point,
-                ball=cast(Ball, item_id2item[item_id1]),
-                block=cast(Block, item_id2item[item_id2]),
-            )
+    def _generate_colliding_items(
+        self, tree: KDTree
+    ) -> Iterable[IntersactionInfo]:
+        if self._query_pool is None:
+            return tree.generate_colliding_items(self.collidable_pairs)
 
-        elif (
-            class_id1 == ItemClass.BALL.value
-            and class_id2 == ItemClass.PLATFORM.value
-        ):
-            yield CollisionBallPlatform(
-                point=point,
-                ball=cast(Ball, item_id2item[item_id1]),
-                platform=cast(Platform, item_id2item[item_id2]),
-            )
+        return self._query_pool.generate_colliding_items(
+            tree=tree,
+            collidable_pairs=self.collidable_pairs,
+        )
 
-        elif (
-            class_id1 == ItemClass.BALL.value
-            and class_id2 == ItemClass.WALL.value
-        ):
-            yield CollisionBallWall(
-                point=point,
-                ball=cast(Ball, item_id2item[item_id1]),
-                wall=cast(Wall, item_id2item[item_id2]),
-            )
+    def _get_static_index(self, state: BreakoutState) -> "KDTreeStaticIndex":
+        static_index = self._static_indices.get(state)
 
-        elif (
-            class_id1 == ItemClass.PLATFORM.value
-            and class_id2 == ItemClass.WALL.value
-        ):
-            yield CollisionPlatformWall(
-                point=point,
-                platform=cast(Platform, item_id2item[item_id1]),
-                wall=cast(Wall, item_id2item[item_id2]),
-            )
+        if static_index is None or not static_index.is_actual(state):
+            static_index = KDTreeStaticIndex(state, params=self._params)
+            self._static_indices.set(state, static_index)
 
-        else:
-            raise NotImplementedError
+        return static_index
 
 
 class KDTreeBuilder:
-    def __init__(self, items: Iterable[Item]) -> None:
-        self._class2class_id = {
-            Ball: ItemClass.BALL.value,
-            Block: ItemClass.BLOCK.value,
-            Platform: ItemClass.PLATFORM.value,
-            Wall: ItemClass.WALL.value,
-        }
+    def __init__(
+        self, items: Iterable[Item], params: Optional[KDTreeParams] = None
+    ) -> None:
+        if params is None:
+            params = KDTreeParams()
 
         self._items = list(items)
+        self._params = params
 
-        self.item_id2item = {idx: item for idx, item in enumerate(self._items)}
+        self.item_id2item = {item.id: item for item in self._items}
         self.item_id2item_class = {
-            idx: self._class2class_id[type(item)]
-            for idx, item in enumerate(self._items)
+            item.id: get_item_class_id(item) for item in self._items
         }
+        self.records: List[Record] = []
 
     def build(self, dt: float) -> KDTree:
-        records = self._convert_items_to_records(
+        self.records = self._convert_items_to_records(
             items=self._items,
             dt=dt,
         )
 
         return KDTree(
-            records=records,
-            alpha=0.5,
-            max_depth=4,
-            num_records_stop=8,
+            records=self.records,
+            max_depth=self._params.max_depth,
+            num_records_stop=self._params.num_records_stop,
+            split_strategy=self._params.split_strategy,
         )
 
     def _convert_items_to_records(
@@ -168,15 +149,157 @@ class KDTreeBuilder:
         dt: float,
     ) -> List[Record]:
         records = []
-        for item_id, item in enumerate(items):
+        for item in items:
             for shape in item.get_ghost_trace(dt):
                 records.append(
                     Record(
-                        item_id=item_id,
-                        class_id=self.item_id2item_class[item_id],
+                        item_id=item.id,
+                        class_id=self.item_id2item_class[item.id],
                         shape=shape,
                         bounding_box=shape.bounding_box,
                     )
                 )
 
         return records
+
+
+class KDTreeStaticIndex:
+    def __init__(
+        self, state: BreakoutState, params: Optional[KDTreeParams] = None
+    ) -> None:
+        kdtree_builder = KDTreeBuilder(
+            items=chain(state.blocks, state.walls),
+            params=params,
+        )
+
+        self.item_id2item = kdtree_builder.item_id2item
+        self.item_id2item_class = kdtree_builder.item_id2item_class
+
+        self._version = state.static_version
+        self._num_items = len(state.blocks) + len(state.walls)
+
+        self._tree: Optional[KDTree] = None
+        if self._num_items > 0:
+            self._tree = kdtree_builder.build(0.0)
+
+    def is_actual(self, state: BreakoutState) -> bool:
+        return self._version == state.static_version and self._num_items == len(
+            state.blocks
+        ) + len(state.walls)
+
+    def generate_record_intersections(
+        self,
+        records: Iterable[Record],
+        collidable_pairs: Set[Tuple[ClassId, ClassId]],
+    ) -> Iterable[IntersactionInfo]:
+        if self._tree is None:
+            return
+
+        yield from self._tree.generate_records_intersections(
+            records=list(records),
+            collidable_pairs=collidable_pairs,
+        )
+
+
+class IncrementalKDTreeCollisionDetectionEngine(KDTreeCollisionDetectionEngine):
+    def __init__(self, params: Optional[KDTreeParams] = None) -> None:
+        super().__init__(params=params)
+
+        self._builders: StateCache[IncrementalKDTreeBuilder] = StateCache()
+
+    def get_step_intersactions(
+        self, state: BreakoutState, dt: float
+    ) -> StepIntersactions:
+        kdtree_builder = self._builders.get(state)
+        if kdtree_builder is None:
+            kdtree_builder = IncrementalKDTreeBuilder(params=self._params)
+            self._builders.set(state, kdtree_builder)
+
+        tree = kdtree_builder.build(state, dt)
+        intersactions = list(
+            tree.generate_colliding_items(self.collidable_pairs)
+        )
+
+        return StepIntersactions(
+            intersactions=intersactions,
+            item_id2item_class=kdtree_builder.item_id2item_class,
+            item_id2item=kdtree_builder.item_id2item,
+        )
+
+
+class IncrementalKDTreeBuilder:
+    def __init__(self, params: Optional[KDTreeParams] = None) -> None:
+        if params is None:
+            params = KDTreeParams()
+
+        self.item_id2item: Dict[ItemId, Item] = {}
+        self.item_id2item_class: Dict[ItemId, ClassId] = {}
+
+        self._tree = DynamicKDTree(
+            records=[],
+            max_depth=params.max_depth,
+            num_records_stop=params.num_records_stop,
+            split_strategy=params.split_strategy,
+        )
+
+        self._static_ids: Set[ItemId] = set()
+        self._static_version = -1
+        self._dynamic_ids: Set[ItemId] = set()
+
+    def build(self, state: BreakoutState, dt: float) -> DynamicKDTree:
+        self._update_static_items(state, dt)
+        self._update_dynamic_items(state, dt)
+
+        self._tree.rebalance()
+
+        return self._tree
+
+    def _update_static_items(self, state: BreakoutState, dt: float) -> None:
+        num_items = len(state.blocks) + len(state.walls)
+        is_same_version = self._static_version == state.static_version
+        if is_same_version and num_items == len(self._static_ids):
+            return
+
+        self._static_version = state.static_version
+
+        items: List[Item] = list(chain(state.blocks, state.walls))
+        self._static_ids = self._sync_items(items, self._static_ids, dt)
+
+    def _update_dynamic_items(self, state: BreakoutState, dt: float) -> None:
+        items: List[Item] = list(chain(state.balls, state.platforms))
+        self._dynamic_ids = self._sync_items(items, self._dynamic_ids, dt)
+
+    def _sync_items(
+        self, items: List[Item], item_ids: Set[ItemId], dt: float
+    ) -> Set[ItemId]:
+        actual_ids = {item.id for item in items}
+
+        for item_id in item_ids - actual_ids:
+            self._tree.remove(item_id)
+            del self.item_id2item[item_id]
+            del self.item_id2item_class[item_id]
+
+        for item in items:
+            if item.id not in item_ids:
+                self.item_id2item[item.id] = item
+                self.item_id2item_class[item.id] = get_item_class_id(item)
+                self._tree.insert(self._convert_item_to_records(item, dt))
+
+            elif isinstance(item, (Ball, Platform)):
+                self._tree.update(
+                    item_id=item.id,
+                    records=self._convert_item_to_records(item, dt),
+                )
+
+        return actual_ids
+
+    def _convert_item_to_records(self, item: Item, dt: float) -> List[Record]:
+        return [
+            Record(
+                item_id=item.id,
+                class_id=self.item_id2item_class[item.id],
+                shape=shape,
+                bounding_box=shape.bounding_box,
+            )
+            for shape in item.get_ghost_trace(dt)
+        ]
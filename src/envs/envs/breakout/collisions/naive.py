@@ -1,5 +1,7 @@
-from itertools import combinations, product
-from typing import Iterable, List
+from itertools import product
+from typing import Iterable, List, Tuple
+
+import numpy as np
 
 from envs.breakout.dtos import (
     Ball,
@@ -14,15 +16,18 @@ from envs.breakout.dtos import (
     Wall,
 )
 from envs.breakout.state import BreakoutState
+from geometry import get_intersections_circle_circle
 
 from .cached_collection import CachedCollection
 from .legacy_collision import (
+    EPS,
     calculate_ball_block_colls,
     calculate_ball_platform_colls,
     calculate_ball_wall_colls,
     calculate_platform_wall_colls,
 )
 from .precise import calculate_ball_ball_colls
+from .session import StateCollisionQuerySession
 
 
 class NaiveCollisionDetectionEngine:
@@ -39,6 +44,18 @@ class NaiveCollisionDetectionEngine:
             )
         )
 
+    def create_query_session(
+        self, state: BreakoutState, max_dt: float
+    ) -> StateCollisionQuerySession:
+        return StateCollisionQuerySession(
+            engine=self,
+            state=state,
+            max_dt=max_dt,
+        )
+
+    def close(self) -> None:
+        pass
+
     def calculate_colls(
         self,
         walls: List[Wall],
@@ -56,7 +73,7 @@ class NaiveCollisionDetectionEngine:
     def calculate_balls_balls_colls(
         self, balls: List[Ball], dt: float
     ) -> Iterable[CollisionBallBall]:
-        for ball1, ball2 in combinations(balls, 2):
+        for ball1, ball2 in self._generate_close_ball_pairs(balls, dt):
             coll = calculate_ball_ball_colls(ball1, ball2, dt)
 
             if coll is not None:
@@ -65,7 +82,9 @@ class NaiveCollisionDetectionEngine:
     def calculate_balls_blocks_colls(
         self, balls: List[Ball], blocks: List[Block], dt: float
     ) -> Iterable[CollisionBallBlock]:
-        for ball, block in product(balls, blocks):
+        for ball, block in self._generate_close_ball_block_pairs(
+            balls, blocks, dt
+        ):
             yield from calculate_ball_block_colls(ball, block, dt)
 
     def calculate_balls_platforms_colls(
@@ -85,3 +104,64 @@ class NaiveCollisionDetectionEngine:
     ) -> Iterable[CollisionPlatformWall]:
         for platform, wall in product(platforms, walls):
             yield from calculate_platform_wall_colls(platform, wall, dt)
+
+    def _generate_close_ball_pairs(
+        self, balls: List[Ball], dt: float
+    ) -> Iterable[Tuple[Ball, Ball]]:
+        if len(balls) < 2:
+            return
+
+        starts = []
+        shifts = []
+        for ball in balls:
+            start, finish = ball.fake_update(dt)
+            shift = finish - start
+
+            starts.append([start.x, start.y])
+            shifts.append([shift.x, shift.y])
+
+        centers = np.array(starts) + np.array(shifts) / 2
+        reaches = np.linalg.norm(shifts, axis=1) / 2
+        radii = np.array([ball.radius for ball in balls])
+
+        idxs1, idxs2 = np.triu_indices(len(balls), k=1)
+        mask, _ = get_intersections_circle_circle(
+            centers_a=centers[idxs1],
+            radii_a=2 * radii[idxs1] + reaches[idxs1],
+            centers_b=centers[idxs2],
+            radii_b=reaches[idxs2] + EPS,
+        )
+
+        for idx in np.flatnonzero(mask):
+            yield balls[idxs1[idx]], balls[idxs2[idx]]
+
+    def _generate_close_ball_block_pairs(
+        self, balls: List[Ball], blocks: List[Block], dt: float
+    ) -> Iterable[Tuple[Ball, Block]]:
+        if not balls or not blocks:
+            return
+
+        ball_centers = np.array(
+            [[ball.rect.centerx, ball.rect.centery] for ball in balls]
+        )
+        ball_radii = np.array([ball.radius + ball.speed * dt for ball in balls])
+
+        block_centers = np.array(
+            [[block.rect.centerx, block.rect.centery] for block in blocks]
+        )
+        block_radii = np.array(
+            [
+                (block.rect.w**2 + block.rect.h**2) ** 0.5 / 2
+                for block in blocks
+            ]
+        )
+
+        mask, _ = get_intersections_circle_circle(
+            centers_a=np.repeat(ball_centers, len(blocks), axis=0),
+            radii_a=np.repeat(ball_radii, len(blocks)),
+            centers_b=np.tile(block_centers, (len(balls), 1)),
+            radii_b=np.tile(block_radii, len(balls)) + 2 * EPS,
+        )
+
+        for idx in np.flatnonzero(mask):
+            yield balls[idx // len(blocks)], blocks[idx % len(blocks)]
@@ -0,0 +1,307 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum, auto
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Mapping, Set, Tuple, cast
+
+from envs.breakout.dtos import (
+    Ball,
+    Block,
+    Collision,
+    CollisionBallBall,
+    CollisionBallBlock,
+    CollisionBallPlatform,
+    CollisionBallWall,
+    CollisionPlatformWall,
+    Item,
+    Platform,
+    Wall,
+)
+from envs.breakout.state import BreakoutState
+from geometry import (
+    ClassId,
+    IntersactionInfo,
+    ItemId,
+    Record,
+    generate_item_records_intersections,
+)
+
+from .cached_collection import CachedCollection
+from .precise import calculate_ball_ball_colls
+
+
+class ItemClass(Enum):
+    BALL = auto()
+    BLOCK = auto()
+    PLATFORM = auto()
+    WALL = auto()
+
+
+STATIC_CLASS_IDS = {ItemClass.BLOCK.value, ItemClass.WALL.value}
+
+
+def get_item_class_id(item: Item) -> ClassId:
+    if isinstance(item, Ball):
+        return ItemClass.BALL.value
+
+    elif isinstance(item, Block):
+        return ItemClass.BLOCK.value
+
+    elif isinstance(item, Platform):
+        return ItemClass.PLATFORM.value
+
+    elif isinstance(item, Wall):
+        return ItemClass.WALL.value
+
+    raise NotImplementedError
+
+
+class ItemRecords:
+    def __init__(self, items: Iterable[Item], dt: float) -> None:
+        self.items: List[Item] = list(items)
+
+        self.item_id2item = {item.id: item for item in self.items}
+        self.item_id2item_class = {
+            item.id: get_item_class_id(item) for item in self.items
+        }
+        self.records = [
+            Record(
+                item_id=item.id,
+                class_id=self.item_id2item_class[item.id],
+                shape=shape,
+                bounding_box=shape.bounding_box,
+            )
+            for item in self.items
+            for shape in item.get_ghost_trace(dt)
+        ]
+
+
+class StaticItemRecords(ItemRecords):
+    def __init__(self, state: BreakoutState) -> None:
+        super().__init__(items=chain(state.blocks, state.walls), dt=0.0)
+
+        self._version = state.static_version
+
+    def is_actual(self, state: BreakoutState) -> bool:
+        return self._version == state.static_version and len(self.items) == len(
+            state.blocks
+        ) + len(state.walls)
+
+
+@dataclass
+class StepIntersactions:
+    intersactions: Iterable[IntersactionInfo]
+    item_id2item_class: Mapping[ItemId, ClassId]
+    item_id2item: Mapping[ItemId, Item]
+
+
+class RecordCollisionDetectionEngine(ABC):
+    def __init__(self) -> None:
+        self.collidable_pairs = {
+            (ItemClass.BALL.value, ItemClass.BALL.value),
+            (ItemClass.BALL.value, ItemClass.BLOCK.value),
+            (ItemClass.BALL.value, ItemClass.PLATFORM.value),
+            (ItemClass.BALL.value, ItemClass.WALL.value),
+            (ItemClass.PLATFORM.value, ItemClass.WALL.value),
+        }
+
+    def generate_step_collisions(
+        self, state: BreakoutState, dt: float
+    ) -> Iterable[Collision]:
+        return CachedCollection(self._generate_step_collisions(state, dt))
+
+    def create_query_session(
+        self, state: BreakoutState, max_dt: float
+    ) -> "RecordCollisionQuerySession":
+        return RecordCollisionQuerySession(
+            engine=self,
+            state=state,
+            max_dt=max_dt,
+        )
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "RecordCollisionDetectionEngine":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @abstractmethod
+    def get_step_intersactions(
+        self, state: BreakoutState, dt: float
+    ) -> StepIntersactions:
+        pass
+
+    def convert_intersactions_to_collisions(
+        self,
+        intersactions: Iterable[IntersactionInfo],
+        dt: float,
+        item_id2item_class: Mapping[ItemId, ClassId],
+        item_id2item: Mapping[ItemId, Item],
+    ) -> Iterable[Collision]:
+        for intersaction in intersactions:
+            yield from self._convert_intersaction_to_collision(
+                intersaction=intersaction,
+                dt=dt,
+                item_id2item_class=item_id2item_class,
+                item_id2item=item_id2item,
+            )
+
+    def _generate_step_collisions(
+        self, state: BreakoutState, dt: float
+    ) -> Iterable[Collision]:
+        step = self.get_step_intersactions(state, dt)
+
+        yield from self.convert_intersactions_to_collisions(
+            intersactions=step.intersactions,
+            dt=dt,
+            item_id2item_class=step.item_id2item_class,
+            item_id2item=step.item_id2item,
+        )
+
+    def _convert_intersaction_to_collision(
+        self,
+        intersaction: IntersactionInfo,
+        dt: float,
+        item_id2item_class: Mapping[ItemId, ClassId],
+        item_id2item: Mapping[ItemId, Item],
+    ) -> Iterable[Collision]:
+        (item_id1, item_id2), point = intersaction
+
+        class_id1 = item_id2item_class[item_id1]
+        class_id2 = item_id2item_class[item_id2]
+
+        if (
+            class_id1 == ItemClass.BALL.value
+            and class_id2 == ItemClass.BALL.value
+        ):
+
+            ball1 = cast(Ball, item_id2item[item_id1])
+            ball2 = cast(Ball, item_id2item[item_id2])
+
+            coll = calculate_ball_ball_colls(ball1, ball2, dt)
+
+            if coll is not None:
+                yield CollisionBallBall(
+                    point=point,
+                    ball1=ball1,
+                    ball2=ball2,
+                )
+
+        elif (
+            class_id1 == ItemClass.BALL.value
+            and class_id2 == ItemClass.BLOCK.value
+        ):
+            yield CollisionBallBlock(
+                point=point,
+                ball=cast(Ball, item_id2item[item_id1]),
+                block=cast(Block, item_id2item[item_id2]),
+            )
+
+        elif (
+            class_id1 == ItemClass.BALL.value
+            and class_id2 == ItemClass.PLATFORM.value
+        ):
+            yield CollisionBallPlatform(
+                point=point,
+                ball=cast(Ball, item_id2item[item_id1]),
+                platform=cast(Platform, item_id2item[item_id2]),
+            )
+
+        elif (
+            class_id1 == ItemClass.BALL.value
+            and class_id2 == ItemClass.WALL.value
+        ):
+            yield CollisionBallWall(
+                point=point,
+                ball=cast(Ball, item_id2item[item_id1]),
+                wall=cast(Wall, item_id2item[item_id2]),
+            )
+
+        elif (
+            class_id1 == ItemClass.PLATFORM.value
+            and class_id2 == ItemClass.WALL.value
+        ):
+            yield CollisionPlatformWall(
+                point=point,
+                platform=cast(Platform, item_id2item[item_id1]),
+                wall=cast(Wall, item_id2item[item_id2]),
+            )
+
+        else:
+            raise NotImplementedError
+
+
+class RecordCollisionQuerySession:
+    def __init__(
+        self,
+        engine: RecordCollisionDetectionEngine,
+        state: BreakoutState,
+        max_dt: float,
+    ) -> None:
+        self._engine = engine
+        self._state = state
+        self._max_dt = max_dt
+        self._elapsed = 0.0
+
+        step = engine.get_step_intersactions(state, max_dt)
+
+        self._item_id2item_class = step.item_id2item_class
+        self._item_id2item = step.item_id2item
+        self._item_pairs: List[Tuple[ItemId, ItemId]] = list(
+            dict.fromkeys(item_ids for item_ids, _ in step.intersactions)
+        )
+
+    def advance(self, dt: float) -> None:
+        self._elapsed += dt
+
+    def generate_step_collisions(self, dt: float) -> Iterable[Collision]:
+        if self._elapsed + dt > self._max_dt:
+            return self._engine.generate_step_collisions(self._state, dt)
+
+        return CachedCollection(self._generate_step_collisions(dt))
+
+    def _generate_step_collisions(self, dt: float) -> Iterable[Collision]:
+        item_pairs = self._get_actual_item_pairs()
+        if not item_pairs:
+            return
+
+        item_ids = {item_id for item_ids in item_pairs for item_id in item_ids}
+        item_records = ItemRecords(
+            items=[self._item_id2item[item_id] for item_id in item_ids],
+            dt=dt,
+        )
+
+        item_id2records: Dict[ItemId, List[Record]] = {
+            item_id: [] for item_id in item_ids
+        }
+        for record in item_records.records:
+            item_id2records[record.item_id].append(record)
+
+        yield from self._engine.convert_intersactions_to_collisions(
+            intersactions=generate_item_records_intersections(
+                item_id2records=item_id2records,
+                item_pairs=item_pairs,
+                collidable_pairs=self._engine.collidable_pairs,
+            ),
+            dt=dt,
+            item_id2item_class=self._item_id2item_class,
+            item_id2item=self._item_id2item,
+        )
+
+    def _get_actual_item_pairs(self) -> List[Tuple[ItemId, ItemId]]:
+        dynamic_ids: Set[ItemId] = {
+            item.id for item in chain(self._state.balls, self._state.platforms)
+        }
+
+        return [
+            item_ids
+            for item_ids in self._item_pairs
+            if all(
+                item_id in dynamic_ids
+                or self._item_id2item_class[item_id] in STATIC_CLASS_IDS
+                for item_id in item_ids
+            )
+        ]
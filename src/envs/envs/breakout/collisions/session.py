@@ -0,0 +1,92 @@
+from typing import Dict, Iterable, Mapping
+
+from envs.breakout.dtos import (
+    Ball,
+    Block,
+    Collision,
+    Item,
+    ItemId,
+    Platform,
+    Wall,
+)
+from envs.breakout.protocols import ICollisionDetectorEngine
+from envs.breakout.state import BreakoutState
+
+
+class StateCollisionQuerySession:
+    def __init__(
+        self,
+        engine: ICollisionDetectorEngine,
+        state: BreakoutState,
+        max_dt: float,
+    ) -> None:
+        self._engine = engine
+        self._state = state
+        self._max_dt = max_dt
+        self._elapsed = 0.0
+
+        self._substate = build_collided_state(
+            state=state,
+            colls=engine.generate_step_collisions(state, max_dt),
+        )
+
+    def advance(self, dt: float) -> None:
+        self._elapsed += dt
+
+        ball_ids = {ball.id for ball in self._state.balls}
+        self._substate.balls = [
+            ball for ball in self._substate.balls if ball.id in ball_ids
+        ]
+
+    def generate_step_collisions(self, dt: float) -> Iterable[Collision]:
+        if self._elapsed + dt > self._max_dt:
+            return self._engine.generate_step_collisions(self._state, dt)
+
+        return self._engine.generate_step_collisions(self._substate, dt)
+
+
+def build_collided_state(
+    state: BreakoutState, colls: Iterable[Collision]
+) -> BreakoutState:
+    index = build_index(state)
+    substate = BreakoutState()
+
+    collided_ids = set()
+    for coll in colls:
+        for item_idx in coll.item_ids:
+            collided_ids.add(item_idx)
+
+    for item_idx in collided_ids:
+        item = index[item_idx]
+
+        if isinstance(item, Ball):
+            substate.balls.append(item)
+
+        elif isinstance(item, Platform):
+            substate.platforms.append(item)
+
+        elif isinstance(item, Block):
+            substate.blocks.append(item)
+
+        elif isinstance(item, Wall):
+            substate.walls.append(item)
+
+    return substate
+
+
+def build_index(state: BreakoutState) -> Mapping[ItemId, Item]:
+    index: Dict[ItemId, Item] = dict()
+
+    for wall in state.walls:
+        index[wall.id] = wall
+
+    for ball in state.balls:
+        index[ball.id] = ball
+
+    for platform in state.platforms:
+        index[platform.id] = platform
+
+    for block in state.blocks:
+        index[block.id] = block
+
+    return index
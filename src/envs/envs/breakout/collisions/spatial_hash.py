@@ -0,0 +1,79 @@
+from collections import ChainMap
+from itertools import chain
+from typing import Optional
+
+from envs.breakout.state import BreakoutState
+from geometry import SpatialHashGrid
+
+from .records import (
+    ItemRecords,
+    RecordCollisionDetectionEngine,
+    StaticItemRecords,
+    StepIntersactions,
+)
+from .state_cache import StateCache
+
+
+class SpatialHashCollisionDetectionEngine(RecordCollisionDetectionEngine):
+    def __init__(self, cell_size: Optional[float] = None) -> None:
+        super().__init__()
+
+        self._cell_size = cell_size
+        self._static_indices: StateCache[SpatialHashStaticIndex] = StateCache()
+
+    def get_step_intersactions(
+        self, state: BreakoutState, dt: float
+    ) -> StepIntersactions:
+        static_index = self._get_static_index(state)
+
+        dynamic_items = ItemRecords(
+            items=chain(state.balls, state.platforms),
+            dt=dt,
+        )
+        grid = SpatialHashGrid(
+            records=dynamic_items.records,
+            cell_size=self._cell_size,
+        )
+
+        intersactions = chain(
+            grid.generate_colliding_items(self.collidable_pairs),
+            static_index.grid.generate_records_intersections(
+                records=dynamic_items.records,
+                collidable_pairs=self.collidable_pairs,
+            ),
+        )
+
+        return StepIntersactions(
+            intersactions=intersactions,
+            item_id2item_class=ChainMap(
+                dynamic_items.item_id2item_class,
+                static_index.item_id2item_class,
+            ),
+            item_id2item=ChainMap(
+                dynamic_items.item_id2item,
+                static_index.item_id2item,
+            ),
+        )
+
+    def _get_static_index(
+        self, state: BreakoutState
+    ) -> "SpatialHashStaticIndex":
+        static_index = self._static_indices.get(state)
+
+        if static_index is None or not static_index.is_actual(state):
+            static_index = SpatialHashStaticIndex(
+                state=state,
+                cell_size=self._cell_size,
+            )
+            self._static_indices.set(state, static_index)
+
+        return static_index
+
+
+class SpatialHashStaticIndex(StaticItemRecords):
+    def __init__(
+        self, state: BreakoutState, cell_size: Optional[float] = None
+    ) -> None:
+        super().__init__(state)
+
+        self.grid = SpatialHashGrid(records=self.records, cell_size=cell_size)
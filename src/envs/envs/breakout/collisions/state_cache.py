@@ -0,0 +1,32 @@
+import weakref
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
+
+from envs.breakout.state import BreakoutState
+
+T = TypeVar("T")
+
+
+class StateCache(Generic[T]):
+    def __init__(self) -> None:
+        self._state_id2value: Dict[int, Tuple[Any, T]] = {}
+
+    def get(self, state: BreakoutState) -> Optional[T]:
+        entry = self._state_id2value.get(id(state))
+        if entry is None:
+            return None
+
+        state_ref, value = entry
+        if state_ref() is not state:
+            return None
+
+        return value
+
+    def set(self, state: BreakoutState, value: T) -> None:
+        state_id = id(state)
+
+        def remove(state_ref: Any) -> None:
+            entry = self._state_id2value.get(state_id)
+            if entry is not None and entry[0] is state_ref:
+                del self._state_id2value[state_id]
+
+        self._state_id2value[state_id] = (weakref.ref(state, remove), value)
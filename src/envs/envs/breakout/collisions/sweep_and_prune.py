@@ -0,0 +1,58 @@
+from collections import ChainMap
+from itertools import chain
+
+from envs.breakout.state import BreakoutState
+from geometry import SweepAndPrune
+
+from .records import (
+    ItemRecords,
+    RecordCollisionDetectionEngine,
+    StaticItemRecords,
+    StepIntersactions,
+)
+from .state_cache import StateCache
+
+
+class SweepAndPruneCollisionDetectionEngine(RecordCollisionDetectionEngine):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._static_items: StateCache[StaticItemRecords] = StateCache()
+        self._sweeps: StateCache[SweepAndPrune] = StateCache()
+
+    def get_step_intersactions(
+        self, state: BreakoutState, dt: float
+    ) -> StepIntersactions:
+        static_items = self._get_static_items(state)
+        dynamic_items = ItemRecords(
+            items=chain(state.balls, state.platforms),
+            dt=dt,
+        )
+
+        sweep = self._sweeps.get(state)
+        if sweep is None:
+            sweep = SweepAndPrune()
+            self._sweeps.set(state, sweep)
+
+        sweep.update(static_items.records + dynamic_items.records)
+
+        return StepIntersactions(
+            intersactions=sweep.generate_colliding_items(self.collidable_pairs),
+            item_id2item_class=ChainMap(
+                dynamic_items.item_id2item_class,
+                static_items.item_id2item_class,
+            ),
+            item_id2item=ChainMap(
+                dynamic_items.item_id2item,
+                static_items.item_id2item,
+            ),
+        )
+
+    def _get_static_items(self, state: BreakoutState) -> StaticItemRecords:
+        static_items = self._static_items.get(state)
+
+        if static_items is None or not static_items.is_actual(state):
+            static_items = StaticItemRecords(state)
+            self._static_items.set(state, static_items)
+
+        return static_items
@@ -0,0 +1,168 @@
+from typing import Optional
+
+from envs.breakout.constants import EPS
+from envs.breakout.dtos import (
+    Ball,
+    Collision,
+    CollisionBallBall,
+    CollisionBallBlock,
+    CollisionBallPlatform,
+    CollisionBallWall,
+    CollisionPlatformWall,
+    Platform,
+)
+from geometry import (
+    Circle,
+    Point,
+    Rectangle,
+    get_time_of_impact_circle_rectangle,
+    get_time_of_impact_point_circle,
+    get_time_of_impact_rectangle_rectangle,
+)
+
+
+def calculate_collision_toi(coll: Collision, dt: float) -> Optional[float]:
+    if isinstance(coll, CollisionBallBall):
+        return calculate_ball_ball_toi(coll.ball1, coll.ball2, dt)
+
+    elif isinstance(coll, CollisionBallBlock):
+        return calculate_ball_rect_toi(coll.ball, coll.block.rect, dt)
+
+    elif isinstance(coll, CollisionBallWall):
+        return calculate_ball_rect_toi(coll.ball, coll.wall.rect, dt)
+
+    elif isinstance(coll, CollisionBallPlatform):
+        return calculate_ball_platform_toi(coll.ball, coll.platform, dt)
+
+    elif isinstance(coll, CollisionPlatformWall):
+        return calculate_platform_rect_toi(coll.platform, coll.wall.rect, dt)
+
+    return None
+
+
+def calculate_ball_ball_toi(
+    ball1: Ball, ball2: Ball, dt: float
+) -> Optional[float]:
+    s1, f1 = ball1.fake_update(dt)
+    s2, f2 = ball2.fake_update(dt)
+
+    u = get_time_of_impact_point_circle(
+        start=s1,
+        shift=(f1 - s1) - (f2 - s2),
+        circle=Circle(
+            center=s2,
+            radius=ball1.radius + ball2.radius - EPS,
+        ),
+    )
+
+    if u is None:
+        return None
+
+    return u * dt
+
+
+def calculate_ball_rect_toi(
+    ball: Ball, rect: Rectangle, dt: float
+) -> Optional[float]:
+    start, finish = ball.fake_update(dt)
+
+    u = get_time_of_impact_circle_rectangle(
+        c=Circle(center=start, radius=ball.radius),
+        shift=finish - start,
+        rect=rect,
+    )
+
+    if u is None:
+        return None
+
+    return u * dt
+
+
+def calculate_ball_platform_toi(
+    ball: Ball, platform: Platform, dt: float
+) -> Optional[float]:
+    frozen_dt = min(dt, platform.rest_freeze_time)
+
+    if frozen_dt > 0:
+        toi = calculate_ball_rect_toi(ball, platform.rect, frozen_dt)
+
+        if toi is not None:
+            return toi
+
+    moving_dt = dt - frozen_dt
+    if moving_dt <= 0:
+        return None
+
+    ball_velocity = ball.velocity * ball.speed
+    platform_velocity = platform.velocity * platform.speed
+
+    u = get_time_of_impact_circle_rectangle(
+        c=Circle(
+            center=ball.rect.center + ball_velocity * frozen_dt,
+            radius=ball.radius,
+        ),
+        shift=(ball_velocity - platform_velocity) * moving_dt,
+        rect=platform.rect,
+    )
+
+    if u is None:
+        return None
+
+    return frozen_dt + u * moving_dt
+
+
+def calculate_platform_rect_toi(
+    platform: Platform, rect: Rectangle, dt: float
+) -> Optional[float]:
+    frozen_dt = min(dt, platform.rest_freeze_time)
+    moving_dt = dt - frozen_dt
+    if moving_dt <= 0:
+        return None
+
+    u = get_time_of_impact_rectangle_rectangle(
+        a=platform.rect,
+        shift=platform.velocity * platform.speed * moving_dt,
+        b=rect,
+    )
+
+    if u is None:
+        return None
+
+    return frozen_dt + u * moving_dt
+
+
+def calculate_collision_point(coll: Collision) -> Point:
+    if isinstance(coll, CollisionBallBall):
+        return (coll.ball1.rect.center + coll.ball2.rect.center) / 2
+
+    elif isinstance(coll, CollisionBallBlock):
+        return calculate_ball_rect_point(coll.ball, coll.block.rect)
+
+    elif isinstance(coll, CollisionBallWall):
+        return calculate_ball_rect_point(coll.ball, coll.wall.rect)
+
+    elif isinstance(coll, CollisionBallPlatform):
+        return calculate_ball_rect_point(coll.ball, coll.platform.rect)
+
+    elif isinstance(coll, CollisionPlatformWall):
+        return calculate_rect_rect_point(coll.platform.rect, coll.wall.rect)
+
+    return coll.point
+
+
+def calculate_ball_rect_point(ball: Ball, rect: Rectangle) -> Point:
+    center = ball.rect.center
+
+    return Point(
+        x=min(max(center.x, rect.left), rect.right),
+        y=min(max(center.y, rect.top), rect.bottom),
+    )
+
+
+def calculate_rect_rect_point(a: Rectangle, b: Rectangle) -> Point:
+    left = max(a.left, b.left)
+    right = max(left, min(a.right, b.right))
+    top = max(a.top, b.top)
+    bottom = max(top, min(a.bottom, b.bottom))
+
+    return Point(x=(left + right) / 2, y=(top + bottom) / 2)
@@ -3,7 +3,7 @@ from typing import Iterable, Optional
 
 from envs.breakout.constants import EPS
 from envs.protocols import IGameItem
-from geometry import Circle, Point, Rectangle, Shape, Triangle, Vec2
+from geometry import Capsule, Circle, Rectangle, Shape, Vec2
 
 ItemId = int
 
@@ -14,22 +14,7 @@ class Item(IGameItem):
     rect: Rectangle
 
     def get_ghost_trace(self, dt: float) -> Iterable[Shape]:
-        return [
-            Triangle(
-                points=[
-                    Point(x=self.rect.left, y=self.rect.top),
-                    Point(x=self.rect.right, y=self.rect.top),
-                    Point(x=self.rect.left, y=self.rect.bottom),
-                ]
-            ),
-            Triangle(
-                points=[
-                    Point(x=self.rect.right, y=self.rect.bottom),
-                    Point(x=self.rect.right, y=self.rect.top),
-                    Point(x=self.rect.left, y=self.rect.bottom),
-                ]
-            ),
-        ]
+        return [self.rect.copy()]
 
 
 @dataclass
@@ -74,10 +59,11 @@ class Ball(Item):
 
     @property
     def direction(self) -> Vec2:
-        if self.speed < EPS:
+        speed = self.speed
+        if speed < EPS:
             return Vec2(x=1, y=0)
 
-        return self._velocity / self.speed
+        return self._velocity / speed
 
     @direction.setter
     def direction(self, value: Vec2) -> None:
@@ -93,7 +79,7 @@ class Ball(Item):
 
     def fake_update(self, dt):
         fake_rect = self.rect.copy()
-        fake_rect.center += self.velocity * self.speed * dt
+        fake_rect.move_ip(self.velocity * (self.speed * dt))
 
         return self.rect.center, fake_rect.center
 
@@ -106,43 +92,15 @@ class Ball(Item):
                 ),
             ]
 
-        vel = self.velocity
-        normal_vel = Vec2(x=vel.y, y=-vel.x)
-        scaled_normal_vel = normal_vel * self.radius
-
         start_center = self.rect.center
-
-        shift = vel * self.speed * dt
-        finish_center = start_center + shift
-
-        start_p1 = start_center + scaled_normal_vel
-        start_p2 = start_center - scaled_normal_vel
-        finish_p1 = finish_center + scaled_normal_vel
-        finish_p2 = finish_center - scaled_normal_vel
+        finish_center = start_center + self.velocity * (self.speed * dt)
 
         return [
-            Circle(
-                center=start_center,
-                radius=self.radius,
-            ),
-            Circle(
-                center=finish_center,
+            Capsule(
+                begin=start_center,
+                end=finish_center,
                 radius=self.radius,
             ),
-            Triangle(
-                points=[
-                    start_p1,
-                    start_p2,
-                    finish_p1,
-                ]
-            ),
-            Triangle(
-                points=[
-                    finish_p1,
-                    finish_p2,
-                    start_p2,
-                ]
-            ),
         ]
 
 
@@ -163,7 +121,7 @@ class Platform(Item):
         fake_rect = self.rect.copy()
 
         dt = max(0, dt - self.rest_freeze_time)
-        fake_rect.center += self.velocity * self.speed * dt
+        fake_rect.move_ip(self.velocity * (self.speed * dt))
 
         return [self.rect, fake_rect]
 
@@ -178,7 +136,7 @@ class Platform(Item):
 
         dt = max(0, dt - self.rest_freeze_time)
         finish_rect = self.rect.copy()
-        finish_rect.center += self.velocity * self.speed * dt
+        finish_rect.move_ip(self.velocity * (self.speed * dt))
 
         left = min(start_rect.left, finish_rect.left)
         right = max(start_rect.right, finish_rect.right)
@@ -186,19 +144,11 @@ class Platform(Item):
         bottom = max(start_rect.bottom, finish_rect.bottom)
 
         return [
-            Triangle(
-                points=[
-                    Point(x=left, y=top),
-                    Point(x=right, y=top),
-                    Point(x=left, y=bottom),
-                ]
-            ),
-            Triangle(
-                points=[
-                    Point(x=right, y=bottom),
-                    Point(x=right, y=top),
-                    Point(x=left, y=bottom),
-                ]
+            Rectangle(
+                left=left,
+                top=top,
+                width=right - left,
+                height=bottom - top,
             ),
         ]
 
@@ -22,6 +22,7 @@ from envs.protocols import IGameAction, IGameEnvironment
 from geometry import Point, Rectangle, Vec2
 from timeprofiler import profile
 
+from .array_state import ArrayBreakoutState
 from .state import BreakoutState
 
 
@@ -33,6 +34,7 @@ class BreakoutEnv(IGameEnvironment):
         level_builder: IBreakoutLevelBuilder,
         checking_gameover: bool = False,
         eps: float = 1e-3,
+        array_state: bool = False,
     ):
         self._env_rect = Rectangle(
             left=0,
@@ -43,6 +45,7 @@ class BreakoutEnv(IGameEnvironment):
 
         self._checking_gameover = checking_gameover
         self._eps = eps
+        self._array_state = array_state
 
         self._current_timestamp: float
         self._events: List[BreakoutEvent]
@@ -92,6 +95,9 @@ class BreakoutEnv(IGameEnvironment):
         self.import_state(state)
 
     def import_state(self, state: BreakoutState) -> None:
+        if self._array_state and not isinstance(state, ArrayBreakoutState):
+            state = ArrayBreakoutState.from_state(state)
+
         self._state = state
 
     def _is_gameover(self) -> bool:
@@ -118,19 +124,7 @@ class BreakoutEnv(IGameEnvironment):
             elif action.type == BreakoutActionType.NOTHING:
                 platform.velocity.x = 0
 
-        while dt > self._eps:
-            step_dt = self._collision_detector.get_time_before_collision(
-                self.state, dt
-            )
-            self._update(step_dt)
-
-            colls = self._collision_detector.get_step_collisions(
-                self.state, self._eps
-            )
-
-            self._perform_colls(colls)
-
-            dt -= step_dt
+        self._simulate(dt)
 
         # Проверки на конец игры
         if self._checking_gameover:
@@ -144,6 +138,26 @@ class BreakoutEnv(IGameEnvironment):
 
         return is_done
 
+    def _simulate(self, dt: float) -> None:
+        while dt > self._eps:
+            session = self._collision_detector.create_query_session(
+                self.state, dt + self._eps
+            )
+
+            step_dt = self._collision_detector.get_time_before_collision(
+                self.state, dt, session=session
+            )
+            self._update(step_dt)
+            session.advance(step_dt)
+
+            colls = self._collision_detector.get_step_collisions(
+                self.state, self._eps, session=session
+            )
+
+            self._perform_colls(colls)
+
+            dt -= step_dt
+
     def _perform_colls(self, colls: Iterable[Collision]) -> None:
         for coll in colls:
             self._perform_coll(coll)
@@ -171,7 +185,7 @@ class BreakoutEnv(IGameEnvironment):
 
             coll.block.health -= 1
             if coll.block.health <= 0:
-                self._blocks.remove(coll.block)
+                self.state.remove_block(coll.block)
 
         elif isinstance(coll, CollisionPlatformWall):
             coll.platform.velocity.x = 0
@@ -249,16 +263,23 @@ class BreakoutEnv(IGameEnvironment):
         self._update_balls(dt)
 
     def _update_platforms(self, dt: float) -> None:
+        if isinstance(self.state, ArrayBreakoutState):
+            self.state.update_platforms(dt)
+            return
+
         for platform in self._platforms:
             fdt = max(0, dt - platform.rest_freeze_time)
-            platform.rect.center += platform.velocity * platform.speed * fdt
+            platform.rect.move_ip(platform.velocity * (platform.speed * fdt))
             platform.rest_freeze_time = max(0, platform.rest_freeze_time - dt)
 
-    def _update_balls(self, dt: float) -> None:
+    def _update_balls(self, dt: float) -> List[Ball]:
+        if isinstance(self.state, ArrayBreakoutState):
+            return self.state.update_balls(dt, bottom=self._env_rect.bottom)
+
         removed_balls = []
         for ball in self._balls:
             if ball.thrown:
-                ball.rect.center += ball.velocity * ball.speed * dt
+                ball.rect.move_ip(ball.velocity * (ball.speed * dt))
             else:
                 for platform in self._platforms:
                     ball.rect.bottom = platform.rect.top
@@ -273,6 +294,8 @@ class BreakoutEnv(IGameEnvironment):
         for ball in removed_balls:
             self._balls.remove(ball)
 
+        return removed_balls
+
     def _throw_ball(self) -> None:
         for ball in self._balls:
             if not ball.thrown:
@@ -0,0 +1,233 @@
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Dict, List, Optional, Set, Tuple
+
+from envs.breakout.collisions.time_of_impact import (
+    calculate_collision_point,
+    calculate_collision_toi,
+)
+from envs.breakout.constants import EPS
+from envs.breakout.dtos import (
+    Ball,
+    Block,
+    Collision,
+    CollisionBallBall,
+    CollisionBallBlock,
+    CollisionBallPlatform,
+    CollisionBallWall,
+    CollisionPlatformWall,
+    Item,
+    ItemId,
+    Platform,
+    Wall,
+)
+from geometry import DynamicAABBTree, Record, Rectangle
+
+from .env import BreakoutEnv
+
+
+@dataclass(order=True)
+class PredictedCollision:
+    timestamp: float
+    order: int
+    collision: Collision = field(compare=False)
+    versions: Tuple[int, ...] = field(compare=False)
+
+
+class EventDrivenBreakoutEnv(BreakoutEnv):
+    def _simulate(self, dt: float) -> None:
+        self._now = 0.0
+        self._order = count()
+        self._predictions: List[PredictedCollision] = []
+        self._versions: Dict[ItemId, int] = defaultdict(int)
+        self._item_id2item: Dict[ItemId, Item] = {}
+        self._swept_index = DynamicAABBTree(margin=0.0)
+
+        for item in self.state.get_items():
+            self._item_id2item[item.id] = item
+            self._swept_index.insert(
+                item_id=item.id,
+                class_id=0,
+                records=[self._get_swept_record(item, dt)],
+            )
+
+        colls = self._collision_detector.get_step_collisions(self.state, dt)
+        for coll in colls:
+            self._predict(coll, dt)
+
+        while self._predictions:
+            prediction = heapq.heappop(self._predictions)
+
+            if not self._is_actual(prediction):
+                continue
+
+            self._update(prediction.timestamp - self._now)
+            self._now = prediction.timestamp
+
+            if not self._is_actual(prediction):
+                continue
+
+            coll = prediction.collision
+            coll.point = calculate_collision_point(coll)
+            self._perform_coll(coll)
+
+            self._repredict(coll, dt)
+
+        if dt > self._now:
+            self._update(dt - self._now)
+
+    def _perform_coll(self, coll: Collision) -> None:
+        super()._perform_coll(coll)
+
+        if isinstance(coll, CollisionBallBlock) and coll.block.health <= 0:
+            self._remove_alive_item(coll.block)
+
+    def _update_balls(self, dt: float) -> List[Ball]:
+        removed_balls = super()._update_balls(dt)
+
+        for ball in removed_balls:
+            self._remove_alive_item(ball)
+
+        return removed_balls
+
+    def _remove_alive_item(self, item: Item) -> None:
+        if self._item_id2item.pop(item.id, None) is not None:
+            self._swept_index.remove(item.id)
+
+    def _repredict(self, coll: Collision, dt: float) -> None:
+        items = [
+            item
+            for item in self._get_collided_items(coll)
+            if isinstance(item, (Ball, Platform))
+            and item.id in self._item_id2item
+        ]
+
+        for item in items:
+            self._versions[item.id] += 1
+            self._swept_index.move(
+                item.id, [self._get_swept_record(item, dt - self._now)]
+            )
+
+        predicted_ids: Set[ItemId] = set()
+        for item in items:
+            self._predict_item(item, dt, predicted_ids)
+            predicted_ids.add(item.id)
+
+    def _get_collided_items(self, coll: Collision) -> List[Item]:
+        if isinstance(coll, CollisionBallBall):
+            return [coll.ball1, coll.ball2]
+
+        elif isinstance(coll, CollisionBallBlock):
+            return [coll.ball, coll.block]
+
+        elif isinstance(coll, CollisionBallPlatform):
+            return [coll.ball, coll.platform]
+
+        elif isinstance(coll, CollisionBallWall):
+            return [coll.ball, coll.wall]
+
+        elif isinstance(coll, CollisionPlatformWall):
+            return [coll.platform, coll.wall]
+
+        return []
+
+    def _predict_item(
+        self, item: Item, dt: float, skipped_ids: Set[ItemId]
+    ) -> None:
+        bounds = self._swept_index.get_fat_bounds(item.id)
+
+        for other_id in self._swept_index.query(bounds):
+            if other_id == item.id or other_id in skipped_ids:
+                continue
+
+            other = self._item_id2item[other_id]
+            coll = self._build_candidate_collision(item, other)
+            if coll is None:
+                continue
+
+            self._predict(coll, dt)
+
+    def _predict(self, coll: Collision, dt: float) -> None:
+        toi = calculate_collision_toi(coll, dt - self._now)
+        if toi is None:
+            return
+
+        prediction = PredictedCollision(
+            timestamp=self._now + max(0.0, toi - EPS),
+            order=next(self._order),
+            collision=coll,
+            versions=tuple(self._versions[idx] for idx in coll.item_ids),
+        )
+        heapq.heappush(self._predictions, prediction)
+
+    def _is_actual(self, prediction: PredictedCollision) -> bool:
+        item_ids = prediction.collision.item_ids
+
+        for item_id, version in zip(item_ids, prediction.versions):
+            if item_id not in self._item_id2item:
+                return False
+
+            if self._versions[item_id] != version:
+                return False
+
+        return True
+
+    def _get_swept_record(self, item: Item, dt: float) -> Record:
+        swept_box = self._get_swept_box(item, dt)
+
+        return Record(
+            item_id=item.id,
+            class_id=0,
+            shape=swept_box,
+            bounding_box=swept_box,
+        )
+
+    def _get_swept_box(self, item: Item, dt: float) -> Rectangle:
+        if isinstance(item, Ball):
+            start_rect = item.rect.copy()
+            finish_rect = item.rect.copy()
+            finish_rect.move_ip(item.velocity * (item.speed * dt))
+
+            return start_rect.union(finish_rect)
+
+        elif isinstance(item, Platform):
+            start_rect, finish_rect = item.fake_update(dt)
+
+            return start_rect.union(finish_rect)
+
+        return item.rect
+
+    def _build_candidate_collision(
+        self, item: Item, other: Item
+    ) -> Optional[Collision]:
+        point = item.rect.center
+
+        if isinstance(item, Ball):
+            if isinstance(other, Ball):
+                return CollisionBallBall(point=point, ball1=item, ball2=other)
+
+            elif isinstance(other, Block):
+                return CollisionBallBlock(point=point, ball=item, block=other)
+
+            elif isinstance(other, Platform):
+                return CollisionBallPlatform(
+                    point=point, ball=item, platform=other
+                )
+
+            elif isinstance(other, Wall):
+                return CollisionBallWall(point=point, ball=item, wall=other)
+
+        elif isinstance(item, Platform):
+            if isinstance(other, Ball):
+                return CollisionBallPlatform(
+                    point=point, ball=other, platform=item
+                )
+
+            elif isinstance(other, Wall):
+                return CollisionPlatformWall(
+                    point=point, platform=item, wall=other
+                )
+
+        return None
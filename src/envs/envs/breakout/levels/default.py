@@ -40,7 +40,7 @@ class DefaultLevelBuilder(ILevelBuilder):
     def build(self) -> BreakoutState:
         self._make_walls()
 
-        self._item_manager.create_ball(
+        ball = self._item_manager.create_ball(
             radius=self._ball_radius,
             speed=self._ball_speed,
         )
@@ -52,6 +52,9 @@ class DefaultLevelBuilder(ILevelBuilder):
         )
         self._center_platform(platform)
 
+        ball.rect.bottom = platform.rect.top
+        ball.rect.centerx = platform.rect.centerx
+
         self._make_target_wall()
 
         return self._item_manager.extract_state()
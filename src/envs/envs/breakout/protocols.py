@@ -1,4 +1,4 @@
-from typing import Iterable, List, Protocol
+from typing import Iterable, List, Optional, Protocol
 
 from envs.protocols import ILevelBuilder
 
@@ -6,17 +6,39 @@ from .dtos import Collision
 from .state import BreakoutState
 
 
+class ICollisionQuerySession(Protocol):
+    def advance(self, dt: float) -> None:
+        pass
+
+    def generate_step_collisions(self, dt: float) -> Iterable[Collision]:
+        pass
+
+
 class ICollisionDetector(Protocol):
+    def create_query_session(
+        self, state: BreakoutState, max_dt: float
+    ) -> ICollisionQuerySession:
+        pass
+
     def get_step_collisions(
-        self, state: BreakoutState, dt: float
+        self,
+        state: BreakoutState,
+        dt: float,
+        session: Optional[ICollisionQuerySession] = None,
     ) -> List[Collision]:
         pass
 
     def get_time_before_collision(
-        self, state: BreakoutState, max_dt: float
+        self,
+        state: BreakoutState,
+        max_dt: float,
+        session: Optional[ICollisionQuerySession] = None,
     ) -> float:
         pass
 
+    def close(self) -> None:
+        pass
+
 
 class ICollisionDetectorEngine(Protocol):
     def generate_step_collisions(
@@ -24,6 +46,14 @@ class ICollisionDetectorEngine(Protocol):
     ) -> Iterable[Collision]:
         pass
 
+    def create_query_session(
+        self, state: BreakoutState, max_dt: float
+    ) -> ICollisionQuerySession:
+        pass
+
+    def close(self) -> None:
+        pass
+
 
 class IBreakoutLevelBuilder(ILevelBuilder, Protocol):
     def build(self) -> BreakoutState:
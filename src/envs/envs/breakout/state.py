@@ -12,12 +12,18 @@ class BreakoutState:
     platforms: List[Platform] = field(default_factory=list)
     walls: List[Wall] = field(default_factory=list)
 
+    static_version: int = 0
+
     def get_items(self) -> Iterable[Item]:
         yield from self.balls
         yield from self.blocks
         yield from self.platforms
         yield from self.walls
 
+    def remove_block(self, block: Block) -> None:
+        self.blocks.remove(block)
+        self.static_version += 1
+
     def copy(self) -> "BreakoutState":
         balls = [deepcopy(ball) for ball in self.balls]
         blocks = [deepcopy(block) for block in self.blocks]
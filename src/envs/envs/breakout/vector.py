@@ -0,0 +1,560 @@
+import multiprocessing as mp
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from envs.breakout.dtos import (
+    BreakoutAction,
+    BreakoutCollisionEvent,
+    BreakoutEvent,
+    CollisionBallBlock,
+)
+
+from .env import BreakoutEnv
+from .state import BreakoutState
+
+BreakoutEnvFactory = Callable[[], BreakoutEnv]
+
+
+class VectorBackendType(Enum):
+    SYNC = "sync"
+    SUBPROCESS = "subprocess"
+
+
+@dataclass
+class BreakoutObservation:
+    platforms: np.ndarray
+    balls: np.ndarray
+    blocks: np.ndarray
+
+    def __getitem__(self, idx: Any) -> "BreakoutObservation":
+        return BreakoutObservation(
+            platforms=self.platforms[idx],
+            balls=self.balls[idx],
+            blocks=self.blocks[idx],
+        )
+
+    def copy(self) -> "BreakoutObservation":
+        return BreakoutObservation(
+            platforms=self.platforms.copy(),
+            balls=self.balls.copy(),
+            blocks=self.blocks.copy(),
+        )
+
+
+VectorStepResult = Tuple[BreakoutObservation, np.ndarray, np.ndarray]
+
+
+class BreakoutObserver:
+    platform_features = 4
+    ball_features = 5
+    block_features = 4
+
+    def __init__(
+        self, max_balls: int, max_blocks: int, max_platforms: int = 1
+    ) -> None:
+        self.max_balls = max_balls
+        self.max_blocks = max_blocks
+        self.max_platforms = max_platforms
+
+    @classmethod
+    def from_states(cls, states: Sequence[BreakoutState]) -> "BreakoutObserver":
+        return cls(
+            max_balls=max(len(state.balls) for state in states),
+            max_blocks=max(len(state.blocks) for state in states),
+            max_platforms=max(len(state.platforms) for state in states),
+        )
+
+    @classmethod
+    def from_env_fns(
+        cls, env_fns: Sequence[BreakoutEnvFactory]
+    ) -> "BreakoutObserver":
+        states = []
+        for env_fn in env_fns:
+            env = env_fn()
+            env.reset()
+            states.append(env.state)
+
+        return cls.from_states(states)
+
+    def observe(self, state: BreakoutState) -> BreakoutObservation:
+        observation = BreakoutObservation(
+            platforms=np.zeros((self.max_platforms, self.platform_features)),
+            balls=np.zeros((self.max_balls, self.ball_features)),
+            blocks=np.zeros((self.max_blocks, self.block_features)),
+        )
+        self.observe_into(state, observation)
+
+        return observation
+
+    def observe_into(
+        self, state: BreakoutState, observation: BreakoutObservation
+    ) -> None:
+        observation.platforms[:] = 0.0
+        observation.balls[:] = 0.0
+        observation.blocks[:] = 0.0
+
+        for idx, platform in enumerate(state.platforms[: self.max_platforms]):
+            observation.platforms[idx] = [
+                1.0,
+                platform.rect.centerx,
+                platform.rect.centery,
+                platform.velocity.x * platform.speed,
+            ]
+
+        for idx, ball in enumerate(state.balls[: self.max_balls]):
+            velocity = ball.velocity * ball.speed
+            observation.balls[idx] = [
+                1.0,
+                ball.rect.centerx,
+                ball.rect.centery,
+                velocity.x,
+                velocity.y,
+            ]
+
+        for idx, block in enumerate(state.blocks[: self.max_blocks]):
+            observation.blocks[idx] = [
+                1.0,
+                block.rect.centerx,
+                block.rect.centery,
+                block.health,
+            ]
+
+
+class VectorBuffer:
+    platforms: np.ndarray
+    balls: np.ndarray
+    blocks: np.ndarray
+    rewards: np.ndarray
+    dones: np.ndarray
+
+    def __init__(self, num_envs: int, observer: BreakoutObserver) -> None:
+        self.num_envs = num_envs
+        self.observer = observer
+
+        self._bind(np.zeros(self.nbytes, dtype=np.uint8).data)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            int(np.prod(shape)) * np.dtype(dtype).itemsize
+            for shape, dtype in self._layout
+        )
+
+    @property
+    def observation(self) -> BreakoutObservation:
+        return BreakoutObservation(
+            platforms=self.platforms,
+            balls=self.balls,
+            blocks=self.blocks,
+        )
+
+    @property
+    def _layout(self) -> List[Tuple[Tuple[int, ...], Any]]:
+        observer = self.observer
+
+        return [
+            (
+                (
+                    self.num_envs,
+                    observer.max_platforms,
+                    observer.platform_features,
+                ),
+                np.float64,
+            ),
+            (
+                (self.num_envs, observer.max_balls, observer.ball_features),
+                np.float64,
+            ),
+            (
+                (self.num_envs, observer.max_blocks, observer.block_features),
+                np.float64,
+            ),
+            ((self.num_envs,), np.float64),
+            ((self.num_envs,), np.bool_),
+        ]
+
+    def _bind(self, buffer: Any) -> None:
+        arrays = []
+        offset = 0
+        for shape, dtype in self._layout:
+            array: np.ndarray = np.ndarray(
+                shape, dtype=dtype, buffer=buffer, offset=offset
+            )
+            arrays.append(array)
+            offset += array.nbytes
+
+        (
+            self.platforms,
+            self.balls,
+            self.blocks,
+            self.rewards,
+            self.dones,
+        ) = arrays
+
+
+class SharedVectorBuffer(VectorBuffer):
+    def __init__(
+        self,
+        num_envs: int,
+        observer: BreakoutObserver,
+        name: Optional[str] = None,
+    ) -> None:
+        self.num_envs = num_envs
+        self.observer = observer
+
+        self._is_owner = name is None
+        self._shared_memory = SharedMemory(
+            name=name,
+            create=self._is_owner,
+            size=self.nbytes,
+        )
+
+        self._bind(self._shared_memory.buf)
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    def __reduce__(self) -> Any:
+        return (
+            SharedVectorBuffer,
+            (self.num_envs, self.observer, self.name),
+        )
+
+    def close(self) -> None:
+        del self.platforms, self.balls, self.blocks, self.rewards, self.dones
+
+        if self._is_owner:
+            self._shared_memory.unlink()
+
+        try:
+            self._shared_memory.close()
+        except BufferError:
+            pass
+
+
+class SyncVectorBackend:
+    def __init__(
+        self,
+        env_fns: Sequence[BreakoutEnvFactory],
+        observer: BreakoutObserver,
+        auto_reset: bool = True,
+    ) -> None:
+        self.envs = [env_fn() for env_fn in env_fns]
+
+        self._observer = observer
+        self._auto_reset = auto_reset
+        self._buffer = VectorBuffer(num_envs=len(self.envs), observer=observer)
+
+    def reset(self) -> BreakoutObservation:
+        self.reset_into(self._buffer.observation)
+
+        return self._buffer.observation
+
+    def reset_into(self, observation: BreakoutObservation) -> None:
+        for env in self.envs:
+            env.reset()
+
+        self._observe_into(observation)
+
+    def step(
+        self, actions: Sequence[BreakoutAction], dt: float
+    ) -> VectorStepResult:
+        self.step_into(
+            actions=actions,
+            dt=dt,
+            observation=self._buffer.observation,
+            rewards=self._buffer.rewards,
+            dones=self._buffer.dones,
+        )
+
+        return (
+            self._buffer.observation,
+            self._buffer.rewards,
+            self._buffer.dones,
+        )
+
+    def step_into(
+        self,
+        actions: Sequence[BreakoutAction],
+        dt: float,
+        observation: BreakoutObservation,
+        rewards: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        for idx, (env, action) in enumerate(zip(self.envs, actions)):
+            had_blocks = len(env.state.blocks) > 0
+
+            env.step(action, dt)
+
+            rewards[idx] = _count_destroyed_blocks(env.pop_events())
+            dones[idx] = not env.state.balls or (
+                had_blocks and not env.state.blocks
+            )
+
+            if dones[idx] and self._auto_reset:
+                env.reset()
+
+        self._observe_into(observation)
+
+    def close(self) -> None:
+        pass
+
+    def _observe_into(self, observation: BreakoutObservation) -> None:
+        for idx, env in enumerate(self.envs):
+            self._observer.observe_into(env.state, observation[idx])
+
+
+class SubprocessVectorBackend:
+    def __init__(
+        self,
+        env_fns: Sequence[BreakoutEnvFactory],
+        observer: BreakoutObserver,
+        auto_reset: bool = True,
+        num_workers: Optional[int] = None,
+        context: Optional[str] = None,
+        shared_memory: bool = True,
+    ) -> None:
+        if num_workers is None:
+            num_workers = mp.cpu_count()
+        num_workers = max(1, min(num_workers, len(env_fns)))
+
+        ctx: Any = mp.get_context(context)
+
+        self._shared_buffer: Optional[SharedVectorBuffer] = None
+        self._buffer: VectorBuffer
+        if shared_memory:
+            self._shared_buffer = SharedVectorBuffer(
+                num_envs=len(env_fns),
+                observer=observer,
+            )
+            self._buffer = self._shared_buffer
+        else:
+            self._buffer = VectorBuffer(
+                num_envs=len(env_fns), observer=observer
+            )
+
+        self._shards = [
+            shard.tolist()
+            for shard in np.array_split(np.arange(len(env_fns)), num_workers)
+        ]
+        self._rows = [slice(shard[0], shard[-1] + 1) for shard in self._shards]
+        self._connections: List[Connection] = []
+        self._processes: List[Any] = []
+
+        for shard, rows in zip(self._shards, self._rows):
+            connection, worker_connection = ctx.Pipe()
+            process = ctx.Process(
+                target=_run_worker,
+                kwargs=dict(
+                    connection=worker_connection,
+                    env_fns=[env_fns[idx] for idx in shard],
+                    observer=observer,
+                    auto_reset=auto_reset,
+                    buffer=self._shared_buffer,
+                    rows=rows,
+                ),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+
+            self._connections.append(connection)
+            self._processes.append(process)
+
+        self._closed = False
+
+    def reset(self) -> BreakoutObservation:
+        for connection in self._connections:
+            connection.send(("reset", None))
+
+        results = self._receive_all()
+        if self._shared_buffer is None:
+            for rows, observation in zip(self._rows, results):
+                _copy_observation(observation, self._buffer.observation[rows])
+
+        return self._buffer.observation
+
+    def step(
+        self, actions: Sequence[BreakoutAction], dt: float
+    ) -> VectorStepResult:
+        for connection, shard in zip(self._connections, self._shards):
+            shard_actions = [actions[idx] for idx in shard]
+            connection.send(("step", (shard_actions, dt)))
+
+        results = self._receive_all()
+        if self._shared_buffer is None:
+            for rows, (observation, rewards, dones) in zip(self._rows, results):
+                _copy_observation(observation, self._buffer.observation[rows])
+                self._buffer.rewards[rows] = rewards
+                self._buffer.dones[rows] = dones
+
+        return (
+            self._buffer.observation,
+            self._buffer.rewards,
+            self._buffer.dones,
+        )
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        for connection in self._connections:
+            connection.send(("close", None))
+            connection.close()
+
+        for process in self._processes:
+            process.join()
+
+        if self._shared_buffer is not None:
+            self._shared_buffer.close()
+
+        self._closed = True
+
+    def _receive_all(self) -> List[Any]:
+        results = []
+        for connection in self._connections:
+            is_ok, result = connection.recv()
+            if not is_ok:
+                self.close()
+                raise RuntimeError(f"Vector env worker failed: {result}")
+
+            results.append(result)
+
+        return results
+
+
+class VectorBreakoutEnv:
+    def __init__(
+        self,
+        env_fns: Sequence[BreakoutEnvFactory],
+        backend_type: VectorBackendType = VectorBackendType.SYNC,
+        observer: Optional[BreakoutObserver] = None,
+        auto_reset: bool = True,
+        num_workers: Optional[int] = None,
+        context: Optional[str] = None,
+        shared_memory: bool = True,
+    ) -> None:
+        if not env_fns:
+            raise ValueError("Vector env needs at least one environment")
+
+        if observer is None:
+            observer = BreakoutObserver.from_env_fns(env_fns)
+
+        self.num_envs = len(env_fns)
+        self.observer = observer
+
+        self._backend: Any
+        if backend_type == VectorBackendType.SYNC:
+            self._backend = SyncVectorBackend(
+                env_fns=env_fns,
+                observer=observer,
+                auto_reset=auto_reset,
+            )
+        elif backend_type == VectorBackendType.SUBPROCESS:
+            self._backend = SubprocessVectorBackend(
+                env_fns=env_fns,
+                observer=observer,
+                auto_reset=auto_reset,
+                num_workers=num_workers,
+                context=context,
+                shared_memory=shared_memory,
+            )
+        else:
+            raise ValueError(f"Unknown vector backend type: {backend_type}")
+
+    def reset(self) -> BreakoutObservation:
+        return self._backend.reset()
+
+    def step(
+        self, actions: Sequence[BreakoutAction], dt: float
+    ) -> VectorStepResult:
+        # Every backend returns the same preallocated arrays on each call
+        # (shared memory for subprocess workers), so the next step or reset
+        # overwrites them. Copy the results to keep them.
+        if len(actions) != self.num_envs:
+            raise ValueError(
+                f"Expected {self.num_envs} actions, got {len(actions)}"
+            )
+
+        return self._backend.step(actions, dt)
+
+    def close(self) -> None:
+        self._backend.close()
+
+    def __enter__(self) -> "VectorBreakoutEnv":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _copy_observation(
+    source: BreakoutObservation, target: BreakoutObservation
+) -> None:
+    target.platforms[:] = source.platforms
+    target.balls[:] = source.balls
+    target.blocks[:] = source.blocks
+
+
+def _count_destroyed_blocks(events: Sequence[BreakoutEvent]) -> int:
+    destroyed_block_ids = {
+        event.collision.block.id
+        for event in events
+        if isinstance(event, BreakoutCollisionEvent)
+        and isinstance(event.collision, CollisionBallBlock)
+        and event.collision.block.health <= 0
+    }
+
+    return len(destroyed_block_ids)
+
+
+def _run_worker(
+    connection: Connection,
+    env_fns: Sequence[BreakoutEnvFactory],
+    observer: BreakoutObserver,
+    auto_reset: bool,
+    buffer: Optional[SharedVectorBuffer],
+    rows: slice,
+) -> None:
+    backend = SyncVectorBackend(
+        env_fns=env_fns,
+        observer=observer,
+        auto_reset=auto_reset,
+    )
+
+    while True:
+        command, data = connection.recv()
+
+        try:
+            if command == "reset" and buffer is not None:
+                backend.reset_into(buffer.observation[rows])
+                connection.send((True, None))
+            elif command == "reset":
+                connection.send((True, backend.reset()))
+            elif command == "step" and buffer is not None:
+                actions, dt = data
+                backend.step_into(
+                    actions=actions,
+                    dt=dt,
+                    observation=buffer.observation[rows],
+                    rewards=buffer.rewards[rows],
+                    dones=buffer.dones[rows],
+                )
+                connection.send((True, None))
+            elif command == "step":
+                actions, dt = data
+                connection.send((True, backend.step(actions, dt)))
+            elif command == "close":
+                break
+            else:
+                raise ValueError(f"Unknown command: {command}")
+        except Exception as e:
+            connection.send((False, repr(e)))
+
+    connection.close()
@@ -0,0 +1,27 @@
+from typing import Any, Dict, List
+
+KERNEL_MODULES = ["geometry/scalar_kernels.py"]
+
+
+def get_ext_modules() -> List[Any]:
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        return []
+
+    return mypycify(KERNEL_MODULES, opt_level="3")
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    setup_kwargs.update(ext_modules=get_ext_modules())
+
+
+if __name__ == "__main__":
+    from setuptools import setup
+
+    setup(
+        name="geometry",
+        packages=[],
+        ext_modules=get_ext_modules(),
+        script_args=["build_ext", "--inplace"],
+    )
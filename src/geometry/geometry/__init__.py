@@ -1,27 +1,73 @@
 from .basic import Line2, Point, Segment, Vec2
+from .broadphase import SpatialHashGrid, SweepAndPrune
+from .bvh import DynamicAABBTree
+from .distance import (
+    get_distance_point_capsule,
+    get_distance_point_circle,
+    get_distance_point_rectangle,
+    get_distance_point_segment,
+    get_distance_point_shape,
+    get_distance_point_triangle,
+)
 from .intersecting import (
     Intersection,
     get_intersection,
+    get_intersection_capsule_capsule,
+    get_intersection_capsule_circle,
+    get_intersection_capsule_rectangle,
     get_intersection_circle_circle,
     get_intersection_circle_segment,
     get_intersection_line_line,
+    get_intersection_rectangle_circle,
     get_intersection_rectangle_rectangle,
     get_intersection_segment_segment,
     get_intersection_triangle_circle,
     get_intersection_triangle_triangle,
+    get_intersections,
+    get_intersections_circle_circle,
+    get_intersections_rectangle_rectangle,
+    get_intersections_triangle_circle,
+    get_intersections_triangle_triangle,
     is_intersected,
 )
 from .kdtree import (
+    ALL_CLASSES_MASK,
     ClassId,
+    ClassMask,
     CollidablePair,
+    CollisionFilter,
+    CollisionMasks,
+    DynamicKDTree,
     IntersactionInfo,
+    ISplitStrategy,
     ItemId,
     KDTree,
+    KDTreeQueryPool,
     LeafTreeNode,
+    LoadGiniSplitStrategy,
+    MedianSplitStrategy,
+    Neighbour,
     ParentRelativeType,
+    RayHit,
     Record,
+    SAHSplitStrategy,
+    SplitCandidates,
     SplitTreeNode,
     TreeNode,
     TreeNodeType,
+    generate_item_records_intersections,
+    get_class_mask,
+)
+from .shapes import Capsule, Circle, Rectangle, Shape, Triangle
+from .time_of_impact import (
+    TimeOfImpact,
+    get_time_of_impact_circle_circle,
+    get_time_of_impact_circle_rectangle,
+    get_time_of_impact_point_capsule,
+    get_time_of_impact_point_circle,
+    get_time_of_impact_point_rectangle,
+    get_time_of_impact_point_segment,
+    get_time_of_impact_point_shape,
+    get_time_of_impact_point_triangle,
+    get_time_of_impact_rectangle_rectangle,
 )
-from .shapes import Circle, Rectangle, Shape, Triangle
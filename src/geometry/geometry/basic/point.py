@@ -1,11 +1,13 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 T = float
 
 
 @dataclass
 class Vec2:
+    __slots__ = ("x", "y")
+
     x: T
     y: T
 
@@ -27,6 +29,9 @@ class Vec2:
             y=self.y,
         )
 
+    def to_tuple(self) -> Tuple[T, T]:
+        return self.x, self.y
+
     def __neg__(self) -> "Vec2":
         return Vec2(
             x=-self.x,
@@ -43,7 +48,13 @@ class Vec2:
         raise NotImplementedError
 
     def __sub__(self, other: "Vec2") -> "Vec2":
-        return self + (-other)
+        if isinstance(other, Vec2):
+            return Vec2(
+                x=self.x - other.x,
+                y=self.y - other.y,
+            )
+
+        raise NotImplementedError
 
     def __mul__(self, other) -> "Vec2":
         return Vec2(
@@ -55,7 +66,43 @@ class Vec2:
         return self * other
 
     def __truediv__(self, other) -> "Vec2":
-        return self * (1 / other)
+        inverse = 1 / other
+
+        return Vec2(
+            x=self.x * inverse,
+            y=self.y * inverse,
+        )
+
+    def __iadd__(self, other: "Vec2") -> "Vec2":
+        if isinstance(other, Vec2):
+            self.x += other.x
+            self.y += other.y
+
+            return self
+
+        raise NotImplementedError
+
+    def __isub__(self, other: "Vec2") -> "Vec2":
+        if isinstance(other, Vec2):
+            self.x -= other.x
+            self.y -= other.y
+
+            return self
+
+        raise NotImplementedError
+
+    def __imul__(self, other) -> "Vec2":
+        self.x *= other
+        self.y *= other
+
+        return self
+
+    def __itruediv__(self, other) -> "Vec2":
+        inverse = 1 / other
+        self.x *= inverse
+        self.y *= inverse
+
+        return self
 
     def __getitem__(self, idx: int) -> T:
         if idx == 0:
@@ -0,0 +1,2 @@
+from .spatial_hash import SpatialHashGrid
+from .sweep_and_prune import SweepAndPrune
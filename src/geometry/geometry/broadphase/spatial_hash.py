@@ -0,0 +1,135 @@
+from typing import Iterable, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from ..kdtree.arrays import (
+    RecordArrays,
+    expand_ranges,
+    generate_candidate_intersections,
+)
+from ..kdtree.masks import CollisionFilter
+from ..kdtree.node import IntersactionInfo, IntersactionPair
+from ..kdtree.record import Record
+
+ROW_STRIDE = 2**32
+
+
+class SpatialHashGrid:
+    def __init__(
+        self,
+        records: Sequence[Record],
+        cell_size: Optional[float] = None,
+    ) -> None:
+        self.records = RecordArrays.from_records(records)
+
+        if cell_size is None:
+            cell_size = get_default_cell_size(self.records.boxes)
+
+        self.cell_size = cell_size
+
+        record_idxs, cell_keys = self._get_cells(self.records.boxes)
+        order = np.lexsort((record_idxs, cell_keys))
+
+        self._cell_keys = cell_keys[order]
+        self._cell_record_idxs = record_idxs[order]
+
+    def generate_colliding_items(
+        self,
+        collidable_pairs: CollisionFilter,
+        collided: Optional[Set[IntersactionPair]] = None,
+    ) -> Iterable[IntersactionInfo]:
+        cell_stops = np.searchsorted(
+            self._cell_keys, self._cell_keys, side="right"
+        )
+        entry_idxs, partner_idxs = expand_ranges(
+            starts=np.arange(1, len(self._cell_keys) + 1),
+            stops=cell_stops,
+        )
+
+        first_idxs, second_idxs = get_unique_pairs(
+            first_idxs=self._cell_record_idxs[entry_idxs],
+            second_idxs=self._cell_record_idxs[partner_idxs],
+            num_second=len(self.records),
+        )
+
+        yield from generate_candidate_intersections(
+            first=self.records,
+            first_idxs=first_idxs,
+            second=self.records,
+            second_idxs=second_idxs,
+            collidable_pairs=collidable_pairs,
+            collided=collided,
+        )
+
+    def generate_records_intersections(
+        self,
+        records: Sequence[Record],
+        collidable_pairs: CollisionFilter,
+        collided: Optional[Set[IntersactionPair]] = None,
+    ) -> Iterable[IntersactionInfo]:
+        queries = RecordArrays.from_records(records)
+        query_idxs, query_keys = self._get_cells(queries.boxes)
+
+        entry_idxs, partner_idxs = expand_ranges(
+            starts=np.searchsorted(self._cell_keys, query_keys, side="left"),
+            stops=np.searchsorted(self._cell_keys, query_keys, side="right"),
+        )
+
+        first_idxs, second_idxs = get_unique_pairs(
+            first_idxs=query_idxs[entry_idxs],
+            second_idxs=self._cell_record_idxs[partner_idxs],
+            num_second=len(self.records),
+        )
+
+        yield from generate_candidate_intersections(
+            first=queries,
+            first_idxs=first_idxs,
+            second=self.records,
+            second_idxs=second_idxs,
+            collidable_pairs=collidable_pairs,
+            collided=collided,
+        )
+
+    def _get_cells(self, boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cells = np.floor(boxes / self.cell_size).astype(np.int64)
+        lefts, tops, rights, bottoms = (
+            cells[:, 0],
+            cells[:, 1],
+            cells[:, 2],
+            cells[:, 3],
+        )
+
+        widths = rights - lefts + 1
+        heights = bottoms - tops + 1
+
+        record_idxs, positions = expand_ranges(
+            starts=np.zeros(len(boxes), dtype=np.int64),
+            stops=widths * heights,
+        )
+        row_widths = widths[record_idxs]
+
+        cols = lefts[record_idxs] + positions % row_widths
+        rows = tops[record_idxs] + positions // row_widths
+
+        return record_idxs, cols * ROW_STRIDE + rows
+
+
+def get_default_cell_size(boxes: np.ndarray) -> float:
+    if len(boxes) == 0:
+        return 1.0
+
+    extents = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+    cell_size = 2 * float(np.median(extents))
+
+    if cell_size <= 0:
+        return 1.0
+
+    return cell_size
+
+
+def get_unique_pairs(
+    first_idxs: np.ndarray, second_idxs: np.ndarray, num_second: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    keys = np.unique(first_idxs * num_second + second_idxs)
+
+    return keys // num_second, keys % num_second
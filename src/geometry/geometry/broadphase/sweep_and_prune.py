@@ -0,0 +1,72 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from ..kdtree.arrays import (
+    RecordArrays,
+    expand_ranges,
+    generate_candidate_intersections,
+)
+from ..kdtree.masks import CollisionFilter
+from ..kdtree.node import IntersactionInfo, IntersactionPair
+from ..kdtree.record import ItemId, Record
+
+RecordKey = Tuple[ItemId, int]
+
+
+class SweepAndPrune:
+    def __init__(self, records: Optional[Sequence[Record]] = None) -> None:
+        self.records = RecordArrays.from_records([])
+
+        self._order = np.zeros(0, dtype=int)
+        self._keys: List[RecordKey] = []
+
+        if records is not None:
+            self.update(records)
+
+    def update(self, records: Sequence[Record]) -> None:
+        keys = get_record_keys(records)
+        key2idx = {key: idx for idx, key in enumerate(keys)}
+
+        kept_idxs = [key2idx.pop(key) for key in self._keys if key in key2idx]
+        hint = np.array(kept_idxs + list(key2idx.values()), dtype=int)
+
+        self.records = RecordArrays.from_records(records)
+
+        lefts = self.records.boxes[hint, 0]
+        self._order = hint[np.argsort(lefts, kind="stable")]
+        self._keys = [keys[idx] for idx in self._order.tolist()]
+
+    def generate_colliding_items(
+        self,
+        collidable_pairs: CollisionFilter,
+        collided: Optional[Set[IntersactionPair]] = None,
+    ) -> Iterable[IntersactionInfo]:
+        boxes = self.records.boxes[self._order]
+
+        sorted_idxs, partner_idxs = expand_ranges(
+            starts=np.arange(1, len(boxes) + 1),
+            stops=np.searchsorted(boxes[:, 0], boxes[:, 2], side="right"),
+        )
+
+        yield from generate_candidate_intersections(
+            first=self.records,
+            first_idxs=self._order[sorted_idxs],
+            second=self.records,
+            second_idxs=self._order[partner_idxs],
+            collidable_pairs=collidable_pairs,
+            collided=collided,
+        )
+
+
+def get_record_keys(records: Sequence[Record]) -> List[RecordKey]:
+    item_id2count: Dict[ItemId, int] = {}
+
+    keys = []
+    for record in records:
+        count = item_id2count.get(record.item_id, 0)
+        item_id2count[record.item_id] = count + 1
+
+        keys.append((record.item_id, count))
+
+    return keys
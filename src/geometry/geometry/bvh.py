@@ -0,0 +1,386 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from .kdtree.arrays import generate_item_records_intersections
+from .kdtree.masks import CollisionFilter, get_collision_masks
+from .kdtree.node import (
+    IntersactionInfo,
+    IntersactionPair,
+    is_bounds_intersected,
+    union_bounds,
+)
+from .kdtree.record import Bounds, ClassId, ItemId, Record
+
+NULL_NODE = -1
+
+
+@dataclass
+class BVHProxy:
+    item_id: ItemId
+    class_id: ClassId
+    records: List[Record]
+    fat_bounds: Bounds
+    node: int = NULL_NODE
+    neighbours: Set[ItemId] = field(default_factory=set)
+
+
+class DynamicAABBTree:
+    def __init__(self, margin: float = 8.0) -> None:
+        self.margin = margin
+        self.root = NULL_NODE
+
+        self._bounds: List[Bounds] = []
+        self._parents: List[int] = []
+        self._children1: List[int] = []
+        self._children2: List[int] = []
+        self._heights: List[int] = []
+        self._node2item_id: List[Optional[ItemId]] = []
+        self._free_nodes: List[int] = []
+
+        self._proxies: Dict[ItemId, BVHProxy] = {}
+        self.num_reinsertions = 0
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def __contains__(self, item_id: ItemId) -> bool:
+        return item_id in self._proxies
+
+    @property
+    def height(self) -> int:
+        if self.root == NULL_NODE:
+            return 0
+
+        return self._heights[self.root]
+
+    def get_fat_bounds(self, item_id: ItemId) -> Bounds:
+        return self._proxies[item_id].fat_bounds
+
+    def insert(
+        self, item_id: ItemId, class_id: ClassId, records: List[Record]
+    ) -> None:
+        if item_id in self._proxies:
+            raise ValueError(f"Proxy {item_id} is already in the tree")
+
+        proxy = BVHProxy(
+            item_id=item_id,
+            class_id=class_id,
+            records=list(records),
+            fat_bounds=self._fatten(get_records_bounds(records)),
+        )
+        self._proxies[item_id] = proxy
+
+        self._insert_proxy(proxy)
+
+    def remove(self, item_id: ItemId) -> None:
+        proxy = self._proxies.pop(item_id)
+
+        self._remove_leaf(proxy.node)
+        self._free_node(proxy.node)
+        self._drop_neighbours(proxy)
+
+    def move(self, item_id: ItemId, records: List[Record]) -> bool:
+        proxy = self._proxies[item_id]
+        proxy.records = list(records)
+
+        bounds = get_records_bounds(records)
+        if is_bounds_contained(proxy.fat_bounds, bounds):
+            return False
+
+        self._remove_leaf(proxy.node)
+        self._free_node(proxy.node)
+        self._drop_neighbours(proxy)
+
+        proxy.fat_bounds = self._fatten(bounds)
+        self._insert_proxy(proxy)
+        self.num_reinsertions += 1
+
+        return True
+
+    def query(self, bounds: Bounds) -> Iterable[ItemId]:
+        if self.root == NULL_NODE:
+            return
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+
+            if not is_bounds_intersected(self._bounds[node], bounds):
+                continue
+
+            item_id = self._node2item_id[node]
+            if item_id is not None:
+                yield item_id
+                continue
+
+            stack.append(self._children2[node])
+            stack.append(self._children1[node])
+
+    def generate_proxy_pairs(
+        self, collidable_pairs: Optional[CollisionFilter] = None
+    ) -> Iterable[IntersactionPair]:
+        masks = None
+        if collidable_pairs is not None:
+            masks = get_collision_masks(collidable_pairs)
+
+        for item_id, proxy in self._proxies.items():
+            for neighbour_id in proxy.neighbours:
+                if neighbour_id < item_id:
+                    continue
+
+                neighbour_class_id = self._proxies[neighbour_id].class_id
+                if masks is None or masks.is_collidable(
+                    proxy.class_id, neighbour_class_id
+                ):
+                    yield item_id, neighbour_id
+
+    def generate_colliding_items(
+        self,
+        collidable_pairs: CollisionFilter,
+        collided: Optional[Set[IntersactionPair]] = None,
+    ) -> Iterable[IntersactionInfo]:
+        masks = get_collision_masks(collidable_pairs)
+
+        proxy_pairs = list(self.generate_proxy_pairs(masks))
+
+        yield from generate_item_records_intersections(
+            item_id2records={
+                item_id: self._proxies[item_id].records
+                for item_ids in proxy_pairs
+                for item_id in item_ids
+            },
+            item_pairs=proxy_pairs,
+            collidable_pairs=masks,
+            collided=collided,
+        )
+
+    def _insert_proxy(self, proxy: BVHProxy) -> None:
+        proxy.node = self._allocate_node(proxy.fat_bounds, proxy.item_id)
+
+        for neighbour_id in self.query(proxy.fat_bounds):
+            proxy.neighbours.add(neighbour_id)
+            self._proxies[neighbour_id].neighbours.add(proxy.item_id)
+
+        self._insert_leaf(proxy.node)
+
+    def _drop_neighbours(self, proxy: BVHProxy) -> None:
+        for neighbour_id in proxy.neighbours:
+            self._proxies[neighbour_id].neighbours.discard(proxy.item_id)
+
+        proxy.neighbours = set()
+
+    def _fatten(self, bounds: Bounds) -> Bounds:
+        left, top, right, bottom = bounds
+
+        return (
+            left - self.margin,
+            top - self.margin,
+            right + self.margin,
+            bottom + self.margin,
+        )
+
+    def _allocate_node(self, bounds: Bounds, item_id: Optional[ItemId]) -> int:
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+
+            self._bounds[node] = bounds
+            self._parents[node] = NULL_NODE
+            self._children1[node] = NULL_NODE
+            self._children2[node] = NULL_NODE
+            self._heights[node] = 0
+            self._node2item_id[node] = item_id
+
+            return node
+
+        self._bounds.append(bounds)
+        self._parents.append(NULL_NODE)
+        self._children1.append(NULL_NODE)
+        self._children2.append(NULL_NODE)
+        self._heights.append(0)
+        self._node2item_id.append(item_id)
+
+        return len(self._bounds) - 1
+
+    def _free_node(self, node: int) -> None:
+        self._node2item_id[node] = None
+        self._heights[node] = -1
+        self._free_nodes.append(node)
+
+    def _is_leaf(self, node: int) -> bool:
+        return self._children1[node] == NULL_NODE
+
+    def _insert_leaf(self, leaf: int) -> None:
+        if self.root == NULL_NODE:
+            self.root = leaf
+            self._parents[leaf] = NULL_NODE
+            return
+
+        leaf_bounds = self._bounds[leaf]
+
+        node = self.root
+        while not self._is_leaf(node):
+            child1 = self._children1[node]
+            child2 = self._children2[node]
+
+            perimeter = get_perimeter(self._bounds[node])
+            combined_perimeter = get_perimeter(
+                union_bounds([self._bounds[node], leaf_bounds])
+            )
+
+            cost = 2 * combined_perimeter
+            inheritance_cost = 2 * (combined_perimeter - perimeter)
+
+            cost1 = self._get_descend_cost(child1, leaf_bounds)
+            cost2 = self._get_descend_cost(child2, leaf_bounds)
+            cost1 += inheritance_cost
+            cost2 += inheritance_cost
+
+            if cost < cost1 and cost < cost2:
+                break
+
+            node = child1 if cost1 < cost2 else child2
+
+        sibling = node
+        old_parent = self._parents[sibling]
+
+        new_parent = self._allocate_node(
+            bounds=union_bounds([leaf_bounds, self._bounds[sibling]]),
+            item_id=None,
+        )
+        self._parents[new_parent] = old_parent
+        self._heights[new_parent] = self._heights[sibling] + 1
+        self._children1[new_parent] = sibling
+        self._children2[new_parent] = leaf
+        self._parents[sibling] = new_parent
+        self._parents[leaf] = new_parent
+
+        if old_parent == NULL_NODE:
+            self.root = new_parent
+        else:
+            self._replace_child(old_parent, sibling, new_parent)
+
+        self._refit(self._parents[leaf])
+
+    def _get_descend_cost(self, node: int, leaf_bounds: Bounds) -> float:
+        bounds = self._bounds[node]
+        cost = get_perimeter(union_bounds([bounds, leaf_bounds]))
+
+        if self._is_leaf(node):
+            return cost
+
+        return cost - get_perimeter(bounds)
+
+    def _remove_leaf(self, leaf: int) -> None:
+        if leaf == self.root:
+            self.root = NULL_NODE
+            return
+
+        parent = self._parents[leaf]
+        grand_parent = self._parents[parent]
+        if self._children1[parent] == leaf:
+            sibling = self._children2[parent]
+        else:
+            sibling = self._children1[parent]
+
+        self._free_node(parent)
+
+        if grand_parent == NULL_NODE:
+            self.root = sibling
+            self._parents[sibling] = NULL_NODE
+            return
+
+        self._replace_child(grand_parent, parent, sibling)
+        self._parents[sibling] = grand_parent
+
+        self._refit(grand_parent)
+
+    def _refit(self, node: int) -> None:
+        while node != NULL_NODE:
+            node = self._balance(node)
+
+            child1 = self._children1[node]
+            child2 = self._children2[node]
+
+            self._heights[node] = 1 + max(
+                self._heights[child1], self._heights[child2]
+            )
+            self._bounds[node] = union_bounds(
+                [self._bounds[child1], self._bounds[child2]]
+            )
+
+            node = self._parents[node]
+
+    def _replace_child(self, parent: int, old_child: int, child: int) -> None:
+        if self._children1[parent] == old_child:
+            self._children1[parent] = child
+        else:
+            self._children2[parent] = child
+
+    def _balance(self, a: int) -> int:
+        if self._is_leaf(a) or self._heights[a] < 2:
+            return a
+
+        b = self._children1[a]
+        c = self._children2[a]
+        balance = self._heights[c] - self._heights[b]
+
+        if balance > 1:
+            return self._rotate(a, up=c, other=b, is_first=False)
+
+        if balance < -1:
+            return self._rotate(a, up=b, other=c, is_first=True)
+
+        return a
+
+    def _rotate(self, a: int, up: int, other: int, is_first: bool) -> int:
+        f = self._children1[up]
+        g = self._children2[up]
+
+        self._children1[up] = a
+        self._parents[up] = self._parents[a]
+        self._parents[a] = up
+
+        if self._parents[up] == NULL_NODE:
+            self.root = up
+        else:
+            self._replace_child(self._parents[up], a, up)
+
+        if self._heights[f] > self._heights[g]:
+            kept, moved = f, g
+        else:
+            kept, moved = g, f
+
+        self._children2[up] = kept
+        if is_first:
+            self._children1[a] = moved
+        else:
+            self._children2[a] = moved
+        self._parents[moved] = a
+
+        self._bounds[a] = union_bounds(
+            [self._bounds[other], self._bounds[moved]]
+        )
+        self._bounds[up] = union_bounds([self._bounds[a], self._bounds[kept]])
+        self._heights[a] = 1 + max(self._heights[other], self._heights[moved])
+        self._heights[up] = 1 + max(self._heights[a], self._heights[kept])
+
+        return up
+
+
+def get_records_bounds(records: Iterable[Record]) -> Bounds:
+    return union_bounds(record.bounds for record in records)
+
+
+def get_perimeter(bounds: Bounds) -> float:
+    left, top, right, bottom = bounds
+
+    return 2 * ((right - left) + (bottom - top))
+
+
+def is_bounds_contained(outer: Bounds, inner: Bounds) -> bool:
+    return (
+        outer[0] <= inner[0]
+        and outer[1] <= inner[1]
+        and inner[2] <= outer[2]
+        and inner[3] <= outer[3]
+    )
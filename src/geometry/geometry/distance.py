@@ -0,0 +1,57 @@
+from .basic import Point, Segment
+from .intersecting import is_point_in_triangle
+from .shapes import Capsule, Circle, Rectangle, Shape, Triangle
+
+
+def get_distance_point_circle(p: Point, c: Circle) -> float:
+    return max(0.0, (p - c.center).norm() - c.radius)
+
+
+def get_distance_point_rectangle(p: Point, r: Rectangle) -> float:
+    dx = max(r.left - p.x, 0.0, p.x - r.right)
+    dy = max(r.top - p.y, 0.0, p.y - r.bottom)
+
+    return (dx * dx + dy * dy) ** 0.5
+
+
+def get_distance_point_segment(p: Point, s: Segment) -> float:
+    edge = s.end - s.begin
+
+    length2 = edge.norm2()
+    if length2 == 0:
+        return (p - s.begin).norm()
+
+    t = min(1.0, max(0.0, (p - s.begin).scalar(edge) / length2))
+
+    return (p - (s.begin + edge * t)).norm()
+
+
+def get_distance_point_triangle(p: Point, t: Triangle) -> float:
+    if is_point_in_triangle(p, t):
+        return 0.0
+
+    return min(get_distance_point_segment(p, seg) for seg in t.segments)
+
+
+def get_distance_point_capsule(p: Point, c: Capsule) -> float:
+    return max(0.0, get_distance_point_segment(p, c.segment) - c.radius)
+
+
+def get_distance_point_shape(p: Point, shape: Shape) -> float:
+    if isinstance(shape, Circle):
+        return get_distance_point_circle(p, shape)
+
+    elif isinstance(shape, Rectangle):
+        return get_distance_point_rectangle(p, shape)
+
+    elif isinstance(shape, Triangle):
+        return get_distance_point_triangle(p, shape)
+
+    elif isinstance(shape, Capsule):
+        return get_distance_point_capsule(p, shape)
+
+    raise NotImplementedError(
+        "Getting distance to {} is not supported".format(
+            shape.__class__.__name__,
+        )
+    )
@@ -1,8 +1,13 @@
-from itertools import product
-from typing import Optional
+from collections import defaultdict
+from itertools import combinations, product
+from typing import Dict, List, Optional, Sequence, Tuple, cast
 
+import numpy as np
+
+from . import kernels
 from .basic import Line2, Point, Segment
-from .shapes import Circle, Rectangle, Shape, Triangle
+from .scalar_kernels import ScalarIntersection
+from .shapes import Capsule, Circle, Rectangle, Shape, Triangle
 
 EPS = 1e-4
 
@@ -32,6 +37,27 @@ def get_intersection(a: Shape, b: Shape) -> Intersection:
     elif isinstance(a, Circle) and isinstance(b, Triangle):
         return get_intersection_triangle_circle(b, a)
 
+    elif isinstance(a, Rectangle) and isinstance(b, Circle):
+        return get_intersection_rectangle_circle(a, b)
+
+    elif isinstance(a, Circle) and isinstance(b, Rectangle):
+        return get_intersection_rectangle_circle(b, a)
+
+    elif isinstance(a, Capsule) and isinstance(b, Capsule):
+        return get_intersection_capsule_capsule(a, b)
+
+    elif isinstance(a, Capsule) and isinstance(b, Rectangle):
+        return get_intersection_capsule_rectangle(a, b)
+
+    elif isinstance(a, Rectangle) and isinstance(b, Capsule):
+        return get_intersection_capsule_rectangle(b, a)
+
+    elif isinstance(a, Capsule) and isinstance(b, Circle):
+        return get_intersection_capsule_circle(a, b)
+
+    elif isinstance(a, Circle) and isinstance(b, Capsule):
+        return get_intersection_capsule_circle(b, a)
+
     raise NotImplementedError(
         "Getting intersection between {} and {} is not supported".format(
             a.__class__.__name__,
@@ -43,71 +69,104 @@ def get_intersection(a: Shape, b: Shape) -> Intersection:
 def get_intersection_rectangle_rectangle(
     a: Rectangle, b: Rectangle
 ) -> Intersection:
-    inter = intersect_rectangles(a, b)
-
-    if inter.width <= 0 or inter.height <= 0:
-        return None
-
-    return inter.center
+    return _to_point(
+        kernels.backend.get_intersection_rectangle_rectangle(
+            *a.to_tuple(), *b.to_tuple()
+        )
+    )
 
 
 def get_intersection_triangle_triangle(
     a: Triangle, b: Triangle
 ) -> Intersection:
-    for p in [*a.points, a.center]:
-        if is_point_in_triangle(p, b):
-            return p
-
-    for p in [*b.points, b.center]:
-        if is_point_in_triangle(p, a):
-            return p
-
-    for seg1, seg2 in product(a.segments, b.segments):
-        intersection = get_intersection_segment_segment(seg1, seg2)
-
-        if intersection is not None:
-            return intersection
-
-    return None
+    return _to_point(
+        kernels.backend.get_intersection_triangle_triangle(
+            a.coords,
+            a.center.to_tuple(),
+            a.edges,
+            b.coords,
+            b.center.to_tuple(),
+            b.edges,
+        )
+    )
 
 
 def get_intersection_circle_circle(a: Circle, b: Circle) -> Intersection:
-    s = a.center - b.center
-    sd = s.x * s.x + s.y * s.y
+    return _to_point(
+        kernels.backend.get_intersection_circle_circle(
+            a.center.x, a.center.y, a.radius, b.center.x, b.center.y, b.radius
+        )
+    )
 
-    c_radius = a.radius + b.radius
-    sr = c_radius * c_radius
 
-    if sd < sr:
-        return (a.center + b.center) / 2
-    else:
-        return None
+def get_intersection_triangle_circle(t: Triangle, c: Circle) -> Intersection:
+    return _to_point(
+        kernels.backend.get_intersection_triangle_circle(
+            t.coords, t.edges, c.center.x, c.center.y, c.radius
+        )
+    )
 
 
-def get_intersection_triangle_circle(t: Triangle, c: Circle) -> Intersection:
-    if is_point_in_triangle(c.center, t):
-        return c.center
+def get_intersection_rectangle_circle(r: Rectangle, c: Circle) -> Intersection:
+    return _to_point(
+        kernels.backend.get_intersection_rectangle_circle(
+            *r.to_tuple(), c.center.x, c.center.y, c.radius
+        )
+    )
 
-    for seg in t.segments:
-        intersection = get_intersection_circle_segment(c, seg)
 
-        if intersection is not None:
-            return intersection
+def get_intersection_capsule_circle(a: Capsule, c: Circle) -> Intersection:
+    return _to_point(
+        kernels.backend.get_intersection_capsule_circle(
+            *a.begin.to_tuple(),
+            *a.end.to_tuple(),
+            a.radius,
+            c.center.x,
+            c.center.y,
+            c.radius,
+        )
+    )
 
-    return None
 
+def get_intersection_capsule_rectangle(
+    a: Capsule, r: Rectangle
+) -> Intersection:
+    return _to_point(
+        kernels.backend.get_intersection_capsule_rectangle(
+            *a.begin.to_tuple(),
+            *a.end.to_tuple(),
+            a.radius,
+            *r.to_tuple(),
+        )
+    )
 
-def get_intersection_segment_segment(a: Segment, b: Segment) -> Intersection:
-    a_line = a.line
-    b_line = b.line
 
-    if is_on_same_side(b.begin, b.end, a_line):
-        return None
+def get_intersection_capsule_capsule(a: Capsule, b: Capsule) -> Intersection:
+    return _to_point(
+        kernels.backend.get_intersection_capsule_capsule(
+            *a.begin.to_tuple(),
+            *a.end.to_tuple(),
+            a.radius,
+            *b.begin.to_tuple(),
+            *b.end.to_tuple(),
+            b.radius,
+        )
+    )
 
-    if is_on_same_side(a.begin, a.end, b_line):
-        return None
 
-    return get_intersection_line_line(a_line, b_line)
+def get_intersection_segment_segment(a: Segment, b: Segment) -> Intersection:
+    return _to_point(
+        kernels.backend.get_intersection_segment_segment(
+            a.begin.x,
+            a.begin.y,
+            a.end.x,
+            a.end.y,
+            b.begin.x,
+            b.begin.y,
+            b.end.x,
+            b.end.y,
+        )
+    )
 
 
 def get_intersection_line_line(l1: Line2, l2: Line2) -> Intersection:
@@ -122,13 +181,7 @@ def get_intersection_line_line(l1: Line2, l2: Line2) -> Intersection:
 
 
 def is_point_in_triangle(p: Point, t: Triangle) -> bool:
-    c = t.center
-
-    for seg in t.segments:
-        if not is_on_same_side_strict(p, c, seg.line):
-            return False
-
-    return True
+    return kernels.backend.is_point_in_triangle(p.x, p.y, t.edges)
 
 
 def is_on_same_side(a: Point, b: Point, l: Line2) -> bool:
@@ -154,24 +207,344 @@ def intersect_rectangles(a: Rectangle, b: Rectangle) -> Rectangle:
 
 
 def get_intersection_circle_segment(c: Circle, s: Segment) -> Intersection:
-    v0 = s.begin
-    v1 = s.end
-    v2 = c.center
-    r = c.radius
-
-    a = v1 - v0
-    an2 = a.norm2()
-    b = v2 - v0
+    return _to_point(
+        kernels.backend.get_intersection_circle_segment(
+            c.center.x,
+            c.center.y,
+            c.radius,
+            s.begin.x,
+            s.begin.y,
+            s.end.x,
+            s.end.y,
+        )
+    )
 
-    t = max(0, min(a.scalar(b), an2))
 
-    r_an2 = r * an2
-    if r_an2 * r_an2 <= (a * t - b * an2).norm2():
+def _to_point(intersection: ScalarIntersection) -> Intersection:
+    if intersection is None:
         return None
 
-    if an2 == 0.0:
-        return v0
+    x, y = intersection
+
+    return Point(x=x, y=y)
+
+
+IntersectionMask = np.ndarray
+IntersectionPoints = np.ndarray
+BatchIntersections = Tuple[IntersectionMask, IntersectionPoints]
+
+BATCH_TYPE_PAIRS = {
+    (Rectangle, Rectangle),
+    (Triangle, Triangle),
+    (Circle, Circle),
+    (Triangle, Circle),
+}
+
+
+def get_intersections(
+    pairs: Sequence[Tuple[Shape, Shape]],
+    min_batch_size: int = 8,
+) -> List[Intersection]:
+    if len(pairs) < min_batch_size:
+        return [get_intersection(a, b) for a, b in pairs]
+
+    type2indices: Dict[Tuple[type, type], List[int]] = defaultdict(list)
+
+    for idx, (a, b) in enumerate(pairs):
+        if isinstance(a, Circle) and isinstance(b, Triangle):
+            type2indices[(Triangle, Circle)].append(idx)
+        else:
+            type2indices[(type(a), type(b))].append(idx)
+
+    intersections: List[Intersection] = [None] * len(pairs)
+
+    for (type_a, type_b), indices in type2indices.items():
+        if (
+            len(indices) < min_batch_size
+            or (type_a, type_b) not in BATCH_TYPE_PAIRS
+        ):
+            for idx in indices:
+                intersections[idx] = get_intersection(*pairs[idx])
+
+            continue
+
+        mask, points = _get_batch_intersections(
+            type_a=type_a,
+            type_b=type_b,
+            pairs=[_order_pair(*pairs[idx]) for idx in indices],
+        )
+
+        for idx, is_hit, point in zip(indices, mask, points):
+            if is_hit:
+                intersections[idx] = Point(x=float(point[0]), y=float(point[1]))
+
+    return intersections
+
+
+def _order_pair(a: Shape, b: Shape) -> Tuple[Shape, Shape]:
+    if isinstance(a, Circle) and isinstance(b, Triangle):
+        return b, a
+
+    return a, b
+
+
+def _get_batch_intersections(
+    type_a: type,
+    type_b: type,
+    pairs: List[Tuple[Shape, Shape]],
+) -> BatchIntersections:
+    shapes_a = [a for a, _ in pairs]
+    shapes_b = [b for _, b in pairs]
+
+    if type_a is Rectangle and type_b is Rectangle:
+        return get_intersections_rectangle_rectangle(
+            rects_a=pack_rectangles(cast(List[Rectangle], shapes_a)),
+            rects_b=pack_rectangles(cast(List[Rectangle], shapes_b)),
+        )
+
+    elif type_a is Triangle and type_b is Triangle:
+        return get_intersections_triangle_triangle(
+            triangles_a=pack_triangles(cast(List[Triangle], shapes_a)),
+            triangles_b=pack_triangles(cast(List[Triangle], shapes_b)),
+        )
+
+    elif type_a is Circle and type_b is Circle:
+        centers_a, radii_a = pack_circles(cast(List[Circle], shapes_a))
+        centers_b, radii_b = pack_circles(cast(List[Circle], shapes_b))
+
+        return get_intersections_circle_circle(
+            centers_a=centers_a,
+            radii_a=radii_a,
+            centers_b=centers_b,
+            radii_b=radii_b,
+        )
+
+    elif type_a is Triangle and type_b is Circle:
+        centers, radii = pack_circles(cast(List[Circle], shapes_b))
+
+        return get_intersections_triangle_circle(
+            triangles=pack_triangles(cast(List[Triangle], shapes_a)),
+            centers=centers,
+            radii=radii,
+        )
+
+    raise NotImplementedError(
+        "Getting intersection between {} and {} is not supported".format(
+            type_a.__name__,
+            type_b.__name__,
+        )
+    )
+
+
+def pack_rectangles(rects: Sequence[Rectangle]) -> np.ndarray:
+    return np.array(
+        [r.to_tuple() for r in rects],
+        dtype=float,
+    ).reshape(-1, 4)
+
+
+def pack_triangles(triangles: Sequence[Triangle]) -> np.ndarray:
+    return np.array(
+        [t.coords for t in triangles],
+        dtype=float,
+    ).reshape(-1, 3, 2)
+
+
+def pack_circles(circles: Sequence[Circle]) -> Tuple[np.ndarray, np.ndarray]:
+    centers = np.array(
+        [c.center.to_tuple() for c in circles],
+        dtype=float,
+    ).reshape(-1, 2)
+    radii = np.array([c.radius for c in circles], dtype=float)
+
+    return centers, radii
+
+
+def get_intersections_rectangle_rectangle(
+    rects_a: np.ndarray, rects_b: np.ndarray
+) -> BatchIntersections:
+    left = np.maximum(rects_a[:, 0], rects_b[:, 0])
+    right = np.minimum(
+        rects_a[:, 0] + rects_a[:, 2],
+        rects_b[:, 0] + rects_b[:, 2],
+    )
+    top = np.maximum(rects_a[:, 1], rects_b[:, 1])
+    bottom = np.minimum(
+        rects_a[:, 1] + rects_a[:, 3],
+        rects_b[:, 1] + rects_b[:, 3],
+    )
+
+    width = right - left
+    height = bottom - top
+
+    mask = (width > 0) & (height > 0)
+    points = np.stack([left + width / 2, top + height / 2], axis=-1)
+
+    return mask, points
+
+
+def get_intersections_circle_circle(
+    centers_a: np.ndarray,
+    radii_a: np.ndarray,
+    centers_b: np.ndarray,
+    radii_b: np.ndarray,
+) -> BatchIntersections:
+    s = centers_a - centers_b
+    sd = s[:, 0] * s[:, 0] + s[:, 1] * s[:, 1]
+
+    c_radius = radii_a + radii_b
+    sr = c_radius * c_radius
+
+    mask = sd < sr
+    points = (centers_a + centers_b) * (1 / 2)
+
+    return mask, points
+
+
+def get_intersections_triangle_circle(
+    triangles: np.ndarray, centers: np.ndarray, radii: np.ndarray
+) -> BatchIntersections:
+    mask = _are_points_in_triangles(centers, triangles)
+    points = np.where(mask[:, np.newaxis], centers, np.nan)
+
+    for begin, end in _get_triangle_segments(triangles):
+        seg_mask, seg_points = _get_intersections_circle_segment(
+            centers=centers,
+            radii=radii,
+            begins=begin,
+            ends=end,
+        )
+        _merge_intersections(mask, points, seg_mask, seg_points)
+
+    return mask, points
+
+
+def get_intersections_triangle_triangle(
+    triangles_a: np.ndarray, triangles_b: np.ndarray
+) -> BatchIntersections:
+    mask = np.zeros(len(triangles_a), dtype=bool)
+    points = np.full((len(triangles_a), 2), np.nan)
+
+    for triangles, others in [
+        (triangles_a, triangles_b),
+        (triangles_b, triangles_a),
+    ]:
+        vertices = [triangles[:, 0], triangles[:, 1], triangles[:, 2]]
+
+        for p in [*vertices, _get_triangle_centers(triangles)]:
+            _merge_intersections(
+                mask, points, _are_points_in_triangles(p, others), p
+            )
+
+    for seg1, seg2 in product(
+        _get_triangle_segments(triangles_a),
+        _get_triangle_segments(triangles_b),
+    ):
+        seg_mask, seg_points = _get_intersections_segment_segment(seg1, seg2)
+        _merge_intersections(mask, points, seg_mask, seg_points)
+
+    return mask, points
+
+
+BatchSegments = Tuple[np.ndarray, np.ndarray]
+BatchLines = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _merge_intersections(
+    mask: IntersectionMask,
+    points: IntersectionPoints,
+    new_mask: IntersectionMask,
+    new_points: IntersectionPoints,
+) -> None:
+    taken = new_mask & ~mask
+
+    points[taken] = new_points[taken]
+    mask |= new_mask
+
+
+def _get_triangle_centers(triangles: np.ndarray) -> np.ndarray:
+    return (triangles[:, 0] + triangles[:, 1] + triangles[:, 2]) * (1 / 3)
+
+
+def _get_triangle_segments(triangles: np.ndarray) -> List[BatchSegments]:
+    return [
+        (triangles[:, i], triangles[:, j]) for i, j in combinations(range(3), 2)
+    ]
+
+
+def _get_lines(begins: np.ndarray, ends: np.ndarray) -> BatchLines:
+    a = ends[:, 1] - begins[:, 1]
+    b = begins[:, 0] - ends[:, 0]
+    c = -a * begins[:, 0] - b * begins[:, 1]
+
+    return a, b, c
+
+
+def _place(lines: BatchLines, points: np.ndarray) -> np.ndarray:
+    a, b, c = lines
+
+    return a * points[:, 0] + b * points[:, 1] + c
+
+
+def _are_points_in_triangles(
+    points: np.ndarray, triangles: np.ndarray
+) -> np.ndarray:
+    centers = _get_triangle_centers(triangles)
+
+    mask = np.ones(len(points), dtype=bool)
+    for begin, end in _get_triangle_segments(triangles):
+        lines = _get_lines(begin, end)
+        mask &= _place(lines, points) * _place(lines, centers) > 0
+
+    return mask
+
+
+def _get_intersections_segment_segment(
+    seg1: BatchSegments, seg2: BatchSegments
+) -> BatchIntersections:
+    begin1, end1 = seg1
+    begin2, end2 = seg2
+
+    l1 = _get_lines(begin1, end1)
+    l2 = _get_lines(begin2, end2)
+
+    mask = _place(l1, begin2) * _place(l1, end2) < 0
+    mask &= _place(l2, begin1) * _place(l2, end1) < 0
+
+    a1, b1, c1 = l1
+    a2, b2, c2 = l2
+
+    d = b2 * a1 - b1 * a2
+    mask &= d != 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = -(b2 * c1 - b1 * c2) / d
+        y = (a2 * c1 - a1 * c2) / d
+
+    return mask, np.stack([x, y], axis=-1)
+
+
+def _get_intersections_circle_segment(
+    centers: np.ndarray,
+    radii: np.ndarray,
+    begins: np.ndarray,
+    ends: np.ndarray,
+) -> BatchIntersections:
+    a = ends - begins
+    an2 = a[:, 0] * a[:, 0] + a[:, 1] * a[:, 1]
+    b = centers - begins
+
+    scalar = a[:, 0] * b[:, 0] + a[:, 1] * b[:, 1]
+    t = np.maximum(0, np.minimum(scalar, an2))
+
+    shift = a * t[:, np.newaxis] - b * an2[:, np.newaxis]
+    r_an2 = radii * an2
+
+    mask = r_an2 * r_an2 > shift[:, 0] * shift[:, 0] + shift[:, 1] * shift[:, 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        points = (a * t[:, np.newaxis]) * (1 / an2)[:, np.newaxis] + begins
 
-    p = a * t / an2 + v0
+    points = np.where((an2 == 0)[:, np.newaxis], begins, points)
 
-    return p
+    return mask, points
@@ -1,3 +1,13 @@
+from .arrays import generate_item_records_intersections
+from .dynamic import DynamicKDTree
+from .masks import (
+    ALL_CLASSES_MASK,
+    ClassMask,
+    CollidablePair,
+    CollisionFilter,
+    CollisionMasks,
+    get_class_mask,
+)
 from .node import (
     LeafTreeNode,
     ParentRelativeType,
@@ -5,5 +15,14 @@ from .node import (
     TreeNode,
     TreeNodeType,
 )
+from .parallel import KDTreeQueryPool
+from .queries import Neighbour, RayHit
 from .record import ClassId, ItemId, Record
-from .tree import CollidablePair, IntersactionInfo, KDTree
+from .splitting import (
+    ISplitStrategy,
+    LoadGiniSplitStrategy,
+    MedianSplitStrategy,
+    SAHSplitStrategy,
+    SplitCandidates,
+)
+from .tree import IntersactionInfo, KDTree, WorkUnitType
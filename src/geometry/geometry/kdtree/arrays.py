@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .masks import CollisionFilter, get_class_masks, get_collision_masks
+from .node import (
+    IntersactionInfo,
+    IntersactionPair,
+    generate_item_pair_intersections,
+)
+from .record import ItemId, Record
+
+
+@dataclass
+class RecordArrays:
+    records: Sequence[Record]
+    boxes: np.ndarray
+    item_ids: np.ndarray
+    class_ids: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Sequence[Record]) -> "RecordArrays":
+        return cls(
+            records=records,
+            boxes=get_record_boxes(records),
+            item_ids=np.array(
+                [r.item_id for r in records], dtype=np.int64
+            ).reshape(-1),
+            class_ids=np.array(
+                [r.class_id for r in records], dtype=np.int64
+            ).reshape(-1),
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @cached_property
+    def class_masks(self) -> np.ndarray:
+        return get_class_masks(self.class_ids)
+
+
+def get_record_boxes(records: Sequence[Record]) -> np.ndarray:
+    return np.array(
+        [record.bounds for record in records],
+        dtype=float,
+    ).reshape(-1, 4)
+
+
+def get_boxes_intersected(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (
+        (a[..., 0] <= b[..., 2])
+        & (b[..., 0] <= a[..., 2])
+        & (a[..., 1] <= b[..., 3])
+        & (b[..., 1] <= a[..., 3])
+    )
+
+
+def generate_candidate_intersections(
+    first: RecordArrays,
+    first_idxs: np.ndarray,
+    second: RecordArrays,
+    second_idxs: np.ndarray,
+    collidable_pairs: CollisionFilter,
+    collided: Optional[Set[IntersactionPair]] = None,
+) -> Iterable[IntersactionInfo]:
+    if collided is None:
+        collided = set()
+
+    if len(first_idxs) == 0:
+        return
+
+    item_ids1 = first.item_ids[first_idxs]
+    item_ids2 = second.item_ids[second_idxs]
+    class_ids1 = first.class_ids[first_idxs]
+    class_ids2 = second.class_ids[second_idxs]
+
+    swapped = class_ids1 > class_ids2
+
+    masks = get_collision_masks(collidable_pairs)
+
+    mask = item_ids1 != item_ids2
+    mask &= (masks.get_masks(class_ids1) & second.class_masks[second_idxs]) != 0
+    mask &= get_boxes_intersected(
+        first.boxes[first_idxs], second.boxes[second_idxs]
+    )
+
+    if not mask.any():
+        return
+
+    first_idxs = first_idxs[mask]
+    second_idxs = second_idxs[mask]
+    low_item_ids = np.where(swapped, item_ids2, item_ids1)[mask].tolist()
+    high_item_ids = np.where(swapped, item_ids1, item_ids2)[mask].tolist()
+
+    yield from generate_item_pair_intersections(
+        item_pairs=list(zip(low_item_ids, high_item_ids)),
+        shape_pairs=[
+            (first.records[idx1].shape, second.records[idx2].shape)
+            for idx1, idx2 in zip(first_idxs.tolist(), second_idxs.tolist())
+        ],
+        collided=collided,
+    )
+
+
+def generate_item_records_intersections(
+    item_id2records: Mapping[ItemId, Sequence[Record]],
+    item_pairs: Iterable[IntersactionPair],
+    collidable_pairs: CollisionFilter,
+    collided: Optional[Set[IntersactionPair]] = None,
+) -> Iterable[IntersactionInfo]:
+    item_id2idx: Dict[ItemId, int] = {}
+    records: List[Record] = []
+    starts: List[int] = []
+    counts: List[int] = []
+
+    pairs = []
+    for item_ids in item_pairs:
+        for item_id in item_ids:
+            if item_id in item_id2idx:
+                continue
+
+            item_records = item_id2records[item_id]
+            item_id2idx[item_id] = len(starts)
+            starts.append(len(records))
+            counts.append(len(item_records))
+            records += item_records
+
+        item_id1, item_id2 = item_ids
+        pairs.append((item_id2idx[item_id1], item_id2idx[item_id2]))
+
+    if not pairs:
+        return
+
+    pair_idxs = np.array(pairs, dtype=int)
+    starts_array = np.array(starts, dtype=int)
+    counts_array = np.array(counts, dtype=int)
+
+    first_starts = starts_array[pair_idxs[:, 0]]
+    second_starts = starts_array[pair_idxs[:, 1]]
+    second_counts = counts_array[pair_idxs[:, 1]]
+
+    range_idxs, positions = expand_ranges(
+        starts=np.zeros(len(pair_idxs), dtype=int),
+        stops=counts_array[pair_idxs[:, 0]] * second_counts,
+    )
+    record_arrays = RecordArrays.from_records(records)
+
+    yield from generate_candidate_intersections(
+        first=record_arrays,
+        first_idxs=first_starts[range_idxs]
+        + positions // second_counts[range_idxs],
+        second=record_arrays,
+        second_idxs=second_starts[range_idxs]
+        + positions % second_counts[range_idxs],
+        collidable_pairs=collidable_pairs,
+        collided=collided,
+    )
+
+
+def expand_ranges(
+    starts: np.ndarray, stops: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    counts = np.maximum(stops - starts, 0)
+    range_idxs = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(len(range_idxs)) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+
+    return range_idxs, np.repeat(starts, counts) + offsets
+
+
+@lru_cache(maxsize=128)
+def get_pair_idxs(num_records: int) -> Tuple[np.ndarray, np.ndarray]:
+    first_idxs, second_idxs = np.triu_indices(num_records, k=1)
+
+    return first_idxs, second_idxs
@@ -0,0 +1,335 @@
+from typing import Dict, Iterable, List, Optional, Set, cast
+
+import numpy as np
+
+from ..shapes import Rectangle
+from .masks import CollisionFilter
+from .node import (
+    IntersactionInfo,
+    LeafTreeNode,
+    ParentRelativeType,
+    SplitTreeNode,
+    TreeNode,
+    TreeNodeType,
+)
+from .record import ItemId, Record
+from .splitting import ISplitStrategy, LoadGiniSplitStrategy, SplitCandidates
+from .tree import KDTree
+
+NodePath = List[TreeNode]
+
+
+class DynamicKDTree:
+    def __init__(
+        self,
+        records: List[Record],
+        alpha: float = 0.5,
+        max_depth: int = -1,
+        num_records_stop: int = 1,
+        rebuild_ratio: float = 0.5,
+        split_strategy: Optional[ISplitStrategy] = None,
+    ) -> None:
+        if split_strategy is None:
+            split_strategy = LoadGiniSplitStrategy(alpha=alpha)
+
+        self._split_strategy = split_strategy
+        self._max_depth = max_depth
+        self._num_records_stop = num_records_stop
+        self._rebuild_ratio = rebuild_ratio
+
+        self._item_id2records: Dict[ItemId, List[Record]] = {}
+        self._record_id2path: Dict[int, NodePath] = {}
+        self._dirty_node_ids: Set[int] = set()
+
+        for record in records:
+            self._item_id2records.setdefault(record.item_id, []).append(record)
+
+        self.root: Optional[TreeNode] = self._build_subtree(
+            records=records,
+            prefix=[],
+            parent_relative=ParentRelativeType.ROOT,
+        )
+
+    def insert(self, records: Iterable[Record]) -> None:
+        for record in records:
+            self._item_id2records.setdefault(record.item_id, []).append(record)
+            self._insert_record(record, prefix=[])
+
+    def remove(self, item_id: ItemId) -> None:
+        for record in self._item_id2records.pop(item_id, []):
+            path = self._record_id2path.pop(id(record))
+            self._remove_record(record, path)
+
+    def update(self, item_id: ItemId, records: List[Record]) -> None:
+        old_records = self._item_id2records.get(item_id, [])
+
+        if len(old_records) != len(records):
+            self.remove(item_id)
+            self.insert(records)
+            return
+
+        for old_record, record in zip(old_records, records):
+            self._move_record(old_record, record)
+
+        self._item_id2records[item_id] = list(records)
+
+    def rebalance(self) -> None:
+        if self.root is not None:
+            self._rebalance(self.root, prefix=[])
+
+        self._dirty_node_ids.clear()
+
+    def generate_colliding_items(
+        self,
+        collidable_pairs: CollisionFilter,
+    ) -> Iterable[IntersactionInfo]:
+        if self.root is None:
+            return
+
+        yield from self.root.generate_intersections(
+            collidable_pairs=collidable_pairs,
+        )
+
+    def traverse_nodes(self) -> Iterable[TreeNode]:
+        if self.root is None:
+            return
+
+        yield from self.root.traverse_subnodes()
+
+    def _move_record(self, old_record: Record, record: Record) -> None:
+        path = self._record_id2path.pop(id(old_record))
+        depth = self._get_fitting_depth(path, record.bounding_box)
+
+        if depth < len(path) - 1:
+            self._insert_record(record, prefix=path[: depth + 1])
+            self._remove_record(old_record, path)
+            return
+
+        leaf = cast(LeafTreeNode, path[-1])
+        leaf.items = [
+            record if item is old_record else item for item in leaf.items
+        ]
+        self._record_id2path[id(record)] = path
+        self._reset_bounding_boxes(path)
+
+    def _insert_record(self, record: Record, prefix: NodePath) -> None:
+        if self.root is None:
+            self.root = LeafTreeNode(
+                type=TreeNodeType.LEAF,
+                parent_relative=ParentRelativeType.ROOT,
+            )
+
+        path = list(prefix) if prefix else [self.root]
+        node = path[-1]
+
+        while isinstance(node, SplitTreeNode):
+            side = self._get_side(node, record.bounding_box)
+
+            subnode = self._get_subnode(node, side)
+            if subnode is None:
+                subnode = LeafTreeNode(
+                    type=TreeNodeType.LEAF,
+                    parent_relative=side,
+                )
+                self._set_subnode(node, side, subnode)
+
+            path.append(subnode)
+            node = subnode
+
+        leaf = cast(LeafTreeNode, node)
+        leaf.items.append(record)
+
+        self._record_id2path[id(record)] = path
+        self._reset_bounding_boxes(path)
+
+    def _remove_record(self, record: Record, path: NodePath) -> None:
+        leaf = cast(LeafTreeNode, path[-1])
+        leaf.items = [item for item in leaf.items if item is not record]
+        self._reset_bounding_boxes(path)
+
+        for depth in reversed(range(len(path))):
+            node = path[depth]
+            if not self._is_empty(node):
+                break
+
+            self._replace_node(path[:depth], node.parent_relative, None)
+
+    def _rebalance(self, node: TreeNode, prefix: NodePath) -> None:
+        if id(node) not in self._dirty_node_ids:
+            return
+
+        if self._is_degraded(node, depth=len(prefix)):
+            subtree = self._build_subtree(
+                records=list(node.generate_items()),
+                prefix=prefix,
+                parent_relative=node.parent_relative,
+            )
+            self._replace_node(prefix, node.parent_relative, subtree)
+            return
+
+        if isinstance(node, SplitTreeNode):
+            path = prefix + [node]
+
+            for subnode in [node.left, node.middle, node.right]:
+                if subnode is not None:
+                    self._rebalance(subnode, prefix=path)
+
+    def _is_degraded(self, node: TreeNode, depth: int) -> bool:
+        if isinstance(node, LeafTreeNode):
+            if depth == self._max_depth:
+                return False
+
+            return len(node.items) > 2 * self._num_records_stop
+
+        elif isinstance(node, SplitTreeNode):
+            score = self._calculate_score(node)
+
+            return score < node.score * self._rebuild_ratio
+
+        return False
+
+    def _build_subtree(
+        self,
+        records: List[Record],
+        prefix: NodePath,
+        parent_relative: ParentRelativeType,
+    ) -> Optional[TreeNode]:
+        if not records:
+            return None
+
+        max_depth = self._max_depth
+        if max_depth >= 0:
+            max_depth -= len(prefix)
+
+        subtree = KDTree(
+            records=records,
+            max_depth=max_depth,
+            num_records_stop=self._num_records_stop,
+            split_strategy=self._split_strategy,
+        ).root
+        subtree.parent_relative = parent_relative
+
+        self._register_paths(subtree, prefix)
+
+        return subtree
+
+    def _register_paths(self, node: TreeNode, prefix: NodePath) -> None:
+        path = prefix + [node]
+
+        if isinstance(node, LeafTreeNode):
+            for record in node.items:
+                self._record_id2path[id(record)] = path
+
+        elif isinstance(node, SplitTreeNode):
+            for subnode in [node.left, node.middle, node.right]:
+                if subnode is not None:
+                    self._register_paths(subnode, path)
+
+    def _replace_node(
+        self,
+        prefix: NodePath,
+        parent_relative: ParentRelativeType,
+        node: Optional[TreeNode],
+    ) -> None:
+        if not prefix:
+            self.root = node
+            return
+
+        parent = cast(SplitTreeNode, prefix[-1])
+        self._set_subnode(parent, parent_relative, node)
+
+    def _get_fitting_depth(self, path: NodePath, bbox: Rectangle) -> int:
+        for depth, node in enumerate(path[:-1]):
+            split_node = cast(SplitTreeNode, node)
+            side = self._get_side(split_node, bbox)
+
+            if side != path[depth + 1].parent_relative:
+                return depth
+
+        return len(path) - 1
+
+    @staticmethod
+    def _get_side(node: SplitTreeNode, bbox: Rectangle) -> ParentRelativeType:
+        if node.type == TreeNodeType.HORISONTAL:
+            lower, upper = bbox.left, bbox.right
+        else:
+            lower, upper = bbox.top, bbox.bottom
+
+        if upper < node.threashold:
+            return ParentRelativeType.LEFT
+
+        if lower > node.threashold:
+            return ParentRelativeType.RIGHT
+
+        return ParentRelativeType.MIDDLE
+
+    @staticmethod
+    def _get_subnode(
+        node: SplitTreeNode, side: ParentRelativeType
+    ) -> Optional[TreeNode]:
+        if side == ParentRelativeType.LEFT:
+            return node.left
+
+        elif side == ParentRelativeType.RIGHT:
+            return node.right
+
+        return node.middle
+
+    @staticmethod
+    def _set_subnode(
+        node: SplitTreeNode,
+        side: ParentRelativeType,
+        subnode: Optional[TreeNode],
+    ) -> None:
+        if side == ParentRelativeType.LEFT:
+            node.left = subnode
+
+        elif side == ParentRelativeType.RIGHT:
+            node.right = subnode
+
+        else:
+            node.middle = subnode
+
+    def _calculate_score(self, node: SplitTreeNode) -> float:
+        left, top, right, bottom = node.bounds
+        if node.type == TreeNodeType.HORISONTAL:
+            lower, upper = left, right
+        else:
+            lower, upper = top, bottom
+
+        scores = self._split_strategy.get_scores(
+            SplitCandidates(
+                num_left=np.array([self._count_records(node.left)]),
+                num_middle=np.array([self._count_records(node.middle)]),
+                num_right=np.array([self._count_records(node.right)]),
+                thresholds=np.array([node.threashold]),
+                lower=np.array([lower]),
+                upper=np.array([upper]),
+            )
+        )
+
+        return float(scores[0])
+
+    @staticmethod
+    def _count_records(node: Optional[TreeNode]) -> int:
+        if node is None:
+            return 0
+
+        return node.num_records
+
+    @staticmethod
+    def _is_empty(node: TreeNode) -> bool:
+        if isinstance(node, LeafTreeNode):
+            return not node.items
+
+        elif isinstance(node, SplitTreeNode):
+            subnodes = [node.left, node.middle, node.right]
+
+            return all(subnode is None for subnode in subnodes)
+
+        return False
+
+    def _reset_bounding_boxes(self, path: NodePath) -> None:
+        for node in path:
+            node.reset_bounding_box()
+            self._dirty_node_ids.add(id(node))
@@ -0,0 +1,78 @@
+from typing import Collection, Dict, Tuple, Union
+
+import numpy as np
+
+from .record import ClassId
+
+ClassMask = int
+CollidablePair = Tuple[ClassId, ClassId]
+
+MAX_CLASS_ID = 62
+ALL_CLASSES_MASK: ClassMask = (1 << (MAX_CLASS_ID + 1)) - 1
+
+
+def get_class_mask(class_id: ClassId) -> ClassMask:
+    if not 0 <= class_id <= MAX_CLASS_ID:
+        raise ValueError(
+            f"Class id {class_id} is out of range [0, {MAX_CLASS_ID}]"
+        )
+
+    return 1 << class_id
+
+
+def get_class_masks(class_ids: np.ndarray) -> np.ndarray:
+    if len(class_ids) > 0 and (
+        class_ids.min() < 0 or class_ids.max() > MAX_CLASS_ID
+    ):
+        raise ValueError(f"Class ids are out of range [0, {MAX_CLASS_ID}]")
+
+    return np.left_shift(np.int64(1), class_ids.astype(np.int64))
+
+
+class CollisionMasks:
+    def __init__(self, collidable_pairs: Collection[CollidablePair]) -> None:
+        self.class_id2mask: Dict[ClassId, ClassMask] = {}
+        for class_id1, class_id2 in collidable_pairs:
+            self._add_pair(class_id1, class_id2)
+            self._add_pair(class_id2, class_id1)
+
+        self._table = np.zeros(MAX_CLASS_ID + 1, dtype=np.int64)
+        for class_id, mask in self.class_id2mask.items():
+            self._table[class_id] = mask
+
+    def get_mask(self, class_id: ClassId) -> ClassMask:
+        return self.class_id2mask.get(class_id, 0)
+
+    def get_masks(self, class_ids: np.ndarray) -> np.ndarray:
+        return self._table[class_ids]
+
+    def get_collision_mask(self, class_mask: ClassMask) -> ClassMask:
+        collision_mask = 0
+        for class_id, mask in self.class_id2mask.items():
+            if class_mask >> class_id & 1:
+                collision_mask |= mask
+
+        return collision_mask
+
+    def is_collidable(self, class_id1: ClassId, class_id2: ClassId) -> bool:
+        return bool(self.get_mask(class_id1) >> class_id2 & 1)
+
+    def is_masks_collidable(
+        self, class_mask1: ClassMask, class_mask2: ClassMask
+    ) -> bool:
+        return bool(self.get_collision_mask(class_mask1) & class_mask2)
+
+    def _add_pair(self, class_id1: ClassId, class_id2: ClassId) -> None:
+        self.class_id2mask[class_id1] = self.get_mask(
+            class_id1
+        ) | get_class_mask(class_id2)
+
+
+CollisionFilter = Union[Collection[CollidablePair], CollisionMasks]
+
+
+def get_collision_masks(collision_filter: CollisionFilter) -> CollisionMasks:
+    if isinstance(collision_filter, CollisionMasks):
+        return collision_filter
+
+    return CollisionMasks(collision_filter)
@@ -1,17 +1,97 @@
-from abc import ABC, abstractmethod, abstractproperty
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import cached_property
-from typing import Collection, Iterable, Iterator, List, Optional, Set, Tuple
-
-from ..intersecting import IntersectionStrict, get_intersection
-from ..shapes import Rectangle
-from .record import ClassId, ItemId, Record
+from math import inf
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ..intersecting import IntersectionStrict, get_intersections
+from ..shapes import Rectangle, Shape
+from .masks import (
+    ClassMask,
+    CollisionFilter,
+    CollisionMasks,
+    get_class_mask,
+    get_collision_masks,
+)
+from .record import Bounds, ItemId, Record
 
 IntersactionPair = Tuple[ItemId, ItemId]
-CollidablePair = Tuple[ClassId, ClassId]
 IntersactionInfo = Tuple[IntersactionPair, IntersectionStrict]
 
+EMPTY_BOUNDS: Bounds = (inf, inf, -inf, -inf)
+
+
+def is_bounds_intersected(a: Bounds, b: Bounds) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def union_bounds(bounds: Iterable[Bounds]) -> Bounds:
+    left, top, right, bottom = EMPTY_BOUNDS
+    for b in bounds:
+        left = min(left, b[0])
+        top = min(top, b[1])
+        right = max(right, b[2])
+        bottom = max(bottom, b[3])
+
+    return left, top, right, bottom
+
+
+def generate_item_pair_intersections(
+    item_pairs: Sequence[IntersactionPair],
+    shape_pairs: Sequence[Tuple[Shape, Shape]],
+    collided: Set[IntersactionPair],
+) -> Iterable[IntersactionInfo]:
+    item_pair2candidate_idxs: Dict[IntersactionPair, List[int]] = {}
+    for idx, (item_id1, item_id2) in enumerate(item_pairs):
+        key = (min(item_id1, item_id2), max(item_id1, item_id2))
+        item_pair2candidate_idxs.setdefault(key, []).append(idx)
+
+    pending = [
+        candidate_idxs
+        for (item_id1, item_id2), candidate_idxs in (
+            item_pair2candidate_idxs.items()
+        )
+        if (item_id1, item_id2) not in collided
+        and (item_id2, item_id1) not in collided
+    ]
+
+    found: List[Tuple[int, IntersectionStrict]] = []
+    rank = 0
+    while pending:
+        intersections = get_intersections(
+            [shape_pairs[candidate_idxs[rank]] for candidate_idxs in pending]
+        )
+
+        next_pending = []
+        for candidate_idxs, intersection in zip(pending, intersections):
+            if intersection is not None:
+                found.append((candidate_idxs[rank], intersection))
+            elif rank + 1 < len(candidate_idxs):
+                next_pending.append(candidate_idxs)
+
+        pending = next_pending
+        rank += 1
+
+    found.sort(key=lambda candidate: candidate[0])
+    for idx, intersection in found:
+        ids = item_pairs[idx]
+        if ids in collided or ids[::-1] in collided:
+            continue
+
+        collided.add(ids)
+
+        yield ids, intersection
+
 
 class TreeNodeType(Enum):
     LEAF = auto()
@@ -31,45 +111,88 @@ class TreeNode(ABC):
     type: TreeNodeType
     parent_relative: ParentRelativeType
 
-    @abstractproperty
-    def bounding_box(self) -> Rectangle:
+    @cached_property
+    def bounds(self) -> Bounds:
+        return self._calculate_bounds()
+
+    @abstractmethod
+    def _calculate_bounds(self) -> Bounds:
+        pass
+
+    @cached_property
+    def class_mask(self) -> ClassMask:
+        return self._calculate_class_mask()
+
+    @abstractmethod
+    def _calculate_class_mask(self) -> ClassMask:
         pass
 
+    @cached_property
+    def num_records(self) -> int:
+        return self._calculate_num_records()
+
+    @abstractmethod
+    def _calculate_num_records(self) -> int:
+        pass
+
+    @property
+    def bounding_box(self) -> Rectangle:
+        left, top, right, bottom = self.bounds
+
+        return Rectangle(
+            left=left,
+            top=top,
+            width=right - left,
+            height=bottom - top,
+        )
+
     @property
     def is_leaf(self) -> bool:
         return self.type == TreeNodeType.LEAF
 
+    def set_bounds(self, bounds: Bounds) -> None:
+        self.__dict__["bounds"] = bounds
+
+    def reset_bounding_box(self) -> None:
+        self.__dict__.pop("bounds", None)
+        self.__dict__.pop("class_mask", None)
+        self.__dict__.pop("num_records", None)
+
     @staticmethod
     def _generate_intersactions_robust(
         node: "Optional[TreeNode]",
-        collidable_pairs: Collection[Tuple[ClassId, ClassId]],
+        masks: CollisionMasks,
         collided: Optional[Set[IntersactionPair]] = None,
     ) -> Iterable[IntersactionInfo]:
         if node is None:
             return
 
         yield from node.generate_intersections(
-            collidable_pairs=collidable_pairs,
+            collidable_pairs=masks,
             collided=collided,
         )
 
     def generate_intersections(
         self,
-        collidable_pairs: Collection[Tuple[ClassId, ClassId]],
+        collidable_pairs: CollisionFilter,
         collided: Optional[Set[IntersactionPair]] = None,
     ) -> Iterable[IntersactionInfo]:
         if collided is None:
             collided = set()
 
+        masks = get_collision_masks(collidable_pairs)
+        if not masks.is_masks_collidable(self.class_mask, self.class_mask):
+            return
+
         yield from self._generate_intersections(
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
     @abstractmethod
     def _generate_intersections(
         self,
-        collidable_pairs: Collection[CollidablePair],
+        masks: CollisionMasks,
         collided: Set[IntersactionPair],
     ) -> Iterable[IntersactionInfo]:
         pass
@@ -78,7 +201,7 @@ class TreeNode(ABC):
     def _generate_record_intersections_robust(
         node: "Optional[TreeNode]",
         record: Record,
-        collidable_pairs: Collection[CollidablePair],
+        masks: CollisionMasks,
         collided: Optional[Set[IntersactionPair]] = None,
     ) -> Iterable[IntersactionInfo]:
         if node is None:
@@ -86,25 +209,29 @@ class TreeNode(ABC):
 
         yield from node.generate_record_intersections(
             record=record,
-            collidable_pairs=collidable_pairs,
+            collidable_pairs=masks,
             collided=collided,
         )
 
     def generate_record_intersections(
         self,
         record: Record,
-        collidable_pairs: Collection[CollidablePair],
+        collidable_pairs: CollisionFilter,
         collided: Optional[Set[IntersactionPair]] = None,
     ) -> Iterable[IntersactionInfo]:
         if collided is None:
             collided = set()
 
-        if not self.bounding_box.is_intersected(record.bounding_box):
+        masks = get_collision_masks(collidable_pairs)
+        if not masks.get_mask(record.class_id) & self.class_mask:
+            return
+
+        if not is_bounds_intersected(self.bounds, record.bounds):
             return
 
         yield from self._generate_record_intersections(
             record=record,
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
@@ -112,7 +239,7 @@ class TreeNode(ABC):
     def _generate_record_intersections(
         self,
         record: Record,
-        collidable_pairs: Collection[CollidablePair],
+        masks: CollisionMasks,
         collided: Set[IntersactionPair],
     ) -> Iterable[IntersactionInfo]:
         pass
@@ -158,46 +285,62 @@ class TreeNode(ABC):
 class LeafTreeNode(TreeNode):
     items: List[Record] = field(default_factory=list)
 
-    @cached_property
-    def bounding_box(self) -> Rectangle:
-        bboxes = [item.bounding_box for item in self.items]
+    def _calculate_bounds(self) -> Bounds:
+        return union_bounds(item.bounds for item in self.items)
 
-        bbox_iter = iter(bboxes)
-        bbox = next(bbox_iter)
+    def _calculate_class_mask(self) -> ClassMask:
+        class_mask = 0
+        for item in self.items:
+            class_mask |= get_class_mask(item.class_id)
 
-        for b in bbox_iter:
-            bbox = bbox.union(b)
+        return class_mask
 
-        return bbox
+    def _calculate_num_records(self) -> int:
+        return len(self.items)
 
     def _generate_intersections(
         self,
-        collidable_pairs: Collection[CollidablePair],
+        masks: CollisionMasks,
         collided: Set[IntersactionPair],
     ) -> Iterable[IntersactionInfo]:
-        for record in self.items:
-            yield from self._generate_record_intersections(
-                record=record,
-                collidable_pairs=collidable_pairs,
-                collided=collided,
-            )
+        candidates = [
+            (record, item)
+            for idx, record in enumerate(self.items)
+            for item in self.items[idx + 1 :]
+        ]
+
+        yield from self._generate_candidate_intersections(
+            candidates=candidates,
+            masks=masks,
+            collided=collided,
+        )
 
     def _generate_record_intersections(
         self,
         record: Record,
-        collidable_pairs: Collection[CollidablePair],
+        masks: CollisionMasks,
         collided: Set[IntersactionPair],
     ) -> Iterable[IntersactionInfo]:
-        for item in self.items:
+        yield from self._generate_candidate_intersections(
+            candidates=[(record, item) for item in self.items],
+            masks=masks,
+            collided=collided,
+        )
+
+    def _generate_candidate_intersections(
+        self,
+        candidates: List[Tuple[Record, Record]],
+        masks: CollisionMasks,
+        collided: Set[IntersactionPair],
+    ) -> Iterable[IntersactionInfo]:
+        pairs = []
+        for record, item in candidates:
             idx1 = record.item_id
             idx2 = item.item_id
 
             if idx1 == idx2:
                 continue
 
-            if (idx1, idx2) in collided or (idx2, idx1) in collided:
-                continue
-
             class1 = record.class_id
             class2 = item.class_id
 
@@ -205,19 +348,21 @@ class LeafTreeNode(TreeNode):
                 idx1, idx2 = idx2, idx1
                 class1, class2 = class2, class1
 
-            if (class1, class2) not in collidable_pairs:
+            if not masks.is_collidable(class1, class2):
                 continue
 
-            if not item.bounding_box.is_intersected(record.bounding_box):
+            if not is_bounds_intersected(item.bounds, record.bounds):
                 continue
 
-            intersection = get_intersection(record.shape, item.shape)
-            if intersection is None:
-                continue
+            pairs.append(((idx1, idx2), record, item))
 
-            collided.add((idx1, idx2))
-
-            yield (idx1, idx2), intersection
+        yield from generate_item_pair_intersections(
+            item_pairs=[ids for ids, _, _ in pairs],
+            shape_pairs=[
+                (record.shape, item.shape) for _, record, item in pairs
+            ],
+            collided=collided,
+        )
 
     def _generate_items(self) -> Iterator[Record]:
         yield from self.items
@@ -236,81 +381,92 @@ class SplitTreeNode(TreeNode):
     right: "Optional[TreeNode]" = None
     middle: "Optional[TreeNode]" = None
 
-    @cached_property
-    def bounding_box(self) -> Rectangle:
-        subnodes = [self.left, self.middle, self.right]
-        bboxes = [node.bounding_box for node in subnodes if node is not None]
+    score: float = 0.0
+
+    def _calculate_bounds(self) -> Bounds:
+        return union_bounds(
+            node.bounds
+            for node in [self.left, self.middle, self.right]
+            if node is not None
+        )
 
-        bbox_iter = iter(bboxes)
-        bbox = next(bbox_iter)
+    def _calculate_class_mask(self) -> ClassMask:
+        class_mask = 0
+        for node in [self.left, self.middle, self.right]:
+            if node is not None:
+                class_mask |= node.class_mask
 
-        for b in bbox_iter:
-            bbox = bbox.union(b)
+        return class_mask
 
-        return bbox
+    def _calculate_num_records(self) -> int:
+        return sum(
+            node.num_records
+            for node in [self.left, self.middle, self.right]
+            if node is not None
+        )
 
     def _generate_intersections(
         self,
-        collidable_pairs: Collection[CollidablePair],
+        masks: CollisionMasks,
         collided: Set[IntersactionPair],
     ) -> Iterable[IntersactionInfo]:
         for record in self._generate_items_robust(self.middle):
             yield from self._generate_record_intersections_robust(
                 node=self.left,
                 record=record,
-                collidable_pairs=collidable_pairs,
+                masks=masks,
                 collided=collided,
             )
 
             yield from self._generate_record_intersections_robust(
                 node=self.right,
                 record=record,
-                collidable_pairs=collidable_pairs,
+                masks=masks,
                 collided=collided,
             )
 
         yield from self._generate_intersactions_robust(
             node=self.left,
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
         yield from self._generate_intersactions_robust(
             node=self.middle,
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
         yield from self._generate_intersactions_robust(
             node=self.right,
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
     def _generate_record_intersections(
         self,
         record: Record,
-        collidable_pairs: Collection[CollidablePair],
+        masks: CollisionMasks,
         collided: Set[IntersactionPair],
     ) -> Iterable[IntersactionInfo]:
         yield from self._generate_record_intersections_robust(
             node=self.left,
             record=record,
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
         yield from self._generate_record_intersections_robust(
             node=self.middle,
             record=record,
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
         yield from self._generate_record_intersections_robust(
             node=self.right,
             record=record,
-            collidable_pairs=collidable_pairs,
+            masks=masks,
             collided=collided,
         )
 
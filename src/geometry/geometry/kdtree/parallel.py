@@ -0,0 +1,178 @@
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .masks import CollisionFilter, get_collision_masks
+from .node import IntersactionInfo, IntersactionPair
+from .tree import KDTree, WorkUnit
+
+
+class SharedTreeRef(NamedTuple):
+    name: str
+    size: int
+    version: int
+
+
+class KDTreeQueryPool:
+    def __init__(
+        self,
+        num_workers: int,
+        split_depth: int = 2,
+        min_parallel_records: int = 256,
+    ) -> None:
+        if num_workers < 1:
+            raise ValueError("Number of workers must be positive")
+
+        self.num_workers = num_workers
+        self.split_depth = split_depth
+        self.min_parallel_records = min_parallel_records
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tree_memory: Optional[SharedMemory] = None
+        self._shared_tree: Optional[KDTree] = None
+        self._shared_tree_ref: Optional[SharedTreeRef] = None
+        self._version = 0
+
+    def __enter__(self) -> "KDTreeQueryPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_executor"] = None
+        state["_tree_memory"] = None
+        state["_shared_tree"] = None
+        state["_shared_tree_ref"] = None
+
+        return state
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        self._release_tree_memory()
+
+    def generate_colliding_items(
+        self,
+        tree: KDTree,
+        collidable_pairs: CollisionFilter,
+        collided: Optional[Set[IntersactionPair]] = None,
+    ) -> Iterable[IntersactionInfo]:
+        if collided is None:
+            collided = set()
+
+        masks = get_collision_masks(collidable_pairs)
+        work_units = tree.get_work_units(self.split_depth)
+
+        num_records = len(tree.records.records)
+        if len(work_units) == 1 or num_records < self.min_parallel_records:
+            yield from tree.generate_work_units_intersections(
+                collidable_pairs=masks,
+                work_units=work_units,
+                collided=collided,
+            )
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.num_workers)
+
+        tree_ref = self._share_tree(tree)
+        futures: List[Future] = [
+            self._executor.submit(
+                generate_work_units_intersections,
+                tree_ref=tree_ref,
+                collidable_pairs=masks,
+                work_units=work_units[idx :: self.num_workers],
+            )
+            for idx in range(min(self.num_workers, len(work_units)))
+        ]
+
+        for future in futures:
+            for ids, intersection in future.result():
+                if ids in collided or ids[::-1] in collided:
+                    continue
+
+                collided.add(ids)
+
+                yield ids, intersection
+
+    def _share_tree(self, tree: KDTree) -> SharedTreeRef:
+        if tree is self._shared_tree and self._shared_tree_ref is not None:
+            return self._shared_tree_ref
+
+        payload = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if self._tree_memory is None or self._tree_memory.size < len(payload):
+            self._release_tree_memory()
+            self._tree_memory = SharedMemory(create=True, size=2 * len(payload))
+
+        self._tree_memory.buf[: len(payload)] = payload
+        self._version += 1
+
+        self._shared_tree = tree
+        self._shared_tree_ref = SharedTreeRef(
+            name=self._tree_memory.name,
+            size=len(payload),
+            version=self._version,
+        )
+
+        return self._shared_tree_ref
+
+    def _release_tree_memory(self) -> None:
+        self._shared_tree = None
+        self._shared_tree_ref = None
+
+        if self._tree_memory is not None:
+            self._tree_memory.close()
+            self._tree_memory.unlink()
+            self._tree_memory = None
+
+
+_worker_tree: Optional[Tuple[SharedTreeRef, KDTree]] = None
+
+
+def generate_work_units_intersections(
+    tree_ref: SharedTreeRef,
+    collidable_pairs: CollisionFilter,
+    work_units: Sequence[WorkUnit],
+) -> List[IntersactionInfo]:
+    tree = _load_shared_tree(tree_ref)
+
+    return list(
+        tree.generate_work_units_intersections(
+            collidable_pairs=collidable_pairs,
+            work_units=work_units,
+        )
+    )
+
+
+def _load_shared_tree(tree_ref: SharedTreeRef) -> KDTree:
+    global _worker_tree
+
+    if _worker_tree is not None and _worker_tree[0] == tree_ref:
+        return _worker_tree[1]
+
+    memory = SharedMemory(name=tree_ref.name)
+    try:
+        payload = bytes(memory.buf[: tree_ref.size])
+    finally:
+        memory.close()
+
+    tree: KDTree = pickle.loads(payload)
+    _worker_tree = (tree_ref, tree)
+
+    return tree
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from ..basic import Point, Vec2
+from .record import Bounds, Record
+
+
+@dataclass
+class RayHit:
+    record: Record
+    t: float
+    point: Point
+
+
+@dataclass
+class Neighbour:
+    record: Record
+    distance: float
+
+
+def get_ray_bounds_entry(
+    origin: Point, direction: Vec2, bounds: Bounds, max_t: float
+) -> Optional[Tuple[float, float]]:
+    t_enter = 0.0
+    t_exit = max_t
+
+    left, top, right, bottom = bounds
+    slabs = [
+        (origin.x, direction.x, left, right),
+        (origin.y, direction.y, top, bottom),
+    ]
+    for p, d, lower, upper in slabs:
+        if d == 0:
+            if p < lower or p > upper:
+                return None
+
+            continue
+
+        t1 = (lower - p) / d
+        t2 = (upper - p) / d
+        if t1 > t2:
+            t1, t2 = t2, t1
+
+        t_enter = max(t_enter, t1)
+        t_exit = min(t_exit, t2)
+
+        if t_enter > t_exit:
+            return None
+
+    return t_enter, t_exit
+
+
+def get_distance_point_bounds(p: Point, bounds: Bounds) -> float:
+    left, top, right, bottom = bounds
+
+    dx = max(left - p.x, 0.0, p.x - right)
+    dy = max(top - p.y, 0.0, p.y - bottom)
+
+    return (dx * dx + dy * dy) ** 0.5
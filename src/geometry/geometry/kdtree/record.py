@@ -1,10 +1,13 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Tuple
 
 from ..shapes import Rectangle, Shape
 
 Id = int
 ItemId = Id
 ClassId = Id
+Bounds = Tuple[float, float, float, float]
 
 
 @dataclass
@@ -13,3 +16,9 @@ class Record:
     class_id: ClassId
     shape: Shape
     bounding_box: Rectangle
+
+    @cached_property
+    def bounds(self) -> Bounds:
+        bbox = self.bounding_box
+
+        return bbox.left, bbox.top, bbox.right, bbox.bottom
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def get_score(l: int, m: int, r: int, alpha: float = 0.5) -> float:
     return alpha * get_load_score(l, m, r) + (1 - alpha) * get_gini_score(
         l, m, r
@@ -17,3 +20,14 @@ def get_load_score(l: int, m: int, r: int) -> float:
     score = 1 - m / n
 
     return score
+
+
+def get_scores(
+    l: np.ndarray, m: np.ndarray, r: np.ndarray, alpha: float = 0.5
+) -> np.ndarray:
+    n = l + m + r
+
+    load_scores = 1 - m / n
+    gini_scores = 4 * l * r / (n * n)
+
+    return alpha * load_scores + (1 - alpha) * gini_scores
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+from .scores import get_scores
+
+
+@dataclass
+class SplitCandidates:
+    num_left: np.ndarray
+    num_middle: np.ndarray
+    num_right: np.ndarray
+    thresholds: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+
+    @property
+    def num_total(self) -> np.ndarray:
+        return self.num_left + self.num_middle + self.num_right
+
+
+class ISplitStrategy(Protocol):
+    def get_scores(self, candidates: SplitCandidates) -> np.ndarray:
+        pass
+
+    def is_splitting(self, score: float) -> bool:
+        pass
+
+
+class LoadGiniSplitStrategy:
+    def __init__(self, alpha: float = 0.5) -> None:
+        self.alpha = alpha
+
+    def get_scores(self, candidates: SplitCandidates) -> np.ndarray:
+        return get_scores(
+            l=candidates.num_left,
+            m=candidates.num_middle,
+            r=candidates.num_right,
+            alpha=self.alpha,
+        )
+
+    def is_splitting(self, score: float) -> bool:
+        return True
+
+
+class MedianSplitStrategy:
+    def get_scores(self, candidates: SplitCandidates) -> np.ndarray:
+        num_separated = np.minimum(candidates.num_left, candidates.num_right)
+
+        return 2 * num_separated / candidates.num_total
+
+    def is_splitting(self, score: float) -> bool:
+        return score > 0.0
+
+
+class SAHSplitStrategy:
+    def __init__(
+        self,
+        traversal_cost: float = 1.0,
+        intersection_cost: float = 1.0,
+    ) -> None:
+        self.traversal_cost = traversal_cost
+        self.intersection_cost = intersection_cost
+
+    def get_scores(self, candidates: SplitCandidates) -> np.ndarray:
+        extent = candidates.upper - candidates.lower
+        has_extent = extent > 0
+
+        left_ratio = np.where(
+            has_extent,
+            (candidates.thresholds - candidates.lower)
+            / np.where(has_extent, extent, 1.0),
+            0.5,
+        )
+        right_ratio = 1 - left_ratio
+
+        split_cost = self.traversal_cost + self.intersection_cost * (
+            left_ratio * (candidates.num_left + candidates.num_middle)
+            + right_ratio * (candidates.num_right + candidates.num_middle)
+        )
+        leaf_cost = self.intersection_cost * candidates.num_total
+
+        return leaf_cost / split_cost
+
+    def is_splitting(self, score: float) -> bool:
+        return score > 1.0
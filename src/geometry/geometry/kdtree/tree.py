@@ -1,30 +1,121 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Collection, Iterable, List, Set
-
+from heapq import heappop, heappush
+from math import inf
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from ..basic import Point, Vec2
+from ..distance import get_distance_point_shape
+from ..shapes import Rectangle
+from ..time_of_impact import get_time_of_impact_point_shape
+from .arrays import (
+    RecordArrays,
+    generate_candidate_intersections,
+    get_boxes_intersected,
+    get_pair_idxs,
+    get_record_boxes,
+)
+from .masks import (
+    ALL_CLASSES_MASK,
+    ClassMask,
+    CollisionFilter,
+    CollisionMasks,
+    get_collision_masks,
+)
 from .node import (
-    CollidablePair,
     IntersactionInfo,
+    IntersactionPair,
     LeafTreeNode,
     ParentRelativeType,
     SplitTreeNode,
     TreeNode,
     TreeNodeType,
 )
-from .record import Record
-from .scores import get_score
+from .queries import (
+    Neighbour,
+    RayHit,
+    get_distance_point_bounds,
+    get_ray_bounds_entry,
+)
+from .record import Bounds, ItemId, Record
+from .splitting import ISplitStrategy, LoadGiniSplitStrategy, SplitCandidates
+
+
+class PartType(Enum):
+    LEFT = 0
+    MIDDLE = 1
+    RIGHT = 2
+
+
+class Axis(Enum):
+    X = 0
+    Y = 1
+
 
+class WorkUnitType(Enum):
+    SUBTREE = 0
+    CROSS = 1
 
-class BoundType(Enum):
-    OPENING = 0
-    CLOSING = 1
+
+WorkUnit = Tuple[int, int]
 
 
 @dataclass
-class RecordInfo:
-    bound: float
-    idx: int
-    bound_type: BoundType
+class SortedBounds:
+    bounds: np.ndarray
+    ids: np.ndarray
+    closing: np.ndarray
+
+    @classmethod
+    def from_boxes(cls, boxes: np.ndarray) -> "SortedBounds":
+        ids = np.arange(len(boxes))
+
+        all_ids = np.concatenate([ids, ids])
+        closing = np.concatenate(
+            [
+                np.zeros(len(boxes), dtype=bool),
+                np.ones(len(boxes), dtype=bool),
+            ]
+        )
+
+        rows = []
+        for openings, closings in [
+            (boxes[:, 0], boxes[:, 2]),
+            (boxes[:, 1], boxes[:, 3]),
+        ]:
+            bounds = np.concatenate([openings, closings])
+            order = np.lexsort((all_ids, closing, bounds))
+            rows.append((bounds[order], all_ids[order], closing[order]))
+
+        return cls(
+            bounds=np.array([row[0] for row in rows]).reshape(2, -1),
+            ids=np.array([row[1] for row in rows], dtype=int).reshape(2, -1),
+            closing=np.array([row[2] for row in rows], dtype=bool).reshape(
+                2, -1
+            ),
+        )
+
+    @property
+    def num_ids(self) -> int:
+        return len(self.ids[0]) // 2
+
+    @property
+    def bounding_box(self) -> List[float]:
+        if len(self.bounds[0]) == 0:
+            return [np.inf, np.inf, -np.inf, -np.inf]
+
+        (left, right), (top, bottom) = self.bounds[:, [0, -1]].tolist()
+
+        return [left, top, right, bottom]
+
+    def select(self, mask: np.ndarray) -> "SortedBounds":
+        return SortedBounds(
+            bounds=self.bounds[mask].reshape(2, -1),
+            ids=self.ids[mask].reshape(2, -1),
+            closing=self.closing[mask].reshape(2, -1),
+        )
 
 
 class KDTree:
@@ -34,214 +125,583 @@ class KDTree:
         alpha: float = 0.5,
         max_depth: int = -1,
         num_records_stop: int = 1,
+        split_strategy: Optional[ISplitStrategy] = None,
     ) -> None:
-        self._alpha = alpha
+        if split_strategy is None:
+            split_strategy = LoadGiniSplitStrategy(alpha=alpha)
+
+        self._split_strategy = split_strategy
         self._max_depth = max_depth
         self._num_records_stop = num_records_stop
-        self._records = records
 
-        self.root: TreeNode
+        self.node_types: np.ndarray
+        self.parent_relatives: np.ndarray
+        self.thresholds: np.ndarray
+        self.scores: np.ndarray
+        self.children: np.ndarray
+        self.ranges: np.ndarray
+        self.boxes: np.ndarray
+        self.class_masks: np.ndarray
+        self.records: RecordArrays
+
+        self._root: Optional[TreeNode] = None
         self._build(records)
 
+    @property
+    def root(self) -> TreeNode:
+        if self._root is None:
+            self._root = self._materialize_node(0)
+
+        return self._root
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_root"] = None
+
+        return state
+
     def _build(self, records: List[Record]) -> None:
-        verticals = []
-        horizontals = []
-        for idx, r in enumerate(records):
-            verticals.append(
-                RecordInfo(
-                    bound=r.bounding_box.left,
-                    idx=idx,
-                    bound_type=BoundType.OPENING,
-                )
-            )
-            verticals.append(
-                RecordInfo(
-                    bound=r.bounding_box.right,
-                    idx=idx,
-                    bound_type=BoundType.CLOSING,
-                )
-            )
+        boxes = get_record_boxes(records)
 
-            horizontals.append(
-                RecordInfo(
-                    bound=r.bounding_box.top,
-                    idx=idx,
-                    bound_type=BoundType.OPENING,
-                )
-            )
-            horizontals.append(
-                RecordInfo(
-                    bound=r.bounding_box.bottom,
-                    idx=idx,
-                    bound_type=BoundType.CLOSING,
-                )
-            )
+        self._parts = np.zeros(len(records), dtype=np.int8)
+        self._order: List[int] = []
+        self._nodes: List[List[Any]] = []
 
-        verticals = sorted(
-            verticals, key=lambda r: (r.bound, r.bound_type.value)
+        self._build_subtree(
+            bounds=SortedBounds.from_boxes(boxes),
+            depth=0,
+            parent_relative=ParentRelativeType.ROOT,
         )
-        horizontals = sorted(
-            horizontals, key=lambda r: (r.bound, r.bound_type.value)
+
+        nodes = self._nodes
+        self.node_types = np.array([n[0] for n in nodes], dtype=np.int8)
+        self.parent_relatives = np.array([n[1] for n in nodes], dtype=np.int8)
+        self.thresholds = np.array([n[2] for n in nodes], dtype=float)
+        self.scores = np.array([n[3] for n in nodes], dtype=float)
+        self.children = np.array([n[4] for n in nodes], dtype=np.int32)
+        self.ranges = np.array([n[5] for n in nodes], dtype=np.int32)
+        self.boxes = np.array([n[6] for n in nodes], dtype=float)
+
+        order = np.array(self._order, dtype=int)
+        self.records = RecordArrays(
+            records=[records[idx] for idx in self._order],
+            boxes=boxes[order].reshape(-1, 4),
+            item_ids=np.array(
+                [records[idx].item_id for idx in self._order], dtype=np.int64
+            ),
+            class_ids=np.array(
+                [records[idx].class_id for idx in self._order], dtype=np.int64
+            ),
         )
 
-        self.root = self._build_subtree(
-            ids=set(range(len(records))),
-            records=records,
-            verticals=verticals,
-            horizontals=horizontals,
-            depth=0,
-            parent_relative=ParentRelativeType.ROOT,
+        record_masks = self.records.class_masks
+        self.class_masks = np.array(
+            [
+                np.bitwise_or.reduce(record_masks[start:stop])
+                for start, stop in self.ranges.tolist()
+            ],
+            dtype=np.int64,
         )
 
+        del self._parts, self._order, self._nodes
+
     def _build_subtree(
         self,
-        ids: Set[int],
-        records: List[Record],
-        verticals: List[RecordInfo],
-        horizontals: List[RecordInfo],
+        bounds: SortedBounds,
         depth: int,
         parent_relative: ParentRelativeType,
-    ) -> TreeNode:
-        if depth == self._max_depth or len(ids) <= self._num_records_stop:
-            return LeafTreeNode(
-                type=TreeNodeType.LEAF,
-                parent_relative=parent_relative,
-                items=[records[idx] for idx in ids],
-            )
-
-        vscores = self._calculate_bound_scores(
-            bounds=verticals,
-            num_total=len(ids),
-        )
-        hscores = self._calculate_bound_scores(
-            bounds=horizontals,
-            num_total=len(ids),
+    ) -> int:
+        node_idx = len(self._nodes)
+        start = len(self._order)
+
+        node = [
+            TreeNodeType.LEAF.value,
+            parent_relative.value,
+            0.0,
+            0.0,
+            [-1, -1, -1],
+            [start, start],
+            bounds.bounding_box,
+        ]
+        self._nodes.append(node)
+
+        num_ids = bounds.num_ids
+
+        if depth == self._max_depth or num_ids <= self._num_records_stop:
+            return self._fill_leaf(node_idx, bounds)
+
+        scores = self._calculate_bound_scores(
+            bounds=bounds,
+            num_total=num_ids,
         )
+        max_idxs = scores.argmax(axis=1)
+        max_vscore, max_hscore = scores[[0, 1], max_idxs].tolist()
+        max_score = max(max_vscore, max_hscore)
 
-        max_vscore = max(vscores)
-        max_hscore = max(hscores)
+        if not self._split_strategy.is_splitting(max_score):
+            return self._fill_leaf(node_idx, bounds)
 
         if max_vscore > max_hscore:
-            bounds = verticals
-            max_idx = vscores.index(max_vscore)
+            axis = Axis.X.value
             node_type = TreeNodeType.HORISONTAL
 
         else:
-            bounds = horizontals
-            max_idx = hscores.index(max_hscore)
+            axis = Axis.Y.value
             node_type = TreeNodeType.VERTICAL
 
-        threashold = (bounds[max_idx].bound + bounds[max_idx + 1].bound) / 2
+        max_idx = int(max_idxs[axis])
+        axis_bounds = bounds.bounds[axis]
+        threashold = float(
+            (axis_bounds[max_idx] + axis_bounds[max_idx + 1]) / 2
+        )
 
-        left_ids = set()
-        middle_ids = set()
-        right_ids = set(ids)
-        for idx, b in enumerate(bounds):
-            if b.bound_type == BoundType.OPENING:
-                right_ids.remove(b.idx)
-                middle_ids.add(b.idx)
+        prefix_ids = bounds.ids[axis, : max_idx + 1]
+        prefix_closing = bounds.closing[axis, : max_idx + 1]
 
-            elif b.bound_type == BoundType.CLOSING:
-                middle_ids.remove(b.idx)
-                left_ids.add(b.idx)
+        parts = self._parts
+        parts[bounds.ids[axis]] = PartType.RIGHT.value
+        parts[prefix_ids[~prefix_closing]] = PartType.MIDDLE.value
+        parts[prefix_ids[prefix_closing]] = PartType.LEFT.value
 
-            if idx == max_idx:
-                break
+        bound_parts = parts[bounds.ids]
 
-        left = (
-            self._build_subtree(
-                ids=left_ids,
-                records=records,
-                verticals=[b for b in verticals if b.idx in left_ids],
-                horizontals=[b for b in horizontals if b.idx in left_ids],
-                depth=depth + 1,
-                parent_relative=ParentRelativeType.LEFT,
-            )
-            if left_ids
-            else None
-        )
+        children = [-1, -1, -1]
+        for part_type, subtree_relative in [
+            (PartType.LEFT, ParentRelativeType.LEFT),
+            (PartType.MIDDLE, ParentRelativeType.MIDDLE),
+            (PartType.RIGHT, ParentRelativeType.RIGHT),
+        ]:
+            mask = bound_parts == part_type.value
+            if not mask.any():
+                continue
 
-        middle = (
-            self._build_subtree(
-                ids=middle_ids,
-                records=records,
-                verticals=[b for b in verticals if b.idx in middle_ids],
-                horizontals=[b for b in horizontals if b.idx in middle_ids],
+            children[part_type.value] = self._build_subtree(
+                bounds=bounds.select(mask),
                 depth=depth + 1,
-                parent_relative=ParentRelativeType.MIDDLE,
+                parent_relative=subtree_relative,
             )
-            if middle_ids
-            else None
-        )
 
-        right = (
-            self._build_subtree(
-                ids=right_ids,
-                records=records,
-                verticals=[b for b in verticals if b.idx in right_ids],
-                horizontals=[b for b in horizontals if b.idx in right_ids],
-                depth=depth + 1,
-                parent_relative=ParentRelativeType.RIGHT,
+        node[0] = node_type.value
+        node[2] = threashold
+        node[3] = max_score
+        node[4] = children
+        node[5] = [start, len(self._order)]
+
+        return node_idx
+
+    def _fill_leaf(self, node_idx: int, bounds: SortedBounds) -> int:
+        ids = np.sort(bounds.ids[0][~bounds.closing[0]])
+        self._order += ids.tolist()
+
+        node = self._nodes[node_idx]
+        node[5] = [node[5][0], len(self._order)]
+
+        return node_idx
+
+    def _calculate_bound_scores(
+        self, bounds: SortedBounds, num_total: int
+    ) -> np.ndarray:
+        num_closed = np.cumsum(bounds.closing[:, :-1], axis=1)
+        num_open = np.arange(1, len(bounds.closing[0])) - 2 * num_closed
+
+        return self._split_strategy.get_scores(
+            SplitCandidates(
+                num_left=num_closed,
+                num_middle=num_open,
+                num_right=num_total - num_closed - num_open,
+                thresholds=(bounds.bounds[:, :-1] + bounds.bounds[:, 1:]) / 2,
+                lower=bounds.bounds[:, :1],
+                upper=bounds.bounds[:, -1:],
             )
-            if right_ids
-            else None
         )
 
-        return SplitTreeNode(
-            type=node_type,
-            parent_relative=parent_relative,
-            left=left,
-            middle=middle,
-            right=right,
-            threashold=threashold,
+    def _materialize_node(self, node_idx: int) -> TreeNode:
+        node_type = TreeNodeType(int(self.node_types[node_idx]))
+        parent_relative = ParentRelativeType(
+            int(self.parent_relatives[node_idx])
         )
 
-    def _calculate_bound_scores(
-        self, bounds: List[RecordInfo], num_total: int
-    ) -> List[float]:
-        num_open = 0
-        num_closed = 0
-
-        scores = []
-        for idx, b in enumerate(bounds):
-            if idx == len(bounds) - 1:
-                break
+        node: TreeNode
+        if node_type == TreeNodeType.LEAF:
+            start, stop = self.ranges[node_idx].tolist()
 
-            if b.bound_type == BoundType.OPENING:
-                num_open += 1
+            node = LeafTreeNode(
+                type=node_type,
+                parent_relative=parent_relative,
+                items=list(self.records.records[start:stop]),
+            )
 
-            elif b.bound_type == BoundType.CLOSING:
-                num_open -= 1
-                num_closed += 1
+        else:
+            left, middle, right = [
+                self._materialize_node(idx) if idx >= 0 else None
+                for idx in self.children[node_idx].tolist()
+            ]
 
-            score = get_score(
-                l=num_closed,
-                m=num_open,
-                r=num_total - num_closed - num_open,
-                alpha=self._alpha,
+            node = SplitTreeNode(
+                type=node_type,
+                parent_relative=parent_relative,
+                left=left,
+                middle=middle,
+                right=right,
+                threashold=float(self.thresholds[node_idx]),
+                score=float(self.scores[node_idx]),
             )
-            scores.append(score)
 
-        return scores
+        box_left, box_top, box_right, box_bottom = self.boxes[node_idx].tolist()
+        node.set_bounds((box_left, box_top, box_right, box_bottom))
+
+        return node
 
     def generate_colliding_items(
         self,
-        collidable_pairs: Collection[CollidablePair],
+        collidable_pairs: CollisionFilter,
+        collided: Optional[Set[IntersactionPair]] = None,
     ) -> Iterable[IntersactionInfo]:
-
-        yield from self._generate_colliding_items(
-            node=self.root,
+        yield from self.generate_work_units_intersections(
             collidable_pairs=collidable_pairs,
+            work_units=[(WorkUnitType.SUBTREE.value, 0)],
+            collided=collided,
+        )
+
+    def get_work_units(self, split_depth: int) -> List[WorkUnit]:
+        work_units = []
+
+        stack = [(0, 0)]
+        while stack:
+            node_idx, depth = stack.pop()
+
+            is_leaf = self.node_types[node_idx] == TreeNodeType.LEAF.value
+            if is_leaf or depth >= split_depth:
+                work_units.append((WorkUnitType.SUBTREE.value, node_idx))
+                continue
+
+            work_units.append((WorkUnitType.CROSS.value, node_idx))
+
+            left, middle, right = self.children[node_idx].tolist()
+            stack += [
+                (idx, depth + 1) for idx in [right, middle, left] if idx >= 0
+            ]
+
+        return work_units
+
+    def generate_work_units_intersections(
+        self,
+        collidable_pairs: CollisionFilter,
+        work_units: Sequence[WorkUnit],
+        collided: Optional[Set[IntersactionPair]] = None,
+    ) -> Iterable[IntersactionInfo]:
+        masks = get_collision_masks(collidable_pairs)
+
+        first_idxs_parts = [np.zeros(0, dtype=int)]
+        second_idxs_parts = [np.zeros(0, dtype=int)]
+
+        for work_unit_type, node_idx in work_units:
+            if not self._is_self_collidable(masks, node_idx):
+                continue
+
+            if work_unit_type == WorkUnitType.SUBTREE.value:
+                first_idxs, second_idxs = self._get_subtree_candidates(
+                    masks=masks,
+                    node_idx=node_idx,
+                )
+            else:
+                first_idxs, second_idxs = self._get_cross_candidates(
+                    masks=masks,
+                    node_idx=node_idx,
+                )
+
+            first_idxs_parts.append(first_idxs)
+            second_idxs_parts.append(second_idxs)
+
+        yield from generate_candidate_intersections(
+            first=self.records,
+            first_idxs=np.concatenate(first_idxs_parts).astype(int),
+            second=self.records,
+            second_idxs=np.concatenate(second_idxs_parts).astype(int),
+            collidable_pairs=masks,
+            collided=collided,
         )
 
-    def _generate_colliding_items(
+    def _get_subtree_candidates(
+        self, masks: CollisionMasks, node_idx: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        first_idxs_parts = [np.zeros(0, dtype=int)]
+        second_idxs_parts = [np.zeros(0, dtype=int)]
+
+        stack = [node_idx]
+        while stack:
+            node_idx = stack.pop()
+
+            if not self._is_self_collidable(masks, node_idx):
+                continue
+
+            if self.node_types[node_idx] == TreeNodeType.LEAF.value:
+                start, stop = self.ranges[node_idx].tolist()
+                first_idxs, second_idxs = get_pair_idxs(stop - start)
+                first_idxs_parts.append(first_idxs + start)
+                second_idxs_parts.append(second_idxs + start)
+                continue
+
+            first_idxs, second_idxs = self._get_cross_candidates(
+                masks=masks,
+                node_idx=node_idx,
+            )
+            first_idxs_parts.append(first_idxs)
+            second_idxs_parts.append(second_idxs)
+
+            left, middle, right = self.children[node_idx].tolist()
+            stack += [idx for idx in [right, middle, left] if idx >= 0]
+
+        return (
+            np.concatenate(first_idxs_parts),
+            np.concatenate(second_idxs_parts),
+        )
+
+    def _get_cross_candidates(
+        self, masks: CollisionMasks, node_idx: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        left, middle, right = self.children[node_idx].tolist()
+
+        if middle < 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+        mstart, mstop = self.ranges[middle].tolist()
+        query_idxs, record_idxs = self._query_boxes(
+            boxes=self.records.boxes[mstart:mstop],
+            query_masks=masks.get_masks(self.records.class_ids[mstart:mstop]),
+            node_idxs=[left, right],
+        )
+
+        return query_idxs + mstart, record_idxs
+
+    def _is_self_collidable(self, masks: CollisionMasks, node_idx: int) -> bool:
+        class_mask = int(self.class_masks[node_idx])
+
+        return masks.is_masks_collidable(class_mask, class_mask)
+
+    def generate_records_intersections(
         self,
-        node: TreeNode,
-        collidable_pairs: Collection[CollidablePair],
+        records: Sequence[Record],
+        collidable_pairs: CollisionFilter,
+        collided: Optional[Set[IntersactionPair]] = None,
     ) -> Iterable[IntersactionInfo]:
-        yield from node.generate_intersections(
-            collidable_pairs=collidable_pairs,
+        masks = get_collision_masks(collidable_pairs)
+
+        queries = RecordArrays.from_records(records)
+        query_idxs, record_idxs = self._query_boxes(
+            boxes=queries.boxes,
+            query_masks=masks.get_masks(queries.class_ids),
+            node_idxs=[0],
+        )
+
+        yield from generate_candidate_intersections(
+            first=queries,
+            first_idxs=query_idxs,
+            second=self.records,
+            second_idxs=record_idxs,
+            collidable_pairs=masks,
+            collided=collided,
         )
 
+    def query_rect(
+        self, rect: Rectangle, class_mask: ClassMask = ALL_CLASSES_MASK
+    ) -> List[Record]:
+        boxes = np.array([[rect.left, rect.top, rect.right, rect.bottom]])
+        _, record_idxs = self._query_boxes(
+            boxes=boxes,
+            query_masks=np.array([class_mask], dtype=np.int64),
+            node_idxs=[0],
+        )
+
+        mask = get_boxes_intersected(self.records.boxes[record_idxs], boxes[0])
+        mask &= self.records.class_masks[record_idxs] & class_mask != 0
+
+        return [self.records.records[idx] for idx in record_idxs[mask].tolist()]
+
+    def raycast(
+        self,
+        origin: Point,
+        direction: Vec2,
+        max_t: float = inf,
+        class_mask: ClassMask = ALL_CLASSES_MASK,
+    ) -> Optional[RayHit]:
+        if direction.norm2() == 0:
+            return None
+
+        root_entry = get_ray_bounds_entry(
+            origin, direction, self._get_node_bounds(0), max_t
+        )
+        if root_entry is None:
+            return None
+
+        max_t = min(max_t, root_entry[1])
+        shift = direction * max_t
+
+        best: Optional[RayHit] = None
+        heap = [(root_entry[0], 0)]
+        while heap:
+            t_enter, node_idx = heappop(heap)
+
+            if best is not None and t_enter > best.t:
+                break
+
+            if not int(self.class_masks[node_idx]) & class_mask:
+                continue
+
+            if self.node_types[node_idx] != TreeNodeType.LEAF.value:
+                for child_idx in self.children[node_idx].tolist():
+                    if child_idx < 0:
+                        continue
+
+                    entry = get_ray_bounds_entry(
+                        origin,
+                        direction,
+                        self._get_node_bounds(child_idx),
+                        max_t if best is None else best.t,
+                    )
+                    if entry is not None:
+                        heappush(heap, (entry[0], child_idx))
+
+                continue
+
+            start, stop = self.ranges[node_idx].tolist()
+            for idx in range(start, stop):
+                record = self.records.records[idx]
+
+                if not int(self.records.class_masks[idx]) & class_mask:
+                    continue
+
+                entry = get_ray_bounds_entry(
+                    origin, direction, record.bounds, max_t
+                )
+                if entry is None:
+                    continue
+
+                toi = get_time_of_impact_point_shape(
+                    start=origin,
+                    shift=shift,
+                    shape=record.shape,
+                )
+                if toi is None:
+                    continue
+
+                t = toi * max_t
+                if best is None or t < best.t:
+                    best = RayHit(
+                        record=record,
+                        t=t,
+                        point=origin + direction * t,
+                    )
+
+        return best
+
+    def nearest(
+        self,
+        point: Point,
+        k: int = 1,
+        class_mask: ClassMask = ALL_CLASSES_MASK,
+    ) -> List[Neighbour]:
+        item_id2neighbour: Dict[ItemId, Neighbour] = {}
+        kth_distance = inf
+
+        heap = [(get_distance_point_bounds(point, self._get_node_bounds(0)), 0)]
+        while heap:
+            distance, node_idx = heappop(heap)
+
+            if distance > kth_distance:
+                break
+
+            if not int(self.class_masks[node_idx]) & class_mask:
+                continue
+
+            if self.node_types[node_idx] != TreeNodeType.LEAF.value:
+                for child_idx in self.children[node_idx].tolist():
+                    if child_idx >= 0:
+                        child_distance = get_distance_point_bounds(
+                            point, self._get_node_bounds(child_idx)
+                        )
+                        heappush(heap, (child_distance, child_idx))
+
+                continue
+
+            start, stop = self.ranges[node_idx].tolist()
+            for idx in range(start, stop):
+                record = self.records.records[idx]
+
+                if not int(self.records.class_masks[idx]) & class_mask:
+                    continue
+
+                if get_distance_point_bounds(point, record.bounds) > (
+                    kth_distance
+                ):
+                    continue
+
+                distance = get_distance_point_shape(point, record.shape)
+
+                neighbour = item_id2neighbour.get(record.item_id)
+                if neighbour is None or distance < neighbour.distance:
+                    item_id2neighbour[record.item_id] = Neighbour(
+                        record=record,
+                        distance=distance,
+                    )
+
+            if len(item_id2neighbour) >= k:
+                kth_distance = sorted(
+                    neighbour.distance
+                    for neighbour in item_id2neighbour.values()
+                )[k - 1]
+
+        neighbours = sorted(
+            item_id2neighbour.values(),
+            key=lambda neighbour: neighbour.distance,
+        )
+
+        return neighbours[:k]
+
+    def _get_node_bounds(self, node_idx: int) -> Bounds:
+        left, top, right, bottom = self.boxes[node_idx].tolist()
+
+        return left, top, right, bottom
+
+    def _query_boxes(
+        self, boxes: np.ndarray, query_masks: np.ndarray, node_idxs: List[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        query_idxs_parts = [np.zeros(0, dtype=int)]
+        record_idxs_parts = [np.zeros(0, dtype=int)]
+
+        all_query_idxs = np.arange(len(boxes))
+        stack = [
+            (idx, all_query_idxs) for idx in reversed(node_idxs) if idx >= 0
+        ]
+        while stack:
+            node_idx, query_idxs = stack.pop()
+
+            query_idxs = query_idxs[
+                get_boxes_intersected(boxes[query_idxs], self.boxes[node_idx])
+                & (query_masks[query_idxs] & self.class_masks[node_idx] != 0)
+            ]
+            if len(query_idxs) == 0:
+                continue
+
+            if self.node_types[node_idx] == TreeNodeType.LEAF.value:
+                start, stop = self.ranges[node_idx].tolist()
+                query_idxs_parts.append(np.repeat(query_idxs, stop - start))
+                record_idxs_parts.append(
+                    np.tile(np.arange(start, stop), len(query_idxs))
+                )
+                continue
+
+            stack += [
+                (idx, query_idxs)
+                for idx in reversed(self.children[node_idx].tolist())
+                if idx >= 0
+            ]
+
+        query_idxs = np.concatenate(query_idxs_parts)
+        record_idxs = np.concatenate(record_idxs_parts)
+        order = np.lexsort((record_idxs, query_idxs))
+
+        return query_idxs[order], record_idxs[order]
+
     def traverse_nodes(self) -> Iterable[TreeNode]:
         yield from self.root.traverse_subnodes()
@@ -0,0 +1,76 @@
+import os
+from importlib.util import module_from_spec, spec_from_file_location
+from types import ModuleType
+from typing import Dict, List
+
+from . import scalar_kernels
+
+PYTHON_BACKEND = "python"
+COMPILED_BACKEND = "compiled"
+BACKEND_ENV_VAR = "GEOMETRY_BACKEND"
+
+
+def is_compiled(module: ModuleType) -> bool:
+    return not str(module.__file__).endswith(".py")
+
+
+def _load_python_kernels() -> ModuleType:
+    if not is_compiled(scalar_kernels):
+        return scalar_kernels
+
+    path = os.path.join(
+        os.path.dirname(str(scalar_kernels.__file__)), "scalar_kernels.py"
+    )
+    spec = spec_from_file_location(f"{__name__}_python", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Can't load pure-Python kernels from {path}")
+
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+_backend2module: Dict[str, ModuleType] = {
+    PYTHON_BACKEND: _load_python_kernels(),
+}
+if is_compiled(scalar_kernels):
+    _backend2module[COMPILED_BACKEND] = scalar_kernels
+
+backend: ModuleType = _backend2module[PYTHON_BACKEND]
+backend_name = PYTHON_BACKEND
+
+
+def get_available_backends() -> List[str]:
+    return list(_backend2module)
+
+
+def get_backend() -> str:
+    return backend_name
+
+
+def set_backend(name: str) -> None:
+    global backend, backend_name
+
+    if name not in _backend2module:
+        raise ValueError(
+            f"Geometry backend {name!r} is not available, "
+            f"available backends: {get_available_backends()}"
+        )
+
+    backend = _backend2module[name]
+    backend_name = name
+
+
+def get_default_backend() -> str:
+    name = os.environ.get(BACKEND_ENV_VAR)
+    if name is not None and name in _backend2module:
+        return name
+
+    if COMPILED_BACKEND in _backend2module:
+        return COMPILED_BACKEND
+
+    return PYTHON_BACKEND
+
+
+set_backend(get_default_backend())
@@ -0,0 +1,409 @@
+from typing import Optional, Tuple
+
+ScalarPoint = Tuple[float, float]
+ScalarIntersection = Optional[ScalarPoint]
+TriangleCoords = Tuple[float, float, float, float, float, float]
+TriangleEdges = Tuple[
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+]
+
+
+def get_intersection_rectangle_rectangle(
+    left1: float,
+    top1: float,
+    width1: float,
+    height1: float,
+    left2: float,
+    top2: float,
+    width2: float,
+    height2: float,
+) -> ScalarIntersection:
+    left = max(left1, left2)
+    right = min(left1 + width1, left2 + width2)
+    top = max(top1, top2)
+    bottom = min(top1 + height1, top2 + height2)
+
+    width = right - left
+    height = bottom - top
+    if width <= 0 or height <= 0:
+        return None
+
+    return left + width / 2, top + height / 2
+
+
+def get_intersection_circle_circle(
+    x1: float, y1: float, r1: float, x2: float, y2: float, r2: float
+) -> ScalarIntersection:
+    sx = x1 - x2
+    sy = y1 - y2
+    sd = sx * sx + sy * sy
+
+    c_radius = r1 + r2
+    sr = c_radius * c_radius
+
+    if sd < sr:
+        return (x1 + x2) * 0.5, (y1 + y2) * 0.5
+
+    return None
+
+
+def get_intersection_circle_segment(
+    cx: float,
+    cy: float,
+    r: float,
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+) -> ScalarIntersection:
+    ax = x1 - x0
+    ay = y1 - y0
+    an2 = ax * ax + ay * ay
+    bx = cx - x0
+    by = cy - y0
+
+    t = max(0.0, min(ax * bx + ay * by, an2))
+
+    r_an2 = r * an2
+    sx = ax * t - bx * an2
+    sy = ay * t - by * an2
+    if r_an2 * r_an2 <= sx * sx + sy * sy:
+        return None
+
+    if an2 == 0.0:
+        return x0, y0
+
+    inverse = 1 / an2
+
+    return ax * t * inverse + x0, ay * t * inverse + y0
+
+
+def get_intersection_segment_segment(
+    ax0: float,
+    ay0: float,
+    ax1: float,
+    ay1: float,
+    bx0: float,
+    by0: float,
+    bx1: float,
+    by1: float,
+) -> ScalarIntersection:
+    a1 = -(ay0 - ay1)
+    b1 = ax0 - ax1
+    c1 = -a1 * ax0 - b1 * ay0
+
+    a2 = -(by0 - by1)
+    b2 = bx0 - bx1
+    c2 = -a2 * bx0 - b2 * by0
+
+    return _get_intersection_edge_edge(
+        ax0, ay0, ax1, ay1, a1, b1, c1, bx0, by0, bx1, by1, a2, b2, c2
+    )
+
+
+def is_point_in_triangle(px: float, py: float, edges: TriangleEdges) -> bool:
+    a0, b0, c0, s0, a1, b1, c1, s1, a2, b2, c2, s2 = edges
+
+    return (
+        (a0 * px + b0 * py + c0) * s0 > 0
+        and (a1 * px + b1 * py + c1) * s1 > 0
+        and (a2 * px + b2 * py + c2) * s2 > 0
+    )
+
+
+def get_intersection_triangle_circle(
+    coords: TriangleCoords,
+    edges: TriangleEdges,
+    cx: float,
+    cy: float,
+    r: float,
+) -> ScalarIntersection:
+    if is_point_in_triangle(cx, cy, edges):
+        return cx, cy
+
+    x0, y0, x1, y1, x2, y2 = coords
+
+    intersection = get_intersection_circle_segment(cx, cy, r, x0, y0, x1, y1)
+    if intersection is not None:
+        return intersection
+
+    intersection = get_intersection_circle_segment(cx, cy, r, x0, y0, x2, y2)
+    if intersection is not None:
+        return intersection
+
+    return get_intersection_circle_segment(cx, cy, r, x1, y1, x2, y2)
+
+
+def get_intersection_triangle_triangle(
+    a_coords: TriangleCoords,
+    a_center: ScalarPoint,
+    a_edges: TriangleEdges,
+    b_coords: TriangleCoords,
+    b_center: ScalarPoint,
+    b_edges: TriangleEdges,
+) -> ScalarIntersection:
+    ax0, ay0, ax1, ay1, ax2, ay2 = a_coords
+    bx0, by0, bx1, by1, bx2, by2 = b_coords
+
+    for px, py in [(ax0, ay0), (ax1, ay1), (ax2, ay2), a_center]:
+        if is_point_in_triangle(px, py, b_edges):
+            return px, py
+
+    for px, py in [(bx0, by0), (bx1, by1), (bx2, by2), b_center]:
+        if is_point_in_triangle(px, py, a_edges):
+            return px, py
+
+    a_segments = [
+        (ax0, ay0, ax1, ay1, a_edges[0], a_edges[1], a_edges[2]),
+        (ax0, ay0, ax2, ay2, a_edges[4], a_edges[5], a_edges[6]),
+        (ax1, ay1, ax2, ay2, a_edges[8], a_edges[9], a_edges[10]),
+    ]
+    b_segments = [
+        (bx0, by0, bx1, by1, b_edges[0], b_edges[1], b_edges[2]),
+        (bx0, by0, bx2, by2, b_edges[4], b_edges[5], b_edges[6]),
+        (bx1, by1, bx2, by2, b_edges[8], b_edges[9], b_edges[10]),
+    ]
+    for sx0, sy0, sx1, sy1, a1, b1, c1 in a_segments:
+        for tx0, ty0, tx1, ty1, a2, b2, c2 in b_segments:
+            intersection = _get_intersection_edge_edge(
+                sx0, sy0, sx1, sy1, a1, b1, c1, tx0, ty0, tx1, ty1, a2, b2, c2
+            )
+
+            if intersection is not None:
+                return intersection
+
+    return None
+
+
+def _get_intersection_edge_edge(
+    ax0: float,
+    ay0: float,
+    ax1: float,
+    ay1: float,
+    a1: float,
+    b1: float,
+    c1: float,
+    bx0: float,
+    by0: float,
+    bx1: float,
+    by1: float,
+    a2: float,
+    b2: float,
+    c2: float,
+) -> ScalarIntersection:
+    if (a1 * bx0 + b1 * by0 + c1) * (a1 * bx1 + b1 * by1 + c1) >= 0:
+        return None
+
+    if (a2 * ax0 + b2 * ay0 + c2) * (a2 * ax1 + b2 * ay1 + c2) >= 0:
+        return None
+
+    d = b2 * a1 - b1 * a2
+    if d == 0:
+        return None
+
+    return -(b2 * c1 - b1 * c2) / d, (a2 * c1 - a1 * c2) / d
+
+
+def get_intersection_rectangle_circle(
+    left: float,
+    top: float,
+    width: float,
+    height: float,
+    cx: float,
+    cy: float,
+    r: float,
+) -> ScalarIntersection:
+    px = min(max(cx, left), left + width)
+    py = min(max(cy, top), top + height)
+
+    dx = cx - px
+    dy = cy - py
+    if dx * dx + dy * dy >= r * r:
+        return None
+
+    return px, py
+
+
+def get_intersection_capsule_circle(
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    r: float,
+    cx: float,
+    cy: float,
+    cr: float,
+) -> ScalarIntersection:
+    intersection = get_intersection_circle_segment(
+        cx, cy, r + cr, x0, y0, x1, y1
+    )
+    if intersection is None:
+        return None
+
+    px, py = intersection
+
+    return (px + cx) * 0.5, (py + cy) * 0.5
+
+
+def get_intersection_capsule_rectangle(
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    r: float,
+    left: float,
+    top: float,
+    width: float,
+    height: float,
+) -> ScalarIntersection:
+    intersection = get_intersection_rectangle_circle(
+        left, top, width, height, x0, y0, r
+    )
+    if intersection is not None:
+        return intersection
+
+    intersection = get_intersection_rectangle_circle(
+        left, top, width, height, x1, y1, r
+    )
+    if intersection is not None:
+        return intersection
+
+    right = left + width
+    bottom = top + height
+
+    t = _clip_segment_rectangle(x0, y0, x1, y1, left, top, right, bottom)
+    if t is not None:
+        return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+
+    for px, py in [(left, top), (right, top), (left, bottom), (right, bottom)]:
+        intersection = get_intersection_circle_segment(
+            px, py, r, x0, y0, x1, y1
+        )
+        if intersection is not None:
+            return px, py
+
+    return None
+
+
+def get_intersection_capsule_capsule(
+    ax0: float,
+    ay0: float,
+    ax1: float,
+    ay1: float,
+    ar: float,
+    bx0: float,
+    by0: float,
+    bx1: float,
+    by1: float,
+    br: float,
+) -> ScalarIntersection:
+    intersection = get_intersection_circle_circle(ax0, ay0, ar, bx0, by0, br)
+    if intersection is not None:
+        return intersection
+
+    s, t = _get_closest_segment_segment(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1)
+
+    px = ax0 + (ax1 - ax0) * s
+    py = ay0 + (ay1 - ay0) * s
+    qx = bx0 + (bx1 - bx0) * t
+    qy = by0 + (by1 - by0) * t
+
+    return get_intersection_circle_circle(px, py, ar, qx, qy, br)
+
+
+def _clip_segment_rectangle(
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    left: float,
+    top: float,
+    right: float,
+    bottom: float,
+) -> Optional[float]:
+    t_enter = 0.0
+    t_exit = 1.0
+
+    for p, d, lower, upper in [
+        (x0, x1 - x0, left, right),
+        (y0, y1 - y0, top, bottom),
+    ]:
+        if d == 0.0:
+            if p <= lower or p >= upper:
+                return None
+
+            continue
+
+        t0 = (lower - p) / d
+        t1 = (upper - p) / d
+        if t0 > t1:
+            t0, t1 = t1, t0
+
+        t_enter = max(t_enter, t0)
+        t_exit = min(t_exit, t1)
+
+        if t_enter >= t_exit:
+            return None
+
+    return t_enter
+
+
+def _get_closest_segment_segment(
+    ax0: float,
+    ay0: float,
+    ax1: float,
+    ay1: float,
+    bx0: float,
+    by0: float,
+    bx1: float,
+    by1: float,
+) -> Tuple[float, float]:
+    dax = ax1 - ax0
+    day = ay1 - ay0
+    dbx = bx1 - bx0
+    dby = by1 - by0
+    rx = ax0 - bx0
+    ry = ay0 - by0
+
+    a = dax * dax + day * day
+    e = dbx * dbx + dby * dby
+    f = dbx * rx + dby * ry
+
+    if a == 0.0 and e == 0.0:
+        return 0.0, 0.0
+
+    if a == 0.0:
+        return 0.0, _clamp(f / e)
+
+    c = dax * rx + day * ry
+    if e == 0.0:
+        return _clamp(-c / a), 0.0
+
+    b = dax * dbx + day * dby
+    denom = a * e - b * b
+
+    s = _clamp((b * f - c * e) / denom) if denom != 0.0 else 0.0
+    t = (b * s + f) / e
+
+    if t < 0.0:
+        return _clamp(-c / a), 0.0
+
+    elif t > 1.0:
+        return _clamp((b - c) / a), 1.0
+
+    return s, t
+
+
+def _clamp(value: float) -> float:
+    return max(0.0, min(value, 1.0))
@@ -1,7 +1,8 @@
 from typing import Union
 
+from .capsule import Capsule
 from .circle import Circle
 from .rectangle import Rectangle
 from .triangle import Triangle
 
-Shape = Union[Triangle, Circle, Rectangle]
+Shape = Union[Triangle, Circle, Rectangle, Capsule]
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from ..basic import Point, Segment
+from .rectangle import Rectangle
+
+
+@dataclass
+class Capsule:
+    begin: Point
+    end: Point
+    radius: float
+
+    @property
+    def segment(self) -> Segment:
+        return Segment(begin=self.begin, end=self.end)
+
+    @property
+    def bounding_box(self) -> Rectangle:
+        left = min(self.begin.x, self.end.x) - self.radius
+        right = max(self.begin.x, self.end.x) + self.radius
+        top = min(self.begin.y, self.end.y) - self.radius
+        bottom = max(self.begin.y, self.end.y) + self.radius
+
+        return Rectangle(
+            left=left,
+            top=top,
+            width=right - left,
+            height=bottom - top,
+        )
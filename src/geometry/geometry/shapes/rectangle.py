@@ -1,10 +1,13 @@
 from dataclasses import dataclass
+from typing import Tuple
 
-from ..basic import Point
+from ..basic import Point, Vec2
 
 
 @dataclass
 class Rectangle:
+    __slots__ = ("left", "top", "width", "height")
+
     left: float
     top: float
     width: float
@@ -18,6 +21,13 @@ class Rectangle:
             height=self.height,
         )
 
+    def to_tuple(self) -> Tuple[float, float, float, float]:
+        return self.left, self.top, self.width, self.height
+
+    def move_ip(self, offset: Vec2) -> None:
+        self.left += offset.x
+        self.top += offset.y
+
     @property
     def bottom(self) -> float:
         return self.top + self.height
@@ -1,35 +1,82 @@
 from dataclasses import dataclass
+from functools import cached_property
 from itertools import combinations
-from typing import Iterable, List
+from typing import List, Tuple
 
-from ..basic import Point, Segment
+from ..basic import Line2, Point, Segment
 from .rectangle import Rectangle
 
+TriangleCoords = Tuple[float, float, float, float, float, float]
+TriangleEdges = Tuple[
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+    float,
+]
+
 
 @dataclass
 class Triangle:
     points: List[Point]
 
-    @property
-    def segments(self) -> Iterable[Segment]:
-        for p1, p2 in combinations(self.points, 2):
-            yield Segment(begin=p1, end=p2)
+    @cached_property
+    def coords(self) -> TriangleCoords:
+        p0, p1, p2 = self.points
+
+        return p0.x, p0.y, p1.x, p1.y, p2.x, p2.y
+
+    @cached_property
+    def segments(self) -> Tuple[Segment, ...]:
+        return tuple(
+            Segment(begin=p1, end=p2) for p1, p2 in combinations(self.points, 2)
+        )
+
+    @cached_property
+    def lines(self) -> Tuple[Line2, ...]:
+        return tuple(segment.line for segment in self.segments)
 
-    @property
+    @cached_property
     def center(self) -> Point:
         c = (self.points[0] + self.points[1] + self.points[2]) / 3
 
         return c
 
-    @property
+    @cached_property
+    def edges(self) -> TriangleEdges:
+        l0, l1, l2 = self.lines
+        center = self.center
+
+        return (
+            l0.a,
+            l0.b,
+            l0.c,
+            l0.place(center),
+            l1.a,
+            l1.b,
+            l1.c,
+            l1.place(center),
+            l2.a,
+            l2.b,
+            l2.c,
+            l2.place(center),
+        )
+
+    @cached_property
     def bounding_box(self) -> Rectangle:
-        xs = [p.x for p in self.points]
-        ys = [p.y for p in self.points]
+        x0, y0, x1, y1, x2, y2 = self.coords
 
-        left = min(xs)
-        right = max(xs)
-        top = min(ys)
-        bottom = max(ys)
+        left = min(x0, x1, x2)
+        right = max(x0, x1, x2)
+        top = min(y0, y1, y2)
+        bottom = max(y0, y1, y2)
 
         return Rectangle(
             left=left,
@@ -0,0 +1,222 @@
+from typing import Iterable, Optional
+
+from .basic import Point, Segment, Vec2
+from .distance import get_distance_point_segment
+from .intersecting import is_point_in_triangle
+from .shapes import Capsule, Circle, Rectangle, Shape, Triangle
+
+TimeOfImpact = Optional[float]
+
+
+def get_time_of_impact_point_circle(
+    start: Point, shift: Vec2, circle: Circle
+) -> TimeOfImpact:
+    a = start - circle.center
+
+    qa = shift.norm2()
+    qb = a.scalar(shift)
+    qc = a.norm2() - circle.radius * circle.radius
+
+    if qc < 0:
+        return 0.0
+
+    if qa == 0 or qb >= 0:
+        return None
+
+    d = qb * qb - qa * qc
+    if d <= 0:
+        return None
+
+    t = (-qb - d**0.5) / qa
+    if t > 1:
+        return None
+
+    return max(0.0, t)
+
+
+def get_time_of_impact_point_rectangle(
+    start: Point, shift: Vec2, rect: Rectangle
+) -> TimeOfImpact:
+    t_enter = 0.0
+    t_exit = 1.0
+
+    slabs = [
+        (start.x, shift.x, rect.left, rect.right),
+        (start.y, shift.y, rect.top, rect.bottom),
+    ]
+    for p, d, lower, upper in slabs:
+        if d == 0:
+            if p <= lower or p >= upper:
+                return None
+
+            continue
+
+        t1 = (lower - p) / d
+        t2 = (upper - p) / d
+        if t1 > t2:
+            t1, t2 = t2, t1
+
+        t_enter = max(t_enter, t1)
+        t_exit = min(t_exit, t2)
+
+        if t_enter >= t_exit:
+            return None
+
+    return t_enter
+
+
+def get_time_of_impact_point_segment(
+    start: Point, shift: Vec2, segment: Segment
+) -> TimeOfImpact:
+    edge = segment.end - segment.begin
+    d = shift.x * edge.y - shift.y * edge.x
+    if d == 0:
+        return None
+
+    w = segment.begin - start
+    t = (w.x * edge.y - w.y * edge.x) / d
+    u = (w.x * shift.y - w.y * shift.x) / d
+
+    if t < 0 or t > 1 or u < 0 or u > 1:
+        return None
+
+    return t
+
+
+def get_time_of_impact_point_triangle(
+    start: Point, shift: Vec2, triangle: Triangle
+) -> TimeOfImpact:
+    if is_point_in_triangle(start, triangle):
+        return 0.0
+
+    return _get_earliest(
+        get_time_of_impact_point_segment(start, shift, segment)
+        for segment in triangle.segments
+    )
+
+
+def get_time_of_impact_point_capsule(
+    start: Point, shift: Vec2, capsule: Capsule
+) -> TimeOfImpact:
+    if get_distance_point_segment(start, capsule.segment) < capsule.radius:
+        return 0.0
+
+    tois = [
+        get_time_of_impact_point_circle(
+            start, shift, Circle(center=center, radius=capsule.radius)
+        )
+        for center in [capsule.begin, capsule.end]
+    ]
+
+    edge = capsule.end - capsule.begin
+    length = edge.norm()
+    if length > 0:
+        normal = Vec2(x=-edge.y, y=edge.x) * (capsule.radius / length)
+        tois += [
+            get_time_of_impact_point_segment(
+                start,
+                shift,
+                Segment(begin=capsule.begin + offset, end=capsule.end + offset),
+            )
+            for offset in [normal, -normal]
+        ]
+
+    return _get_earliest(tois)
+
+
+def get_time_of_impact_point_shape(
+    start: Point, shift: Vec2, shape: Shape
+) -> TimeOfImpact:
+    if isinstance(shape, Circle):
+        return get_time_of_impact_point_circle(start, shift, shape)
+
+    elif isinstance(shape, Rectangle):
+        return get_time_of_impact_point_rectangle(start, shift, shape)
+
+    elif isinstance(shape, Triangle):
+        return get_time_of_impact_point_triangle(start, shift, shape)
+
+    elif isinstance(shape, Capsule):
+        return get_time_of_impact_point_capsule(start, shift, shape)
+
+    raise NotImplementedError(
+        "Getting time of impact with {} is not supported".format(
+            shape.__class__.__name__,
+        )
+    )
+
+
+def get_time_of_impact_circle_circle(
+    a: Circle, shift: Vec2, b: Circle
+) -> TimeOfImpact:
+    return get_time_of_impact_point_circle(
+        start=a.center,
+        shift=shift,
+        circle=Circle(center=b.center, radius=a.radius + b.radius),
+    )
+
+
+def get_time_of_impact_circle_rectangle(
+    c: Circle, shift: Vec2, rect: Rectangle
+) -> TimeOfImpact:
+    r = c.radius
+
+    expanded_rects = [
+        Rectangle(
+            left=rect.left - r,
+            top=rect.top,
+            width=rect.width + 2 * r,
+            height=rect.height,
+        ),
+        Rectangle(
+            left=rect.left,
+            top=rect.top - r,
+            width=rect.width,
+            height=rect.height + 2 * r,
+        ),
+    ]
+    corners = [
+        Circle(center=Point(x=x, y=y), radius=r)
+        for x in [rect.left, rect.right]
+        for y in [rect.top, rect.bottom]
+    ]
+
+    tois = [
+        get_time_of_impact_point_rectangle(c.center, shift, expanded_rect)
+        for expanded_rect in expanded_rects
+    ]
+    tois += [
+        get_time_of_impact_point_circle(c.center, shift, corner)
+        for corner in corners
+    ]
+
+    return _get_earliest(tois)
+
+
+def get_time_of_impact_rectangle_rectangle(
+    a: Rectangle, shift: Vec2, b: Rectangle
+) -> TimeOfImpact:
+    expanded_rect = Rectangle(
+        left=b.left - a.width,
+        top=b.top - a.height,
+        width=b.width + a.width,
+        height=b.height + a.height,
+    )
+
+    return get_time_of_impact_point_rectangle(
+        start=Point(x=a.left, y=a.top),
+        shift=shift,
+        rect=expanded_rect,
+    )
+
+
+def _get_earliest(tois: Iterable[TimeOfImpact]) -> TimeOfImpact:
+    earliest: TimeOfImpact = None
+    for toi in tois:
+        if toi is None:
+            continue
+
+        if earliest is None or toi < earliest:
+            earliest = toi
+
+    return earliest
@@ -2,10 +2,15 @@ import pytest
 
 from envs.breakout import (
     BreakoutEnv,
+    BVHCollisionDetectionEngine,
     CollisionDetector,
     EmptyLevelBuilder,
+    EventDrivenBreakoutEnv,
+    IncrementalKDTreeCollisionDetectionEngine,
     KDTreeCollisionDetectionEngine,
     NaiveCollisionDetectionEngine,
+    SpatialHashCollisionDetectionEngine,
+    SweepAndPruneCollisionDetectionEngine,
 )
 
 
@@ -13,6 +18,10 @@ from envs.breakout import (
     params=[
         NaiveCollisionDetectionEngine(),
         KDTreeCollisionDetectionEngine(),
+        IncrementalKDTreeCollisionDetectionEngine(),
+        SpatialHashCollisionDetectionEngine(),
+        SweepAndPruneCollisionDetectionEngine(),
+        BVHCollisionDetectionEngine(),
     ]
 )
 def collision_engine(request):
@@ -24,17 +33,35 @@ def collision_detector(collision_engine):
     return CollisionDetector(engine=collision_engine)
 
 
+@pytest.fixture(
+    params=[
+        BreakoutEnv,
+        EventDrivenBreakoutEnv,
+    ]
+)
+def breakout_env_class(request):
+    return request.param
+
+
+@pytest.fixture(params=[False, True], ids=["objects", "arrays"])
+def array_state(request):
+    return request.param
+
+
 @pytest.fixture
 def level_builder(config):
     return EmptyLevelBuilder()
 
 
 @pytest.fixture
-def breakout(config, collision_detector, level_builder):
-    breakout = BreakoutEnv(
+def breakout(
+    config, breakout_env_class, array_state, collision_detector, level_builder
+):
+    breakout = breakout_env_class(
         env_size=config.breakout.env_size,
         level_builder=level_builder,
         collision_detector=collision_detector,
+        array_state=array_state,
     )
     breakout.reset()
 
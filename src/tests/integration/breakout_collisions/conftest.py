@@ -1,15 +1,16 @@
 import pytest
 
-from envs.breakout import BreakoutEnv
-
 
 @pytest.fixture
-def breakout(config, collision_detector, level_builder):
-    breakout = BreakoutEnv(
+def breakout(
+    config, breakout_env_class, array_state, collision_detector, level_builder
+):
+    breakout = breakout_env_class(
         env_size=config.breakout.env_size,
         level_builder=level_builder,
         collision_detector=collision_detector,
         checking_gameover=False,
+        array_state=array_state,
     )
     breakout.reset()
 
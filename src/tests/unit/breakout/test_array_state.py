@@ -0,0 +1,122 @@
+import pytest
+
+from envs.breakout import ArrayBreakoutState, ItemManager
+from geometry import Capsule, Point, Vec2
+from tests.math_utils import almost_equal_float, almost_equal_vec
+
+
+@pytest.fixture
+def array_state(item_manager: ItemManager) -> ArrayBreakoutState:
+    platform = item_manager.create_platform(speed=10)
+    platform.rect.center = Point(x=200, y=380)
+
+    ball1 = item_manager.create_ball(radius=10, speed=2.0)
+    ball1.rect.center = Point(x=100, y=100)
+    ball1.thrown = True
+    ball1.velocity = Vec2(x=1, y=0)
+
+    ball2 = item_manager.create_ball(radius=10, speed=2.0)
+    ball2.rect.center = Point(x=100, y=395)
+    ball2.thrown = True
+    ball2.velocity = Vec2(x=0, y=1)
+
+    ball3 = item_manager.create_ball(radius=10, speed=2.0)
+    ball3.thrown = False
+
+    return ArrayBreakoutState.from_state(item_manager.extract_state())
+
+
+@pytest.mark.breakout
+class TestArrayBreakoutState:
+    def test_views_write_through(self, array_state: ArrayBreakoutState):
+        ball = array_state.balls[0]
+        ball.rect.center += Vec2(x=5, y=0)
+        ball.velocity = Vec2(x=0, y=-1)
+
+        ball = array_state.balls[0]
+        assert almost_equal_vec(ball.rect.center, Point(x=105, y=100))
+        assert almost_equal_vec(ball.velocity, Vec2(x=0, y=-1))
+        assert almost_equal_float(ball.speed, 2.0)
+
+        platform = array_state.platforms[0]
+        platform.velocity.x = -1
+
+        assert almost_equal_vec(
+            array_state.platforms[0].velocity, Vec2(x=-1, y=0)
+        )
+
+    def test_update_balls(self, array_state: ArrayBreakoutState):
+        ball1, ball2, ball3 = array_state.balls
+        platform = array_state.platforms[0]
+
+        array_state.update_balls(dt=10, bottom=400)
+
+        assert [ball.id for ball in array_state.balls] == [ball1.id, ball3.id]
+        assert almost_equal_vec(ball1.rect.center, Point(x=120, y=100))
+        assert almost_equal_float(ball3.rect.bottom, platform.rect.top)
+        assert almost_equal_float(ball3.rect.centerx, platform.rect.centerx)
+        assert almost_equal_vec(ball2.rect.center, Point(x=100, y=415))
+
+    def test_update_platforms(self, array_state: ArrayBreakoutState):
+        platform = array_state.platforms[0]
+        platform.velocity.x = 1
+        platform.freeze()
+
+        array_state.update_platforms(dt=platform.default_freeze_time + 1)
+
+        assert almost_equal_vec(platform.rect.center, Point(x=210, y=380))
+        assert almost_equal_float(platform.rest_freeze_time, 0)
+
+    def test_copy(self, array_state: ArrayBreakoutState):
+        state = array_state.copy()
+
+        ball = state.balls[0]
+        ball.rect.move_ip(Vec2(x=5, y=0))
+        ball.velocity = Vec2(x=0, y=-1)
+        state.platforms[0].velocity.x = -1
+
+        assert almost_equal_vec(ball.rect.center, Point(x=105, y=100))
+        assert almost_equal_vec(
+            array_state.balls[0].rect.center, Point(x=100, y=100)
+        )
+        assert almost_equal_vec(array_state.balls[0].velocity, Vec2(x=1, y=0))
+        assert almost_equal_vec(
+            array_state.platforms[0].velocity, Vec2(x=0, y=0)
+        )
+
+    def test_list_mutation(
+        self, array_state: ArrayBreakoutState, item_manager: ItemManager
+    ):
+        ball1, ball2, ball3 = array_state.balls
+
+        array_state.balls.remove(ball2)
+
+        ball4 = item_manager.create_ball(radius=5, speed=1.0)
+        ball4.rect.center = Point(x=50, y=60)
+        array_state.balls.append(ball4)
+
+        balls = array_state.balls
+        assert [ball.id for ball in balls] == [ball1.id, ball3.id, ball4.id]
+        assert balls[0] is ball1
+        assert almost_equal_vec(ball1.rect.center, Point(x=100, y=100))
+        assert almost_equal_vec(ball2.rect.center, Point(x=100, y=395))
+        assert almost_equal_vec(balls[2].rect.center, Point(x=50, y=60))
+        assert almost_equal_float(balls[2].radius, 5)
+
+        array_state.update_balls(dt=10, bottom=400)
+        assert almost_equal_vec(ball1.rect.center, Point(x=120, y=100))
+        assert almost_equal_vec(ball2.rect.center, Point(x=100, y=395))
+
+        state = array_state.copy()
+        state.balls.pop()
+        assert len(state.balls) == 2
+        assert len(array_state.balls) == 3
+
+    def test_ghost_trace(self, array_state: ArrayBreakoutState):
+        ball = array_state.balls[0]
+
+        (capsule,) = ball.get_ghost_trace(5)
+        assert isinstance(capsule, Capsule)
+        assert almost_equal_vec(capsule.begin, Point(x=100, y=100))
+        assert almost_equal_vec(capsule.end, Point(x=110, y=100))
+        assert almost_equal_float(capsule.radius, 10)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from envs.breakout import (
+    CollisionDetector,
+    SweepAndPruneCollisionDetectionEngine,
+)
+from envs.breakout.collisions import detector as detector_module
+from envs.breakout.constants import EPS
+
+
+@dataclass
+class FakeCollision:
+    time: float
+    toi: Optional[float]
+
+
+class FakeQuerySession:
+    def __init__(self, colls: List[FakeCollision]) -> None:
+        self._colls = colls
+
+    def advance(self, dt: float) -> None:
+        pass
+
+    def generate_step_collisions(self, dt: float) -> List[FakeCollision]:
+        return [coll for coll in self._colls if coll.time <= dt]
+
+
+@pytest.mark.breakout
+class TestCollisionDetector:
+    @pytest.fixture(autouse=True)
+    def fake_toi(self, monkeypatch):
+        monkeypatch.setattr(
+            detector_module,
+            "calculate_collision_toi",
+            lambda coll, dt: coll.toi,
+        )
+
+    def test_analytic_time(self):
+        detector = CollisionDetector(
+            engine=SweepAndPruneCollisionDetectionEngine()
+        )
+        session = FakeQuerySession(
+            [FakeCollision(time=5.0, toi=5.0), FakeCollision(time=7.0, toi=7.0)]
+        )
+
+        step_dt = detector.get_time_before_collision(None, 10.0, session)
+
+        assert step_dt == 5.0 - EPS
+
+    def test_unsupported_pair_before_supported(self):
+        detector = CollisionDetector(
+            engine=SweepAndPruneCollisionDetectionEngine()
+        )
+        session = FakeQuerySession(
+            [
+                FakeCollision(time=2.0, toi=None),
+                FakeCollision(time=5.0, toi=5.0),
+            ]
+        )
+
+        step_dt = detector.get_time_before_collision(None, 10.0, session)
+
+        assert 2.0 - 2 * EPS < step_dt < 2.0
+
+    def test_unsupported_pair_after_supported(self):
+        detector = CollisionDetector(
+            engine=SweepAndPruneCollisionDetectionEngine()
+        )
+        session = FakeQuerySession(
+            [
+                FakeCollision(time=7.0, toi=None),
+                FakeCollision(time=5.0, toi=5.0),
+            ]
+        )
+
+        step_dt = detector.get_time_before_collision(None, 10.0, session)
+
+        assert step_dt == 5.0 - EPS
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from envs.breakout import (
+    BreakoutAction,
+    BreakoutActionType,
+    CollisionDetector,
+    EventDrivenBreakoutEnv,
+    PerformanceLevelBuilder,
+    SweepAndPruneCollisionDetectionEngine,
+)
+from envs.breakout.state import BreakoutState
+from geometry import Vec2
+
+
+@pytest.mark.breakout
+class TestEventDrivenBreakoutEnv:
+    def test_events_do_not_scan_scene(self, monkeypatch):
+        random.seed(3)
+
+        env = EventDrivenBreakoutEnv(
+            env_size=Vec2(x=400, y=400),
+            collision_detector=CollisionDetector(
+                engine=SweepAndPruneCollisionDetectionEngine()
+            ),
+            level_builder=PerformanceLevelBuilder(
+                env_size=Vec2(x=400, y=400),
+                num_balls=30,
+                ball_radius=15,
+                ball_speed=15,
+            ),
+        )
+        env.reset()
+
+        num_calls = 0
+        get_items = BreakoutState.get_items
+
+        def counted_get_items(state):
+            nonlocal num_calls
+            num_calls += 1
+
+            return get_items(state)
+
+        monkeypatch.setattr(BreakoutState, "get_items", counted_get_items)
+
+        env.step(BreakoutAction(type=BreakoutActionType.NOTHING), 10.0)
+
+        assert len(env.pop_events()) > 2
+        assert num_calls == 1
@@ -0,0 +1,76 @@
+import pytest
+
+from envs.breakout import (
+    BreakoutState,
+    CollisionBallBlock,
+    ItemManager,
+    KDTreeCollisionDetectionEngine,
+)
+from geometry import Point, Vec2
+
+
+def build_state() -> BreakoutState:
+    item_manager = ItemManager()
+
+    ball = item_manager.create_ball(radius=10, speed=2.0, thrown=True)
+    ball.rect.center = Point(x=100, y=60)
+    ball.velocity = Vec2(x=0, y=1)
+
+    block = item_manager.create_block(top=0, left=0)
+    block.rect.center = Point(x=100, y=90)
+
+    item_manager.create_block(top=300, left=300)
+
+    return item_manager.extract_state()
+
+
+def get_collided_block_ids(engine, state):
+    return [
+        coll.block.id
+        for coll in engine.generate_step_collisions(state, 10.0)
+        if isinstance(coll, CollisionBallBlock)
+    ]
+
+
+@pytest.mark.breakout
+@pytest.mark.kdtree
+class TestKDTreeStaticIndex:
+    def test_reused_for_unchanged_state(self):
+        engine = KDTreeCollisionDetectionEngine()
+        state = build_state()
+
+        get_collided_block_ids(engine, state)
+        static_index = engine._static_indices.get(state)
+        get_collided_block_ids(engine, state)
+
+        assert static_index is not None
+        assert engine._static_indices.get(state) is static_index
+
+    def test_rebuilt_after_block_removal(self):
+        engine = KDTreeCollisionDetectionEngine()
+        state = build_state()
+        block = state.blocks[0]
+
+        assert get_collided_block_ids(engine, state) == [block.id]
+        static_index = engine._static_indices.get(state)
+
+        static_version = state.static_version
+        state.remove_block(block)
+
+        assert state.static_version == static_version + 1
+        assert get_collided_block_ids(engine, state) == []
+        assert engine._static_indices.get(state) is not static_index
+
+    def test_copy_gets_own_index(self):
+        engine = KDTreeCollisionDetectionEngine()
+        state = build_state()
+        get_collided_block_ids(engine, state)
+
+        state_copy = state.copy()
+        state_copy.remove_block(state_copy.blocks[0])
+        state_copy.static_version = state.static_version
+
+        assert get_collided_block_ids(engine, state_copy) == []
+        assert engine._static_indices.get(
+            state_copy
+        ) is not engine._static_indices.get(state)
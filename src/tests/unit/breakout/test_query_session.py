@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from envs.breakout import (
+    CollisionDetector,
+    PerformanceLevelBuilder,
+    SweepAndPruneCollisionDetectionEngine,
+)
+from envs.breakout.constants import EPS
+from geometry import Vec2
+
+
+def build_state(seed: int):
+    random.seed(seed)
+
+    level_builder = PerformanceLevelBuilder(
+        env_size=Vec2(x=400, y=400),
+        num_balls=30,
+        ball_radius=15,
+        ball_speed=15,
+    )
+
+    return level_builder.build()
+
+
+def get_collided_ids(colls):
+    return sorted(tuple(sorted(coll.item_ids)) for coll in colls)
+
+
+@pytest.mark.breakout
+class TestCollisionQuerySession:
+    def test_same_collisions(self, collision_engine):
+        state = build_state(3)
+        session = collision_engine.create_query_session(state, 10.0)
+
+        for dt in [10.0, 5.0, 1.0, 0.1, EPS]:
+            colls = session.generate_step_collisions(dt)
+            expected = collision_engine.generate_step_collisions(state, dt)
+
+            assert get_collided_ids(colls) == get_collided_ids(expected)
+
+    def test_advanced_session(self, collision_engine):
+        state = build_state(5)
+        session = collision_engine.create_query_session(state, 10.0 + EPS)
+
+        for ball in state.balls:
+            ball.rect.center += ball.velocity * ball.speed * 4.0
+        session.advance(4.0)
+
+        for dt in [EPS, 1.0, 6.0, 8.0]:
+            colls = session.generate_step_collisions(dt)
+            expected = collision_engine.generate_step_collisions(state, dt)
+
+            assert get_collided_ids(colls) == get_collided_ids(expected)
+
+    def test_single_broad_phase(self, monkeypatch):
+        engine = SweepAndPruneCollisionDetectionEngine()
+        detector = CollisionDetector(engine=engine)
+
+        num_calls = 0
+        get_step_intersactions = engine.get_step_intersactions
+
+        def counted_get_step_intersactions(state, dt):
+            nonlocal num_calls
+            num_calls += 1
+
+            return get_step_intersactions(state, dt)
+
+        monkeypatch.setattr(
+            engine, "get_step_intersactions", counted_get_step_intersactions
+        )
+
+        state = build_state(3)
+        session = detector.create_query_session(state, 10.0 + EPS)
+        step_dt = detector.get_time_before_collision(
+            state, 10.0, session=session
+        )
+        detector.get_step_collisions(state, EPS, session=session)
+
+        assert step_dt < 10.0
+        assert num_calls == 1
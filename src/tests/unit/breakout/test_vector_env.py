@@ -0,0 +1,249 @@
+import pickle
+from copy import deepcopy
+from functools import partial
+
+import numpy as np
+import pytest
+
+from envs.breakout import (
+    BreakoutAction,
+    BreakoutActionType,
+    BreakoutEnv,
+    BreakoutObserver,
+    BreakoutState,
+    CollisionDetector,
+    DefaultLevelBuilder,
+    EmptyLevelBuilder,
+    ItemManager,
+    NaiveCollisionDetectionEngine,
+    SharedVectorBuffer,
+    VectorBackendType,
+    VectorBreakoutEnv,
+)
+from envs.breakout.protocols import IBreakoutLevelBuilder
+from geometry import Point, Vec2
+
+
+class StaticLevelBuilder:
+    def __init__(self, state: BreakoutState) -> None:
+        self._state = state
+
+    def build(self) -> BreakoutState:
+        return deepcopy(self._state)
+
+
+def make_env(level_builder: IBreakoutLevelBuilder) -> BreakoutEnv:
+    return BreakoutEnv(
+        env_size=Vec2(x=400, y=400),
+        collision_detector=CollisionDetector(
+            engine=NaiveCollisionDetectionEngine()
+        ),
+        level_builder=level_builder,
+    )
+
+
+def make_default_level_builder(num_rows: int) -> DefaultLevelBuilder:
+    return DefaultLevelBuilder(
+        env_size=Vec2(x=400, y=400),
+        ball_speed=15,
+        ball_radius=15,
+        platform_speed=10,
+        platform_size=Vec2(x=200, y=25),
+        block_wall_num_rows=num_rows,
+        block_size=Vec2(x=90, y=30),
+        block_wall_top_shift=60,
+        block_wall_between_shift=30,
+    )
+
+
+@pytest.fixture
+def breaking_level_builder(item_manager: ItemManager) -> StaticLevelBuilder:
+    ball = item_manager.create_ball(radius=10, speed=2.0)
+    ball.rect.center = Point(x=100, y=60)
+    ball.thrown = True
+    ball.velocity = Vec2(x=0, y=1)
+
+    block = item_manager.create_block(top=0, left=0)
+    block.rect.center = Point(x=100, y=140)
+
+    return StaticLevelBuilder(state=item_manager.extract_state())
+
+
+def nothing_actions(num_envs: int):
+    return [BreakoutAction(type=BreakoutActionType.NOTHING)] * num_envs
+
+
+@pytest.mark.breakout
+class TestVectorBreakoutEnv:
+    @pytest.mark.parametrize(
+        "backend_type, shared_memory",
+        [
+            (VectorBackendType.SYNC, False),
+            (VectorBackendType.SUBPROCESS, False),
+            (VectorBackendType.SUBPROCESS, True),
+        ],
+    )
+    def test_stacked_outputs(
+        self, backend_type: VectorBackendType, shared_memory: bool
+    ):
+        env_fns = [
+            partial(make_env, make_default_level_builder(num_rows))
+            for num_rows in [1, 2, 3]
+        ]
+        observer = BreakoutObserver(max_balls=2, max_blocks=12)
+
+        with VectorBreakoutEnv(
+            env_fns=env_fns,
+            backend_type=backend_type,
+            observer=observer,
+            num_workers=2,
+            shared_memory=shared_memory,
+        ) as vector_env:
+            observation = vector_env.reset()
+            assert observation.blocks.shape == (3, 12, observer.block_features)
+
+            observation, rewards, dones = vector_env.step(
+                nothing_actions(3), dt=1.0
+            )
+            observation = observation.copy()
+            rewards = rewards.copy()
+            dones = dones.copy()
+
+        assert observation.platforms.shape == (
+            3,
+            1,
+            observer.platform_features,
+        )
+        assert observation.balls.shape == (3, 2, observer.ball_features)
+        assert rewards.shape == (3,)
+        assert dones.shape == (3,)
+        assert not dones.any()
+        assert (observation.platforms[:, 0, 0] == 1.0).all()
+        assert observation.balls[:, :, 0].tolist() == [[1.0, 0.0]] * 3
+        assert observation.blocks[:, :, 0].sum(axis=1).tolist() == [3, 6, 9]
+
+    def test_observer_sized_from_levels(self):
+        env_fns = [
+            partial(make_env, make_default_level_builder(num_rows))
+            for num_rows in [1, 3]
+        ]
+
+        with VectorBreakoutEnv(env_fns=env_fns) as vector_env:
+            observation = vector_env.reset()
+
+        assert vector_env.observer.max_blocks == 9
+        assert vector_env.observer.max_balls == 1
+        assert observation.blocks[:, :, 0].sum(axis=1).tolist() == [3, 9]
+
+    @pytest.mark.parametrize(
+        "backend_type, shared_memory",
+        [
+            (VectorBackendType.SYNC, False),
+            (VectorBackendType.SUBPROCESS, False),
+            (VectorBackendType.SUBPROCESS, True),
+        ],
+    )
+    def test_step_reuses_arrays(
+        self, backend_type: VectorBackendType, shared_memory: bool
+    ):
+        env_fns = [partial(make_env, make_default_level_builder(1))] * 2
+
+        with VectorBreakoutEnv(
+            env_fns=env_fns,
+            backend_type=backend_type,
+            num_workers=2,
+            shared_memory=shared_memory,
+        ) as vector_env:
+            vector_env.reset()
+            first = vector_env.step(nothing_actions(2), dt=1.0)
+            second = vector_env.step(nothing_actions(2), dt=1.0)
+
+            assert first[0].balls is second[0].balls
+            assert first[1] is second[1]
+            assert first[2] is second[2]
+
+    def test_backends_match(self):
+        env_fns = [
+            partial(make_env, make_default_level_builder(num_rows))
+            for num_rows in [1, 2, 3, 1, 2]
+        ]
+
+        results = []
+        for backend_type, shared_memory in [
+            (VectorBackendType.SYNC, False),
+            (VectorBackendType.SUBPROCESS, False),
+            (VectorBackendType.SUBPROCESS, True),
+        ]:
+            with VectorBreakoutEnv(
+                env_fns=env_fns,
+                backend_type=backend_type,
+                num_workers=3,
+                shared_memory=shared_memory,
+            ) as vector_env:
+                vector_env.reset()
+                observation, rewards, dones = vector_env.step(
+                    nothing_actions(5), dt=1.0
+                )
+                results.append(
+                    [
+                        observation.platforms.copy(),
+                        observation.balls.copy(),
+                        observation.blocks.copy(),
+                        rewards.copy(),
+                        dones.copy(),
+                    ]
+                )
+
+        expected = results[0]
+        for result in results[1:]:
+            for expected_array, array in zip(expected, result):
+                assert np.array_equal(expected_array, array)
+
+    def test_reward_and_auto_reset(
+        self, breaking_level_builder: StaticLevelBuilder
+    ):
+        vector_env = VectorBreakoutEnv(
+            env_fns=[
+                partial(make_env, breaking_level_builder),
+                partial(make_env, EmptyLevelBuilder()),
+            ],
+        )
+        initial = vector_env.reset()[0].copy()
+
+        observation, rewards, dones = vector_env.step(nothing_actions(2), dt=60)
+
+        assert rewards.tolist() == [1.0, 0.0]
+        assert dones.tolist() == [True, True]
+        assert np.array_equal(observation.balls[0], initial.balls)
+        assert np.array_equal(observation.blocks[0], initial.blocks)
+
+    def test_wrong_number_of_actions(self):
+        vector_env = VectorBreakoutEnv(
+            env_fns=[partial(make_env, EmptyLevelBuilder())],
+        )
+        vector_env.reset()
+
+        with pytest.raises(ValueError):
+            vector_env.step(nothing_actions(2), dt=1.0)
+
+
+@pytest.mark.breakout
+class TestSharedVectorBuffer:
+    def test_attached_buffer_shares_memory(self):
+        observer = BreakoutObserver(max_balls=1, max_blocks=2)
+        buffer = SharedVectorBuffer(num_envs=2, observer=observer)
+        attached = pickle.loads(pickle.dumps(buffer))
+
+        attached.balls[1, 0] = [1.0, 2.0, 3.0, 4.0, 5.0]
+        attached.blocks[0, 1] = [1.0, 2.0, 3.0, 4.0]
+        attached.rewards[0] = 5.0
+        attached.dones[1] = True
+
+        assert buffer.balls[1, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert buffer.blocks[0, 1].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert not buffer.platforms.any()
+        assert buffer.rewards.tolist() == [5.0, 0.0]
+        assert buffer.dones.tolist() == [False, True]
+
+        attached.close()
+        buffer.close()
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from geometry import KDTree, SpatialHashGrid, SweepAndPrune
+
+from ..kdtree.test_dynamic_tree import build_random_records
+from ..kdtree.tree_utils import build_record
+
+
+def get_ids(intersections):
+    return sorted(tuple(sorted(ids)) for ids, _ in intersections)
+
+
+@pytest.mark.broadphase
+class TestSpatialHashGrid:
+    @pytest.mark.parametrize("cell_size", [None, 3.0, 50.0])
+    def test_matches_kdtree(self, cell_size):
+        rng = random.Random(3)
+        rs = build_random_records(rng, 200)
+
+        grid = SpatialHashGrid(records=rs, cell_size=cell_size)
+
+        assert get_ids(grid.generate_colliding_items({(1, 1)})) == get_ids(
+            KDTree(records=rs).generate_colliding_items({(1, 1)})
+        )
+
+    def test_records_intersections(self):
+        rng = random.Random(4)
+        rs = build_random_records(rng, 100)
+        queries = [
+            build_record(
+                left=k * 10,
+                top=k * 10,
+                right=k * 10 + 15,
+                bottom=k * 10 + 15,
+                item_id=-k - 1,
+            )
+            for k in range(10)
+        ]
+
+        grid = SpatialHashGrid(records=rs)
+        tree = KDTree(records=rs)
+
+        intersections = get_ids(
+            grid.generate_records_intersections(queries, {(1, 1)})
+        )
+        assert intersections == get_ids(
+            tree.generate_records_intersections(queries, {(1, 1)})
+        )
+        assert len(intersections) > 0
+
+    def test_record_spanning_many_cells(self):
+        rs = [
+            build_record(left=0, top=0, right=100, bottom=5, item_id=1),
+            build_record(left=90, top=0, right=95, bottom=5, item_id=2),
+        ]
+
+        grid = SpatialHashGrid(records=rs, cell_size=10.0)
+
+        assert get_ids(grid.generate_colliding_items({(1, 1)})) == [(1, 2)]
+
+
+@pytest.mark.broadphase
+class TestSweepAndPrune:
+    def test_matches_kdtree_while_moving(self):
+        rng = random.Random(5)
+        rs = build_random_records(rng, 150)
+
+        sweep = SweepAndPrune()
+        for shift in range(5):
+            moved = []
+            for r in rs:
+                if r.item_id % 7 == shift:
+                    continue
+
+                dx = shift * rng.uniform(-2, 2)
+                moved.append(
+                    build_record(
+                        left=r.bounding_box.left + dx,
+                        top=r.bounding_box.top,
+                        right=r.bounding_box.right + dx,
+                        bottom=r.bounding_box.bottom,
+                        item_id=r.item_id,
+                    )
+                )
+
+            sweep.update(moved)
+
+            assert get_ids(sweep.generate_colliding_items({(1, 1)})) == get_ids(
+                KDTree(records=moved).generate_colliding_items({(1, 1)})
+            )
+
+    def test_empty(self):
+        sweep = SweepAndPrune(records=[])
+
+        assert list(sweep.generate_colliding_items({(1, 1)})) == []
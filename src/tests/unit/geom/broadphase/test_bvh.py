@@ -0,0 +1,112 @@
+import math
+import random
+
+import pytest
+
+from geometry import DynamicAABBTree, KDTree
+
+from ..kdtree.test_dynamic_tree import build_random_records
+from ..kdtree.tree_utils import build_record
+from .test_broadphase import get_ids
+
+
+def build_tree(records, margin=1.0):
+    tree = DynamicAABBTree(margin=margin)
+    for record in records:
+        tree.insert(
+            item_id=record.item_id,
+            class_id=record.class_id,
+            records=[record],
+        )
+
+    return tree
+
+
+def shift_record(record, dx, dy):
+    left, top, right, bottom = record.bounds
+
+    return build_record(
+        left=left + dx,
+        top=top + dy,
+        right=right + dx,
+        bottom=bottom + dy,
+        item_id=record.item_id,
+        class_id=record.class_id,
+    )
+
+
+@pytest.mark.broadphase
+class TestDynamicAABBTree:
+    def test_matches_kdtree(self):
+        rng = random.Random(5)
+        rs = build_random_records(rng, 200)
+
+        tree = build_tree(rs)
+
+        assert get_ids(tree.generate_colliding_items({(1, 1)})) == get_ids(
+            KDTree(records=rs).generate_colliding_items({(1, 1)})
+        )
+        assert tree.height <= 2 * math.log2(len(rs)) + 1
+
+    def test_move_and_remove(self):
+        rng = random.Random(6)
+        rs = build_random_records(rng, 100)
+        tree = build_tree(rs)
+
+        for _ in range(5):
+            rs = [
+                shift_record(r, rng.uniform(-3, 3), rng.uniform(-3, 3))
+                for r in rs
+            ]
+            for record in rs:
+                tree.move(item_id=record.item_id, records=[record])
+
+        removed_ids = set(rng.sample(range(100), 30))
+        for item_id in removed_ids:
+            tree.remove(item_id)
+        rs = [r for r in rs if r.item_id not in removed_ids]
+
+        assert len(tree) == len(rs)
+        assert get_ids(tree.generate_colliding_items({(1, 1)})) == get_ids(
+            KDTree(records=rs).generate_colliding_items({(1, 1)})
+        )
+
+    def test_fat_bounds_skip_reinsertion(self):
+        record = build_record(left=0, top=0, right=10, bottom=10, item_id=1)
+        tree = build_tree([record], margin=2.0)
+
+        assert not tree.move(item_id=1, records=[shift_record(record, 1, 1)])
+        assert tree.move(item_id=1, records=[shift_record(record, 5, 0)])
+        assert tree.get_fat_bounds(1) == (3.0, -2.0, 17.0, 12.0)
+        assert tree.num_reinsertions == 1
+
+    def test_class_pairs(self):
+        rs = [
+            build_record(0, 0, 10, 10, item_id=1, class_id=1),
+            build_record(5, 5, 15, 15, item_id=2, class_id=2),
+            build_record(8, 8, 20, 20, item_id=3, class_id=2),
+        ]
+        tree = build_tree(rs)
+
+        assert get_ids(tree.generate_colliding_items({(1, 2)})) == [
+            (1, 2),
+            (1, 3),
+        ]
+        assert get_ids(tree.generate_colliding_items({(2, 2)})) == [(2, 3)]
+
+    def test_query(self):
+        rng = random.Random(8)
+        rs = build_random_records(rng, 50)
+        tree = build_tree(rs, margin=0.0)
+
+        bounds = (20.0, 20.0, 40.0, 40.0)
+        expected = {
+            r.item_id
+            for r in rs
+            if r.bounds[0] <= bounds[2]
+            and bounds[0] <= r.bounds[2]
+            and r.bounds[1] <= bounds[3]
+            and bounds[1] <= r.bounds[3]
+        }
+
+        assert set(tree.query(bounds)) == expected
@@ -0,0 +1,13 @@
+import pytest
+
+from geometry import kernels
+
+
+@pytest.fixture(autouse=True, params=kernels.get_available_backends())
+def geometry_backend(request):
+    backend = kernels.get_backend()
+    kernels.set_backend(request.param)
+
+    yield request.param
+
+    kernels.set_backend(backend)
@@ -0,0 +1,69 @@
+import pytest
+
+from geometry import (
+    Capsule,
+    Circle,
+    Point,
+    Rectangle,
+    Segment,
+    Triangle,
+    get_distance_point_capsule,
+    get_distance_point_circle,
+    get_distance_point_rectangle,
+    get_distance_point_segment,
+    get_distance_point_triangle,
+)
+from tests.math_utils import almost_equal_float
+
+
+@pytest.mark.geom
+class TestDistance:
+    def test_point_circle(self):
+        c = Circle(center=Point(x=0, y=0), radius=2)
+
+        assert almost_equal_float(
+            get_distance_point_circle(Point(x=3, y=4), c), 3
+        )
+        assert get_distance_point_circle(Point(x=1, y=0), c) == 0
+
+    def test_point_rectangle(self):
+        r = Rectangle(left=0, top=0, width=10, height=5)
+
+        assert almost_equal_float(
+            get_distance_point_rectangle(Point(x=13, y=9), r), 5
+        )
+        assert almost_equal_float(
+            get_distance_point_rectangle(Point(x=5, y=-2), r), 2
+        )
+        assert get_distance_point_rectangle(Point(x=5, y=2), r) == 0
+
+    def test_point_segment(self):
+        s = Segment(begin=Point(x=0, y=0), end=Point(x=10, y=0))
+
+        assert almost_equal_float(
+            get_distance_point_segment(Point(x=5, y=3), s), 3
+        )
+        assert almost_equal_float(
+            get_distance_point_segment(Point(x=13, y=4), s), 5
+        )
+
+    def test_point_triangle(self):
+        t = Triangle(
+            points=[Point(x=0, y=0), Point(x=10, y=0), Point(x=0, y=10)]
+        )
+
+        assert get_distance_point_triangle(Point(x=2, y=2), t) == 0
+        assert almost_equal_float(
+            get_distance_point_triangle(Point(x=5, y=-3), t), 3
+        )
+
+    def test_point_capsule(self):
+        c = Capsule(begin=Point(x=0, y=0), end=Point(x=10, y=0), radius=1)
+
+        assert get_distance_point_capsule(Point(x=5, y=0.5), c) == 0
+        assert almost_equal_float(
+            get_distance_point_capsule(Point(x=5, y=-3), c), 2
+        )
+        assert almost_equal_float(
+            get_distance_point_capsule(Point(x=13, y=4), c), 4
+        )
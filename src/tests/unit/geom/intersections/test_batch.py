@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from geometry import (
+    Capsule,
+    Circle,
+    Point,
+    Rectangle,
+    Triangle,
+    get_intersection,
+    get_intersections,
+)
+
+
+def build_random_shape(rng: random.Random, shape_type: type):
+    x = rng.uniform(0, 20)
+    y = rng.uniform(0, 20)
+
+    if shape_type is Circle:
+        return Circle(center=Point(x=x, y=y), radius=rng.uniform(0.5, 5))
+
+    elif shape_type is Rectangle:
+        return Rectangle(
+            left=x,
+            top=y,
+            width=rng.uniform(0.5, 5),
+            height=rng.uniform(0.5, 5),
+        )
+
+    elif shape_type is Capsule:
+        return Capsule(
+            begin=Point(x=x, y=y),
+            end=Point(x=x + rng.uniform(-5, 5), y=y + rng.uniform(-5, 5)),
+            radius=rng.uniform(0.5, 2),
+        )
+
+    return Triangle(
+        points=[
+            Point(x=x + rng.uniform(-5, 5), y=y + rng.uniform(-5, 5))
+            for _ in range(3)
+        ]
+    )
+
+
+@pytest.mark.geom
+@pytest.mark.intersections
+class TestBatchIntersections:
+    @pytest.mark.parametrize(
+        "type_a, type_b",
+        [
+            (Circle, Circle),
+            (Rectangle, Rectangle),
+            (Triangle, Triangle),
+            (Triangle, Circle),
+            (Circle, Triangle),
+            (Capsule, Capsule),
+            (Capsule, Rectangle),
+            (Rectangle, Circle),
+        ],
+    )
+    def test_batch_matches_pairwise(self, type_a, type_b):
+        rng = random.Random(0)
+        pairs = [
+            (build_random_shape(rng, type_a), build_random_shape(rng, type_b))
+            for _ in range(200)
+        ]
+
+        intersections = get_intersections(pairs)
+        expected = [get_intersection(a, b) for a, b in pairs]
+
+        assert any(intersection is not None for intersection in expected)
+        assert intersections == expected
+
+    def test_batch_mixed_pairs(self):
+        rng = random.Random(1)
+        types = [Circle, Triangle]
+        pairs = [
+            (
+                build_random_shape(rng, rng.choice(types)),
+                build_random_shape(rng, rng.choice(types)),
+            )
+            for _ in range(100)
+        ]
+
+        intersections = get_intersections(pairs, min_batch_size=1)
+        expected = [get_intersection(a, b) for a, b in pairs]
+
+        assert intersections == expected
+
+    def test_batch_mixed_capsule_pairs(self):
+        rng = random.Random(2)
+        types = [Capsule, Circle, Rectangle]
+        pairs = [
+            (
+                build_random_shape(rng, rng.choice(types)),
+                build_random_shape(rng, rng.choice(types)),
+            )
+            for _ in range(100)
+        ]
+
+        intersections = get_intersections(pairs, min_batch_size=1)
+        expected = [get_intersection(a, b) for a, b in pairs]
+
+        assert intersections == expected
+
+    def test_batch_empty(self):
+        assert get_intersections([]) == []
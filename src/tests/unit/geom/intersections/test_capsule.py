@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from geometry import (
+    Capsule,
+    Circle,
+    Point,
+    Rectangle,
+    get_distance_point_rectangle,
+    get_intersection,
+    is_intersected,
+)
+
+
+def build_capsule(x0, y0, x1, y1, radius):
+    return Capsule(
+        begin=Point(x=x0, y=y0),
+        end=Point(x=x1, y=y1),
+        radius=radius,
+    )
+
+
+@pytest.mark.geom
+@pytest.mark.intersections
+@pytest.mark.capsule
+class TestIntersectionsCapsule:
+    def test_rectangle_circle_intersection(self):
+        r = Rectangle(left=0, top=0, width=10, height=10)
+
+        intersection = get_intersection(
+            r, Circle(center=Point(x=12, y=5), radius=3)
+        )
+        assert intersection == Point(x=10, y=5)
+
+        intersection = get_intersection(
+            Circle(center=Point(x=5, y=5), radius=1), r
+        )
+        assert intersection == Point(x=5, y=5)
+
+        assert not is_intersected(r, Circle(center=Point(x=12, y=12), radius=2))
+
+    def test_capsule_rectangle_intersection(self):
+        r = Rectangle(left=0, top=0, width=10, height=10)
+
+        c = build_capsule(-5, -5, 15, 15, 1)
+        assert get_intersection(c, r) == Point(x=0, y=0)
+        assert get_intersection(r, c) == Point(x=0, y=0)
+
+        c = build_capsule(-5, 11.5, 15, 11.5, 1)
+        assert not is_intersected(c, r)
+
+        c = build_capsule(-5, 11.5, 15, 11.5, 2)
+        assert is_intersected(c, r)
+
+        c = build_capsule(8, 14, 14, 8, 2)
+        assert get_intersection(c, r) == Point(x=10, y=10)
+
+        c = build_capsule(8, 14, 14, 8, 1)
+        assert not is_intersected(c, r)
+
+    def test_capsule_capsule_intersection(self):
+        a = build_capsule(0, 0, 10, 10, 1)
+
+        assert is_intersected(a, build_capsule(0, 10, 10, 0, 0.1))
+        assert is_intersected(a, build_capsule(4, 3, 10, 3, 1))
+        assert not is_intersected(a, build_capsule(6, 2, 10, 2, 1))
+        assert not is_intersected(a, build_capsule(12, 13, 20, 20, 1))
+
+        intersection = get_intersection(a, build_capsule(0, 1, 0, 5, 1))
+        assert intersection == Point(x=0, y=0.5)
+
+    def test_capsule_circle_intersection(self):
+        c = build_capsule(0, 0, 10, 0, 1)
+
+        intersection = get_intersection(
+            c, Circle(center=Point(x=5, y=2), radius=2)
+        )
+        assert intersection == Point(x=5, y=1)
+        assert is_intersected(Circle(center=Point(x=12, y=0), radius=1.5), c)
+        assert not is_intersected(c, Circle(center=Point(x=5, y=3), radius=2))
+
+    def test_capsule_rectangle_matches_distance(self):
+        rng = random.Random(0)
+        r = Rectangle(left=0, top=0, width=10, height=5)
+
+        hits = 0
+        for _ in range(200):
+            x0, y0, x1, y1 = [rng.uniform(-10, 20) for _ in range(4)]
+            c = build_capsule(x0, y0, x1, y1, 2)
+
+            distance = min(
+                get_distance_point_rectangle(
+                    c.begin + (c.end - c.begin) * (i / 200), r
+                )
+                for i in range(201)
+            )
+            if abs(distance - c.radius) < 0.2:
+                continue
+
+            hits += distance < c.radius
+            assert is_intersected(c, r) == (distance < c.radius)
+
+        assert hits > 0
@@ -0,0 +1,174 @@
+import random
+
+import pytest
+
+from geometry.kdtree import DynamicKDTree, KDTree
+
+from .tree_utils import build_record
+
+
+def build_random_records(rng: random.Random, n: int):
+    records = []
+    for item_id in range(n):
+        left = rng.uniform(0, 100)
+        top = rng.uniform(0, 100)
+
+        records.append(
+            build_record(
+                left=left,
+                top=top,
+                right=left + rng.uniform(1, 10),
+                bottom=top + rng.uniform(1, 10),
+                item_id=item_id,
+            )
+        )
+
+    return records
+
+
+def get_intersecting_ids(tree):
+    return {
+        tuple(sorted(ids)) for ids, _ in tree.generate_colliding_items({(1, 1)})
+    }
+
+
+@pytest.mark.kdtree
+@pytest.mark.tree
+class TestDynamicTree:
+    def test_build_empty(self):
+        tree = DynamicKDTree(records=[])
+
+        assert tree.root is None
+        assert len(list(tree.traverse_nodes())) == 0
+        assert len(list(tree.generate_colliding_items({(1, 1)}))) == 0
+
+    def test_insert_into_empty(self):
+        tree = DynamicKDTree(records=[])
+        tree.insert([build_record(left=0, top=0, right=5, bottom=5)])
+
+        assert tree.root is not None
+        assert len(list(tree.root.generate_items())) == 1
+
+    def test_remove_last_item(self):
+        r = build_record(left=0, top=0, right=5, bottom=5, item_id=1)
+        tree = DynamicKDTree(records=[r])
+
+        tree.remove(1)
+
+        assert tree.root is None
+
+    def test_update_stays_consistent_with_rebuilt_tree(self):
+        rng = random.Random(0)
+        records = build_random_records(rng, 50)
+
+        tree = DynamicKDTree(
+            records=records,
+            max_depth=4,
+            num_records_stop=4,
+        )
+
+        for _ in range(20):
+            for item_id in rng.sample(range(len(records)), 10):
+                left = rng.uniform(0, 100)
+                top = rng.uniform(0, 100)
+
+                records[item_id] = build_record(
+                    left=left,
+                    top=top,
+                    right=left + rng.uniform(1, 10),
+                    bottom=top + rng.uniform(1, 10),
+                    item_id=item_id,
+                )
+                tree.update(item_id, [records[item_id]])
+
+            tree.rebalance()
+
+            expected_tree = KDTree(
+                records=records,
+                max_depth=4,
+                num_records_stop=4,
+            )
+
+            assert tree.root is not None
+            assert len(list(tree.root.generate_items())) == len(records)
+            assert get_intersecting_ids(tree) == get_intersecting_ids(
+                expected_tree
+            )
+
+    def test_update_in_place_keeps_nodes(self):
+        rng = random.Random(1)
+        records = build_random_records(rng, 50)
+
+        tree = DynamicKDTree(
+            records=records,
+            max_depth=4,
+            num_records_stop=4,
+        )
+        node_ids = [id(node) for node in tree.traverse_nodes()]
+
+        record = records[0]
+        moved = build_record(
+            left=record.bounding_box.left,
+            top=record.bounding_box.top,
+            right=record.bounding_box.right,
+            bottom=record.bounding_box.bottom,
+            item_id=record.item_id,
+        )
+        tree.update(record.item_id, [moved])
+
+        assert [id(node) for node in tree.traverse_nodes()] == node_ids
+
+    def test_rebalance_visits_only_dirty_nodes(self, monkeypatch):
+        rng = random.Random(2)
+        records = build_random_records(rng, 200)
+
+        tree = DynamicKDTree(
+            records=records,
+            max_depth=6,
+            num_records_stop=4,
+        )
+
+        visited_ids = []
+        is_degraded = tree._is_degraded
+
+        def spied_is_degraded(node, depth):
+            visited_ids.append(id(node))
+
+            return is_degraded(node, depth)
+
+        monkeypatch.setattr(tree, "_is_degraded", spied_is_degraded)
+
+        tree.rebalance()
+        assert visited_ids == []
+
+        record = records[0]
+        moved = build_record(
+            left=record.bounding_box.left,
+            top=record.bounding_box.top,
+            right=record.bounding_box.right,
+            bottom=record.bounding_box.bottom,
+            item_id=record.item_id,
+        )
+        tree.update(record.item_id, [moved])
+        path_ids = {id(node) for node in tree._record_id2path[id(moved)]}
+
+        tree.rebalance()
+
+        assert visited_ids
+        assert set(visited_ids) <= path_ids
+        assert len(path_ids) < len(list(tree.traverse_nodes()))
+
+        visited_ids.clear()
+        tree.rebalance()
+        assert visited_ids == []
+
+    def test_num_records(self):
+        rng = random.Random(3)
+        records = build_random_records(rng, 50)
+
+        tree = DynamicKDTree(records=records, max_depth=4, num_records_stop=4)
+        tree.remove(records[0].item_id)
+        tree.insert(build_random_records(rng, 3))
+
+        for node in tree.traverse_nodes():
+            assert node.num_records == len(list(node.generate_items()))
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from geometry.kdtree import CollisionMasks, KDTree
+from geometry.kdtree.masks import get_class_mask, get_class_masks
+
+from .tree_utils import build_record
+
+
+def build_grid(class_id, offset, item_id_offset):
+    return [
+        build_record(
+            left=offset + i * 7,
+            right=offset + i * 7 + 10,
+            top=j * 7,
+            bottom=j * 7 + 10,
+            item_id=item_id_offset + j * 10 + i,
+            class_id=class_id,
+        )
+        for i in range(10)
+        for j in range(10)
+    ]
+
+
+@pytest.mark.kdtree
+class TestCollisionMasks:
+    def test_masks(self):
+        masks = CollisionMasks({(1, 2), (1, 1)})
+
+        assert masks.get_mask(1) == 0b110
+        assert masks.get_mask(2) == 0b10
+        assert masks.get_mask(3) == 0
+        assert masks.is_collidable(2, 1)
+        assert not masks.is_collidable(2, 2)
+        assert masks.is_masks_collidable(0b100, 0b110)
+        assert not masks.is_masks_collidable(0b100, 0b1100)
+        assert masks.get_masks(np.array([1, 2, 3])).tolist() == [6, 2, 0]
+
+    def test_class_id_out_of_range(self):
+        with pytest.raises(ValueError):
+            get_class_mask(63)
+
+        with pytest.raises(ValueError):
+            get_class_masks(np.array([1, -1]))
+
+    def test_node_class_masks(self):
+        rs = build_grid(class_id=2, offset=0, item_id_offset=0) + build_grid(
+            class_id=1, offset=1000, item_id_offset=100
+        )
+
+        tree = KDTree(records=rs, max_depth=4, num_records_stop=8)
+
+        assert tree.class_masks[0] == 0b110
+        assert tree.root.class_mask == 0b110
+        assert set(tree.class_masks.tolist()) == {0b10, 0b100, 0b110}
+
+    def test_skips_non_collidable_subtrees(self, monkeypatch):
+        rs = build_grid(class_id=2, offset=0, item_id_offset=0) + build_grid(
+            class_id=1, offset=1000, item_id_offset=100
+        )
+        collidable_pairs = {(1, 2)}
+
+        tree = KDTree(records=rs, max_depth=4, num_records_stop=8)
+
+        num_candidates = []
+
+        def count_candidates(first_idxs, **kwargs):
+            num_candidates.append(len(first_idxs))
+            return iter([])
+
+        monkeypatch.setattr(
+            "geometry.kdtree.tree.generate_candidate_intersections",
+            count_candidates,
+        )
+
+        list(tree.generate_colliding_items(collidable_pairs))
+        assert num_candidates == [0]
+
+        blocks = build_grid(class_id=2, offset=0, item_id_offset=200)
+        list(tree.generate_records_intersections(blocks, collidable_pairs))
+        assert num_candidates[1] == 0
+
+        balls = build_grid(class_id=1, offset=0, item_id_offset=300)
+        list(tree.generate_records_intersections(balls, collidable_pairs))
+        assert num_candidates[2] > 0
+
+        assert list(tree.root.generate_intersections(collidable_pairs)) == []
@@ -1,6 +1,7 @@
 import pytest
 
 from geometry import Rectangle
+from geometry.kdtree import KDTree
 from geometry.kdtree.node import (
     LeafTreeNode,
     ParentRelativeType,
@@ -178,3 +179,69 @@ class TestTreeNode:
 
         items = list(node.generate_items())
         assert len(items) == 5
+
+    def test_bounds(self):
+        r1 = build_record(
+            left=0,
+            top=5,
+            right=10,
+            bottom=10,
+        )
+        r2 = build_record(
+            left=20,
+            top=0,
+            right=25,
+            bottom=7,
+        )
+
+        node = SplitTreeNode(
+            type=TreeNodeType.HORISONTAL,
+            parent_relative=ParentRelativeType.ROOT,
+            threashold=15.0,
+            left=LeafTreeNode(
+                type=TreeNodeType.LEAF,
+                parent_relative=ParentRelativeType.LEFT,
+                items=[r1],
+            ),
+            right=LeafTreeNode(
+                type=TreeNodeType.LEAF,
+                parent_relative=ParentRelativeType.RIGHT,
+                items=[r2],
+            ),
+        )
+
+        assert node.bounds == (0, 0, 25, 10)
+        assert node.bounding_box == Rectangle(
+            left=0, top=0, width=25, height=10
+        )
+
+        node.set_bounds((0, 0, 1, 1))
+        assert node.bounds == (0, 0, 1, 1)
+
+        node.reset_bounding_box()
+        assert node.bounds == (0, 0, 25, 10)
+
+    def test_materialized_bounds(self):
+        rs = [
+            build_record(
+                left=i * 7,
+                right=i * 7 + 10,
+                top=j * 3,
+                bottom=j * 3 + 10,
+                item_id=j * 10 + i,
+            )
+            for i in range(10)
+            for j in range(10)
+        ]
+
+        tree = KDTree(
+            records=rs,
+            max_depth=4,
+            num_records_stop=8,
+        )
+
+        for node in tree.traverse_nodes():
+            bounds = node.bounds
+
+            node.reset_bounding_box()
+            assert node.bounds == bounds
@@ -0,0 +1,108 @@
+import pickle
+import random
+
+import pytest
+
+from geometry.kdtree import KDTree, KDTreeQueryPool, WorkUnitType
+
+from .test_dynamic_tree import build_random_records
+
+
+def get_ids(intersections):
+    return sorted(tuple(sorted(ids)) for ids, _ in intersections)
+
+
+def build_tree(num_records=300):
+    rng = random.Random(11)
+    rs = build_random_records(rng, num_records)
+
+    return KDTree(records=rs, max_depth=6, num_records_stop=4)
+
+
+@pytest.mark.kdtree
+@pytest.mark.tree
+class TestParallelQueries:
+    @pytest.mark.parametrize("split_depth", [0, 1, 3, 10])
+    def test_work_units_match_tree(self, split_depth):
+        tree = build_tree()
+        collidable_pairs = {(1, 1)}
+
+        work_units = tree.get_work_units(split_depth)
+
+        assert get_ids(
+            tree.generate_work_units_intersections(
+                collidable_pairs=collidable_pairs,
+                work_units=work_units,
+            )
+        ) == get_ids(tree.generate_colliding_items(collidable_pairs))
+
+    def test_work_units_depth(self):
+        tree = build_tree()
+
+        assert tree.get_work_units(0) == [(WorkUnitType.SUBTREE.value, 0)]
+
+        work_units = tree.get_work_units(2)
+        num_cross = sum(
+            work_unit_type == WorkUnitType.CROSS.value
+            for work_unit_type, _ in work_units
+        )
+        assert 1 <= num_cross <= 4
+
+    def test_pool_matches_tree(self):
+        tree = build_tree()
+        collidable_pairs = {(1, 1)}
+
+        with KDTreeQueryPool(num_workers=2, split_depth=2) as pool:
+            intersections = list(
+                pool.generate_colliding_items(tree, collidable_pairs)
+            )
+            restored = pickle.loads(pickle.dumps(pool))
+
+        ids = get_ids(intersections)
+        assert ids == get_ids(tree.generate_colliding_items(collidable_pairs))
+        assert len(ids) == len(set(ids))
+        assert restored.num_workers == 2
+
+    def test_pool_requires_workers(self):
+        with pytest.raises(ValueError):
+            KDTreeQueryPool(num_workers=0)
+
+    def test_small_tree_is_queried_serially(self):
+        tree = build_tree(num_records=50)
+        collidable_pairs = {(1, 1)}
+
+        with KDTreeQueryPool(num_workers=2, min_parallel_records=100) as pool:
+            intersections = list(
+                pool.generate_colliding_items(tree, collidable_pairs)
+            )
+
+            assert pool._executor is None
+
+        assert get_ids(intersections) == get_ids(
+            tree.generate_colliding_items(collidable_pairs)
+        )
+
+    def test_tree_is_shared_once_per_build(self):
+        tree = build_tree()
+        collidable_pairs = {(1, 1)}
+
+        with KDTreeQueryPool(num_workers=2, split_depth=2) as pool:
+            list(pool.generate_colliding_items(tree, collidable_pairs))
+            tree_ref = pool._shared_tree_ref
+
+            list(pool.generate_colliding_items(tree, collidable_pairs))
+            assert pool._shared_tree_ref is tree_ref
+
+            other_tree = build_tree(num_records=400)
+            intersections = list(
+                pool.generate_colliding_items(other_tree, collidable_pairs)
+            )
+            other_tree_ref = pool._shared_tree_ref
+            assert tree_ref is not None and other_tree_ref is not None
+            assert other_tree_ref.version == tree_ref.version + 1
+
+        assert pool._executor is None
+        assert pool._tree_memory is None
+        assert get_ids(intersections) == get_ids(
+            other_tree.generate_colliding_items(collidable_pairs)
+        )
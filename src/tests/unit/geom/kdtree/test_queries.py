@@ -0,0 +1,155 @@
+import random
+from math import inf
+from typing import Dict
+
+import pytest
+
+from geometry import (
+    Circle,
+    Point,
+    Rectangle,
+    Triangle,
+    Vec2,
+    get_distance_point_shape,
+    get_time_of_impact_point_shape,
+)
+from geometry.kdtree import KDTree, Record, get_class_mask
+
+
+def build_shape(rng):
+    x = rng.uniform(0, 200)
+    y = rng.uniform(0, 200)
+    size = rng.uniform(2, 10)
+
+    kind = rng.randrange(3)
+    if kind == 0:
+        return Circle(center=Point(x=x, y=y), radius=size)
+
+    elif kind == 1:
+        return Rectangle(left=x, top=y, width=size, height=size / 2)
+
+    return Triangle(
+        points=[
+            Point(x=x, y=y),
+            Point(x=x + size, y=y),
+            Point(x=x, y=y + size),
+        ]
+    )
+
+
+def build_records(seed, n=300):
+    rng = random.Random(seed)
+
+    records = []
+    for idx in range(n):
+        shape = build_shape(rng)
+        records.append(
+            Record(
+                item_id=idx // 2,
+                class_id=1 + idx % 3,
+                shape=shape,
+                bounding_box=shape.bounding_box,
+            )
+        )
+
+    return records
+
+
+@pytest.mark.kdtree
+@pytest.mark.tree
+class TestTreeQueries:
+    def test_query_rect(self):
+        rs = build_records(seed=1)
+        tree = KDTree(records=rs, max_depth=6, num_records_stop=4)
+
+        rect = Rectangle(left=50, top=40, width=60, height=30)
+        class_mask = get_class_mask(1) | get_class_mask(3)
+
+        expected = {
+            id(r)
+            for r in rs
+            if r.bounding_box.is_intersected(rect)
+            and get_class_mask(r.class_id) & class_mask
+        }
+
+        assert {id(r) for r in tree.query_rect(rect, class_mask)} == expected
+        assert len(tree.query_rect(rect)) >= len(expected) > 0
+
+    @pytest.mark.parametrize("seed", [2, 3, 4])
+    def test_raycast(self, seed):
+        rs = build_records(seed=seed)
+        tree = KDTree(records=rs, max_depth=6, num_records_stop=4)
+
+        rng = random.Random(seed)
+        for _ in range(20):
+            origin = Point(x=rng.uniform(-20, 220), y=rng.uniform(-20, 220))
+            direction = Vec2(x=rng.uniform(-1, 1), y=rng.uniform(-1, 1))
+            class_mask = get_class_mask(rng.randrange(1, 4))
+
+            max_t = 500.0
+            tois = [
+                get_time_of_impact_point_shape(
+                    origin, direction * max_t, r.shape
+                )
+                for r in rs
+                if get_class_mask(r.class_id) & class_mask
+            ]
+            expected = min(
+                (toi * max_t for toi in tois if toi is not None),
+                default=None,
+            )
+
+            hit = tree.raycast(origin, direction, class_mask=class_mask)
+
+            if expected is None:
+                assert hit is None
+            else:
+                assert hit is not None
+                assert abs(hit.t - expected) < 1e-6
+                assert get_class_mask(hit.record.class_id) & class_mask
+
+    def test_raycast_max_t(self):
+        rs = build_records(seed=5)
+        tree = KDTree(records=rs)
+
+        hit = tree.raycast(Point(x=-10, y=100), Vec2(x=1, y=0))
+        assert hit is not None
+
+        assert tree.raycast(Point(x=-10, y=100), Vec2(x=1, y=0), 1.0) is None
+        limited_hit = tree.raycast(
+            Point(x=-10, y=100), Vec2(x=1, y=0), hit.t + 1e-6
+        )
+        assert limited_hit is not None
+        assert limited_hit.record is hit.record
+
+    @pytest.mark.parametrize("k", [1, 5])
+    def test_nearest(self, k):
+        rs = build_records(seed=6)
+        tree = KDTree(records=rs, max_depth=6, num_records_stop=4)
+        class_mask = get_class_mask(2)
+
+        point = Point(x=100, y=100)
+        item_id2distance: Dict[int, float] = {}
+        for r in rs:
+            if not get_class_mask(r.class_id) & class_mask:
+                continue
+
+            distance = get_distance_point_shape(point, r.shape)
+            item_id2distance[r.item_id] = min(
+                distance, item_id2distance.get(r.item_id, inf)
+            )
+
+        expected = sorted(item_id2distance.values())[:k]
+
+        neighbours = tree.nearest(point, k=k, class_mask=class_mask)
+        assert [n.distance for n in neighbours] == expected
+        assert len({n.record.item_id for n in neighbours}) == k
+
+    def test_empty_tree(self):
+        tree = KDTree(records=[])
+
+        assert (
+            tree.query_rect(Rectangle(left=0, top=0, width=5, height=5)) == []
+        )
+        assert tree.raycast(Point(x=0, y=0), Vec2(x=1, y=0)) is None
+        assert tree.nearest(Point(x=0, y=0)) == []
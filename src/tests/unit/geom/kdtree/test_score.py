@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from geometry.kdtree.scores import get_score
+from geometry.kdtree.scores import get_score, get_scores
 
 
 @pytest.mark.kdtree
@@ -37,3 +38,15 @@ class TestScores:
         assert get_score(l1, m1, r1, alpha=alpha) < get_score(
             l2, m2, r2, alpha=alpha
         )
+
+    def test_vectorized_scores(self):
+        l = np.array([0, 3, 10, 5])
+        m = np.array([1, 4, 0, 5])
+        r = np.array([9, 3, 0, 0])
+
+        for alpha in [0.0, 0.5, 0.8]:
+            scores = get_scores(l, m, r, alpha=alpha)
+
+            assert scores.tolist() == [
+                get_score(*counts, alpha=alpha) for counts in zip(l, m, r)
+            ]
@@ -0,0 +1,140 @@
+import random
+
+import numpy as np
+import pytest
+
+from geometry.kdtree import (
+    DynamicKDTree,
+    KDTree,
+    LoadGiniSplitStrategy,
+    MedianSplitStrategy,
+    SAHSplitStrategy,
+    SplitCandidates,
+    SplitTreeNode,
+)
+from geometry.kdtree.scores import get_scores
+
+from .test_dynamic_tree import build_random_records, get_intersecting_ids
+from .tree_utils import build_record
+
+
+def build_candidates(l, m, r, thresholds, lower=0.0, upper=10.0):
+    return SplitCandidates(
+        num_left=np.array(l),
+        num_middle=np.array(m),
+        num_right=np.array(r),
+        thresholds=np.array(thresholds, dtype=float),
+        lower=np.array([lower]),
+        upper=np.array([upper]),
+    )
+
+
+@pytest.mark.kdtree
+@pytest.mark.score
+class TestSplitStrategies:
+    def test_load_gini(self):
+        candidates = build_candidates(
+            l=[1, 3, 5], m=[2, 1, 0], r=[7, 6, 5], thresholds=[1, 4, 5]
+        )
+
+        scores = LoadGiniSplitStrategy(alpha=0.3).get_scores(candidates)
+
+        assert (
+            scores.tolist()
+            == get_scores(
+                l=candidates.num_left,
+                m=candidates.num_middle,
+                r=candidates.num_right,
+                alpha=0.3,
+            ).tolist()
+        )
+
+    def test_median_stops_on_overlapping_records(self):
+        strategy = MedianSplitStrategy()
+        candidates = build_candidates(l=[0], m=[4], r=[0], thresholds=[5])
+
+        score = float(strategy.get_scores(candidates)[0])
+
+        assert not strategy.is_splitting(score)
+
+    def test_median(self):
+        candidates = build_candidates(
+            l=[1, 4, 7], m=[0, 2, 0], r=[9, 4, 3], thresholds=[1, 5, 7]
+        )
+
+        scores = MedianSplitStrategy().get_scores(candidates)
+
+        assert scores.argmax() == 1
+
+    def test_sah_prefers_tight_dense_side(self):
+        candidates = build_candidates(
+            l=[8, 8], m=[0, 0], r=[2, 2], thresholds=[2, 6]
+        )
+
+        scores = SAHSplitStrategy().get_scores(candidates)
+
+        assert scores.argmax() == 0
+        assert all(score > 1 for score in scores)
+
+    def test_sah_stops_on_small_nodes(self):
+        strategy = SAHSplitStrategy(traversal_cost=1.0)
+        candidates = build_candidates(l=[1], m=[0], r=[1], thresholds=[5])
+
+        score = float(strategy.get_scores(candidates)[0])
+
+        assert not strategy.is_splitting(score)
+
+    def test_sah_separates_clusters(self):
+        rs = [
+            build_record(
+                left=offset + i,
+                top=i,
+                right=offset + i + 1,
+                bottom=i + 1,
+                item_id=offset + i,
+            )
+            for offset in [0, 1000]
+            for i in range(20)
+        ]
+
+        tree = KDTree(
+            records=rs,
+            split_strategy=SAHSplitStrategy(),
+        )
+
+        root = tree.root
+        assert isinstance(root, SplitTreeNode)
+        assert 20 <= root.threashold <= 1000
+        assert root.middle is None
+
+
+@pytest.mark.kdtree
+@pytest.mark.tree
+class TestSplitStrategyTrees:
+    @pytest.mark.parametrize(
+        "split_strategy",
+        [
+            LoadGiniSplitStrategy(),
+            MedianSplitStrategy(),
+            SAHSplitStrategy(),
+            SAHSplitStrategy(traversal_cost=8.0),
+        ],
+    )
+    def test_same_intersections(self, split_strategy):
+        rng = random.Random(7)
+        rs = build_random_records(rng, 200)
+
+        expected = get_intersecting_ids(KDTree(records=rs))
+        tree = KDTree(
+            records=rs,
+            split_strategy=split_strategy,
+        )
+        dynamic_tree = DynamicKDTree(
+            records=rs,
+            num_records_stop=4,
+            split_strategy=split_strategy,
+        )
+        dynamic_tree.rebalance()
+
+        assert get_intersecting_ids(tree) == expected
+        assert get_intersecting_ids(dynamic_tree) == expected
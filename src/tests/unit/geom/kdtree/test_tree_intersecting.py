@@ -1,8 +1,12 @@
+import pickle
+from typing import Set
+
+import numpy as np
 import pytest
 
-from geometry import Circle, Point
+from geometry import Circle, Point, get_intersection, get_intersections
 from geometry.kdtree import KDTree
-from geometry.kdtree.node import Record
+from geometry.kdtree.node import IntersactionPair, Record
 
 from .tree_utils import build_record
 
@@ -261,3 +265,173 @@ class TestTree:
 
         intesections = list(tree.generate_colliding_items(collidable_pairs))
         assert len(intesections) == 32
+
+    def test_flat_layout_matches_nodes(self):
+        rs = [
+            build_record(
+                left=i * 7,
+                right=i * 7 + 10,
+                top=j * 7,
+                bottom=j * 7 + 10,
+                item_id=j * 10 + i,
+                class_id=1 + (i + j) % 2,
+            )
+            for i in range(10)
+            for j in range(10)
+        ]
+        collidable_pairs = {(1, 1), (1, 2)}
+
+        tree = KDTree(
+            records=rs,
+            max_depth=4,
+            num_records_stop=8,
+        )
+
+        intersections = list(tree.generate_colliding_items(collidable_pairs))
+        expected = list(tree.root.generate_intersections(collidable_pairs))
+        assert [ids for ids, _ in intersections] == [ids for ids, _ in expected]
+
+        assert tree.ranges[0].tolist() == [0, len(rs)]
+        assert sorted(r.item_id for r in tree.root.generate_items()) == sorted(
+            r.item_id for r in rs
+        )
+
+    def test_records_intersections_matches_nodes(self):
+        rs = [
+            build_record(
+                left=i * 10,
+                right=(i + 1) * 10 - 1,
+                top=j * 10,
+                bottom=(j + 1) * 10 - 1,
+                item_id=j * 10 + i,
+                class_id=2,
+            )
+            for i in range(10)
+            for j in range(10)
+        ]
+        queries = [
+            build_record(
+                left=k * 9,
+                top=k * 7,
+                right=k * 9 + 15,
+                bottom=k * 7 + 25,
+                item_id=-k - 1,
+                class_id=1,
+            )
+            for k in range(10)
+        ]
+        collidable_pairs = {(1, 2)}
+
+        tree = KDTree(
+            records=rs,
+            max_depth=4,
+            num_records_stop=8,
+        )
+
+        intersections = list(
+            tree.generate_records_intersections(queries, collidable_pairs)
+        )
+
+        collided: Set[IntersactionPair] = set()
+        expected = [
+            ids
+            for query in queries
+            for ids, _ in tree.root.generate_record_intersections(
+                record=query,
+                collidable_pairs=collidable_pairs,
+                collided=collided,
+            )
+        ]
+        assert [ids for ids, _ in intersections] == expected
+        assert len(expected) > 0
+
+    def test_pickle(self):
+        rs = [
+            build_record(
+                left=i * 10,
+                right=i * 10 + 15,
+                top=0,
+                bottom=15,
+                item_id=i,
+                class_id=1,
+            )
+            for i in range(20)
+        ]
+        collidable_pairs = {(1, 1)}
+
+        tree = KDTree(
+            records=rs,
+            num_records_stop=4,
+        )
+        tree.root
+
+        restored = pickle.loads(pickle.dumps(tree))
+
+        assert np.array_equal(restored.boxes, tree.boxes)
+        assert [
+            ids
+            for ids, _ in restored.generate_colliding_items(collidable_pairs)
+        ] == [ids for ids, _ in tree.generate_colliding_items(collidable_pairs)]
+
+    def test_item_pair_tested_once(self, monkeypatch):
+        def build_trace(item_id, x, y):
+            return [
+                Record(
+                    item_id=item_id,
+                    class_id=1,
+                    shape=circle,
+                    bounding_box=circle.bounding_box,
+                )
+                for circle in [
+                    Circle(center=Point(x=x + k, y=y), radius=5)
+                    for k in range(4)
+                ]
+            ]
+
+        rs = build_trace(item_id=1, x=0, y=0) + build_trace(item_id=2, x=6, y=0)
+        collidable_pairs = {(1, 1)}
+
+        tested_pairs = []
+
+        def count_intersections(pairs):
+            tested_pairs.extend(pairs)
+            return get_intersections(pairs)
+
+        monkeypatch.setattr(
+            "geometry.kdtree.node.get_intersections", count_intersections
+        )
+
+        tree = KDTree(records=rs)
+        intersections = list(tree.generate_colliding_items(collidable_pairs))
+        assert [ids for ids, _ in intersections] == [(1, 2)]
+        assert len(tested_pairs) == 1
+
+        tested_pairs.clear()
+        expected = list(tree.root.generate_intersections(collidable_pairs))
+        assert [ids for ids, _ in expected] == [(1, 2)]
+        assert len(tested_pairs) == 1
+
+    def test_item_pair_falls_back_to_next_shapes(self):
+        shapes = [
+            Circle(center=Point(x=1, y=1), radius=1),
+            Circle(center=Point(x=10, y=0), radius=2),
+            Circle(center=Point(x=1, y=-1.5), radius=2),
+            Circle(center=Point(x=10, y=10), radius=9),
+        ]
+        rs = [
+            Record(
+                item_id=item_id,
+                class_id=1,
+                shape=shape,
+                bounding_box=shape.bounding_box,
+            )
+            for item_id, shape in zip([1, 1, 2, 3], shapes)
+        ]
+        collidable_pairs = {(1, 1)}
+
+        tree = KDTree(records=rs)
+
+        intersections = list(tree.generate_colliding_items(collidable_pairs))
+        id2point = {tuple(sorted(ids)): point for ids, point in intersections}
+        assert sorted(id2point) == [(1, 2), (1, 3)]
+        assert id2point[(1, 3)] == get_intersection(shapes[1], shapes[3])
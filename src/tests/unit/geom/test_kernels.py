@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from geometry import (
+    Point,
+    Triangle,
+    get_intersection_triangle_triangle,
+    kernels,
+)
+
+
+@pytest.mark.geom
+class TestKernels:
+    def test_python_backend_available(self, geometry_backend):
+        assert kernels.PYTHON_BACKEND in kernels.get_available_backends()
+        assert kernels.get_backend() == geometry_backend
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            kernels.set_backend("unknown")
+
+    def test_backends_match(self):
+        rng = random.Random(11)
+        backends = [
+            kernels.get_available_backends()[0],
+            kernels.get_available_backends()[-1],
+        ]
+
+        def build_triangle():
+            return Triangle(
+                points=[
+                    Point(x=rng.uniform(-10, 10), y=rng.uniform(-10, 10))
+                    for _ in range(3)
+                ]
+            )
+
+        for _ in range(200):
+            a = build_triangle()
+            b = build_triangle()
+
+            results = []
+            for backend in backends:
+                kernels.set_backend(backend)
+                results.append(get_intersection_triangle_triangle(a, b))
+
+            assert results[0] == results[-1]
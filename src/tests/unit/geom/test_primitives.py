@@ -0,0 +1,67 @@
+import pickle
+
+import pytest
+
+from geometry import Point, Rectangle, Triangle, Vec2
+from tests.math_utils import almost_equal_vec
+
+
+@pytest.mark.geom
+class TestPrimitives:
+    def test_inplace_operators(self):
+        v = Vec2(x=1, y=2)
+        alias = v
+
+        v += Vec2(x=1, y=1)
+        v -= Vec2(x=0, y=2)
+        v *= 4
+        v /= 2
+
+        assert v is alias
+        assert almost_equal_vec(v, Vec2(x=4, y=2))
+
+    def test_binary_operators_allocate(self):
+        v = Vec2(x=1, y=2)
+
+        w = v - Vec2(x=1, y=1)
+
+        assert w is not v
+        assert almost_equal_vec(v, Vec2(x=1, y=2))
+        assert almost_equal_vec(w, Vec2(x=0, y=1))
+
+    def test_slots(self):
+        v = Vec2(x=1, y=2)
+        rect = Rectangle(left=0, top=0, width=2, height=2)
+
+        with pytest.raises(AttributeError):
+            setattr(v, "z", 3)
+
+        with pytest.raises(AttributeError):
+            setattr(rect, "area", 4)
+
+        assert pickle.loads(pickle.dumps(v)) == v
+        assert pickle.loads(pickle.dumps(rect)) == rect
+
+    def test_rectangle_move(self):
+        rect = Rectangle(left=0, top=0, width=2, height=4)
+
+        rect.move_ip(Vec2(x=1, y=-1))
+
+        assert rect.to_tuple() == (1, -1, 2, 4)
+        assert almost_equal_vec(rect.center, Point(x=2, y=1))
+
+    def test_triangle_precomputed(self):
+        triangle = Triangle(
+            points=[Point(x=0, y=0), Point(x=3, y=0), Point(x=0, y=3)]
+        )
+
+        assert triangle.coords == (0, 0, 3, 0, 0, 3)
+        assert triangle.segments is triangle.segments
+        assert almost_equal_vec(triangle.center, Point(x=1, y=1))
+        assert triangle.bounding_box.to_tuple() == (0, 0, 3, 3)
+
+        edges = triangle.edges
+        for line, i in zip(triangle.lines, range(0, 12, 4)):
+            assert edges[i : i + 3] == (line.a, line.b, line.c)
+            assert edges[i + 3] == line.place(triangle.center)
+            assert edges[i + 3] != 0
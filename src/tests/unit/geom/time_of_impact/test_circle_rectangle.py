@@ -0,0 +1,61 @@
+import pytest
+
+from geometry import (
+    Circle,
+    Point,
+    Rectangle,
+    Vec2,
+    get_time_of_impact_circle_rectangle,
+)
+from tests.math_utils import almost_equal_float
+
+
+@pytest.mark.geom
+@pytest.mark.toi
+@pytest.mark.circle
+@pytest.mark.rectangle
+class TestTimeOfImpactCircleRectangle:
+    def test_circle_rectangle_side_time_of_impact(self):
+        r = Rectangle(
+            left=10,
+            top=0,
+            width=10,
+            height=10,
+        )
+        c = Circle(
+            center=Point(x=0, y=5),
+            radius=2,
+        )
+
+        toi = get_time_of_impact_circle_rectangle(c, Vec2(x=16, y=0), r)
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        toi = get_time_of_impact_circle_rectangle(c, Vec2(x=7, y=0), r)
+        assert toi is None
+
+        toi = get_time_of_impact_circle_rectangle(c, Vec2(x=0, y=16), r)
+        assert toi is None
+
+    def test_circle_rectangle_corner_time_of_impact(self):
+        r = Rectangle(
+            left=10,
+            top=10,
+            width=10,
+            height=10,
+        )
+        c = Circle(
+            center=Point(x=0, y=0),
+            radius=2**0.5,
+        )
+
+        toi = get_time_of_impact_circle_rectangle(c, Vec2(x=18, y=18), r)
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        c = Circle(
+            center=Point(x=0, y=8.5),
+            radius=1,
+        )
+        toi = get_time_of_impact_circle_rectangle(c, Vec2(x=20, y=0), r)
+        assert toi is None
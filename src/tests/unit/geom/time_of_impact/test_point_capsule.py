@@ -0,0 +1,34 @@
+import pytest
+
+from geometry import Capsule, Point, Vec2, get_time_of_impact_point_capsule
+from tests.math_utils import almost_equal_float
+
+
+@pytest.mark.geom
+@pytest.mark.toi
+@pytest.mark.capsule
+class TestTimeOfImpactPointCapsule:
+    def test_point_capsule_time_of_impact(self):
+        c = Capsule(begin=Point(x=10, y=0), end=Point(x=20, y=0), radius=2)
+
+        toi = get_time_of_impact_point_capsule(
+            Point(x=0, y=0), Vec2(x=16, y=0), c
+        )
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        toi = get_time_of_impact_point_capsule(
+            Point(x=15, y=-6), Vec2(x=0, y=8), c
+        )
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        toi = get_time_of_impact_point_capsule(
+            Point(x=15, y=1), Vec2(x=0, y=8), c
+        )
+        assert toi == 0.0
+
+        toi = get_time_of_impact_point_capsule(
+            Point(x=0, y=5), Vec2(x=30, y=0), c
+        )
+        assert toi is None
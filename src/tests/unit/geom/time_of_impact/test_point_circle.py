@@ -0,0 +1,52 @@
+import pytest
+
+from geometry import Circle, Point, Vec2, get_time_of_impact_point_circle
+from tests.math_utils import almost_equal_float
+
+
+@pytest.mark.geom
+@pytest.mark.toi
+@pytest.mark.circle
+class TestTimeOfImpactPointCircle:
+    def test_point_circle_time_of_impact(self):
+        c = Circle(
+            center=Point(x=10, y=0),
+            radius=5,
+        )
+
+        toi = get_time_of_impact_point_circle(
+            start=Point(x=0, y=0),
+            shift=Vec2(x=10, y=0),
+            circle=c,
+        )
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        toi = get_time_of_impact_point_circle(
+            start=Point(x=0, y=0),
+            shift=Vec2(x=4, y=0),
+            circle=c,
+        )
+        assert toi is None
+
+        toi = get_time_of_impact_point_circle(
+            start=Point(x=0, y=0),
+            shift=Vec2(x=-10, y=0),
+            circle=c,
+        )
+        assert toi is None
+
+        toi = get_time_of_impact_point_circle(
+            start=Point(x=0, y=5),
+            shift=Vec2(x=20, y=0),
+            circle=c,
+        )
+        assert toi is None
+
+        toi = get_time_of_impact_point_circle(
+            start=Point(x=9, y=0),
+            shift=Vec2(x=-10, y=0),
+            circle=c,
+        )
+        assert toi is not None
+        assert almost_equal_float(toi, 0.0)
@@ -0,0 +1,56 @@
+import pytest
+
+from geometry import (
+    Point,
+    Segment,
+    Triangle,
+    Vec2,
+    get_time_of_impact_point_segment,
+    get_time_of_impact_point_triangle,
+)
+from tests.math_utils import almost_equal_float
+
+
+@pytest.mark.geom
+@pytest.mark.toi
+@pytest.mark.triangle
+class TestTimeOfImpactPointTriangle:
+    def test_point_segment_time_of_impact(self):
+        s = Segment(begin=Point(x=10, y=-5), end=Point(x=10, y=5))
+
+        toi = get_time_of_impact_point_segment(
+            Point(x=0, y=0), Vec2(x=20, y=0), s
+        )
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        toi = get_time_of_impact_point_segment(
+            Point(x=0, y=0), Vec2(x=5, y=0), s
+        )
+        assert toi is None
+
+        toi = get_time_of_impact_point_segment(
+            Point(x=0, y=0), Vec2(x=0, y=5), s
+        )
+        assert toi is None
+
+    def test_point_triangle_time_of_impact(self):
+        t = Triangle(
+            points=[Point(x=10, y=0), Point(x=20, y=-10), Point(x=20, y=10)]
+        )
+
+        toi = get_time_of_impact_point_triangle(
+            Point(x=0, y=0), Vec2(x=20, y=0), t
+        )
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        toi = get_time_of_impact_point_triangle(
+            Point(x=15, y=0), Vec2(x=20, y=0), t
+        )
+        assert toi == 0.0
+
+        toi = get_time_of_impact_point_triangle(
+            Point(x=0, y=20), Vec2(x=20, y=0), t
+        )
+        assert toi is None
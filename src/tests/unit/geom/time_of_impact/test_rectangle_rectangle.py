@@ -0,0 +1,43 @@
+import pytest
+
+from geometry import Rectangle, Vec2, get_time_of_impact_rectangle_rectangle
+from tests.math_utils import almost_equal_float
+
+
+@pytest.mark.geom
+@pytest.mark.toi
+@pytest.mark.rectangle
+class TestTimeOfImpactRectangleRectangle:
+    def test_rectangle_rectangle_time_of_impact(self):
+        r1 = Rectangle(
+            left=0,
+            top=0,
+            width=10,
+            height=10,
+        )
+        r2 = Rectangle(
+            left=20,
+            top=5,
+            width=10,
+            height=10,
+        )
+
+        toi = get_time_of_impact_rectangle_rectangle(r1, Vec2(x=20, y=0), r2)
+        assert toi is not None
+        assert almost_equal_float(toi, 0.5)
+
+        toi = get_time_of_impact_rectangle_rectangle(r1, Vec2(x=5, y=0), r2)
+        assert toi is None
+
+        toi = get_time_of_impact_rectangle_rectangle(r1, Vec2(x=20, y=-10), r2)
+        assert toi is None
+
+        r2 = Rectangle(
+            left=5,
+            top=5,
+            width=10,
+            height=10,
+        )
+        toi = get_time_of_impact_rectangle_rectangle(r1, Vec2(x=1, y=1), r2)
+        assert toi is not None
+        assert almost_equal_float(toi, 0.0)
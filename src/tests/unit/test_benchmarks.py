@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from benchmarks.report import compare_reports, create_report
+from benchmarks.scenarios import create_ball_scenarios, create_block_scenarios
+from benchmarks.suite import SuiteConfig, run_suite
+
+
+@pytest.mark.breakout
+class TestBenchmarks:
+    def test_suite_report(self):
+        scenarios = create_ball_scenarios([2]) + create_block_scenarios([1])
+        config = SuiteConfig(engines=["naive", "kdtree"], repeat=1, num_steps=1)
+
+        results = run_suite(scenarios, config)
+        report = json.loads(json.dumps(create_report(results)))
+
+        assert len(results) == 2 * (2 + 2 * 2)
+        assert set(report["results"]) == {result.key for result in results}
+        assert "env_step/balls_2/kdtree" in report["results"]
+
+        comparisons = compare_reports(base=report, head=report)
+
+        assert len(comparisons) == len(results)
+        assert all(
+            comparison.ratio == 1.0
+            for comparison in comparisons
+            if comparison.base > 0
+        )
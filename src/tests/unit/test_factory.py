@@ -0,0 +1,83 @@
+import pytest
+from pydantic import ValidationError
+
+from agym.dtos import BreakoutCollisionEngine, BreakoutLevelType
+from agym.env_components.breakout import factory
+from agym.settings import BreakoutSettings
+from envs.breakout import (
+    BreakoutAction,
+    BreakoutActionType,
+    KDTreeCollisionDetectionEngine,
+)
+from geometry import Vec2
+
+
+def fail_to_create(*args, **kwargs):
+    raise AssertionError("Unused engine was created")
+
+
+@pytest.mark.breakout
+class TestCreateCollisionDetector:
+    def test_creates_only_selected_engine(self, monkeypatch):
+        for name in [
+            "NaiveCollisionDetectionEngine",
+            "IncrementalKDTreeCollisionDetectionEngine",
+            "SpatialHashCollisionDetectionEngine",
+            "SweepAndPruneCollisionDetectionEngine",
+            "BVHCollisionDetectionEngine",
+        ]:
+            monkeypatch.setattr(factory, name, fail_to_create)
+
+        config = BreakoutSettings(
+            collision_engine=BreakoutCollisionEngine.KDTREE,
+        )
+
+        with factory.create_collision_detector(config) as collision_detector:
+            assert isinstance(
+                collision_detector._engine, KDTreeCollisionDetectionEngine
+            )
+
+    def test_close_shuts_query_pool_down(self):
+        config = BreakoutSettings(
+            level_type=BreakoutLevelType.PERFORMANCE,
+            num_balls=20,
+            collision_engine=BreakoutCollisionEngine.KDTREE,
+            kdtree_num_workers=2,
+            kdtree_parallel_min_records=0,
+        )
+
+        with factory.create_collision_detector(config) as collision_detector:
+            env = factory.create_breakout_env(
+                config,
+                collision_detector=collision_detector,
+            )
+            env.reset()
+            env.step(BreakoutAction(type=BreakoutActionType.NOTHING), dt=1.0)
+
+            engine = collision_detector._engine
+            assert isinstance(engine, KDTreeCollisionDetectionEngine)
+
+            query_pool = engine._query_pool
+            assert query_pool is not None
+            assert query_pool._executor is not None
+
+        assert query_pool._executor is None
+        assert query_pool._tree_memory is None
+
+
+@pytest.mark.breakout
+class TestBreakoutSettings:
+    def test_vec2_validation(self):
+        settings = BreakoutSettings(
+            env_size={"x": 100, "y": 50},
+            platform_size=Vec2(x=20, y=5),
+        )
+
+        assert settings.env_size == Vec2(x=100.0, y=50.0)
+        assert settings.platform_size == Vec2(x=20.0, y=5.0)
+        assert BreakoutSettings(block_size=[3, 4]).block_size == Vec2(x=3, y=4)
+
+        assert type(BreakoutSettings().env_size) is Vec2
+
+        with pytest.raises(ValidationError):
+            BreakoutSettings(env_size=[1, 2, 3])
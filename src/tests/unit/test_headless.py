@@ -0,0 +1,52 @@
+import pytest
+
+from agym.env_components.breakout import (
+    RandomBreakoutModel,
+    ScriptedBreakoutModel,
+)
+from agym.headless import format_report, run_headless
+from envs.breakout import BreakoutActionType, BreakoutEnv, BreakoutState
+
+
+@pytest.mark.breakout
+class TestHeadless:
+    def test_scripted_model_cycles(self):
+        model = ScriptedBreakoutModel(
+            action_types=[BreakoutActionType.THROW, BreakoutActionType.LEFT],
+        )
+
+        action_types = [
+            model.get_action(BreakoutState()).type for _ in range(3)
+        ]
+
+        assert action_types == [
+            BreakoutActionType.THROW,
+            BreakoutActionType.LEFT,
+            BreakoutActionType.THROW,
+        ]
+
+    def test_random_model_is_seeded(self):
+        model1 = RandomBreakoutModel(seed=7)
+        model2 = RandomBreakoutModel(seed=7)
+
+        action_types1 = [
+            model1.get_action(BreakoutState()).type for _ in range(20)
+        ]
+        action_types2 = [
+            model2.get_action(BreakoutState()).type for _ in range(20)
+        ]
+
+        assert action_types1 == action_types2
+
+    def test_run_headless(self, breakout: BreakoutEnv):
+        report = run_headless(
+            env=breakout,
+            model=RandomBreakoutModel(seed=0),
+            num_steps=10,
+            dt=1.0,
+        )
+
+        assert report.num_steps == 10
+        assert report.num_resets == 10
+        assert report.steps_per_second > 0
+        assert len(format_report(report)) == 5